@@ -190,8 +190,10 @@ class Connection(AbstractChannel):
                 return queued_method
 
         #
-        # Nothing queued, need to wait for a method from the peer
+        # Nothing queued, need to wait for a method from the peer,
+        # so make sure any batched methods have been sent first.
         #
+        self.method_writer.flush()
         while 1:
             channel, method_sig, args, content = \
                 self.method_reader.read_method()
@@ -281,6 +283,7 @@ class Connection(AbstractChannel):
             return amqp_method(channel, args, content)
 
     def read_timeout(self, timeout=None):
+        self.method_writer.flush()
         if timeout is None:
             return self.method_reader.read_method()
         sock = self.sock
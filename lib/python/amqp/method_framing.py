@@ -17,7 +17,7 @@
 from __future__ import absolute_import
 
 from collections import defaultdict
-from struct import pack, unpack
+from struct import pack, unpack_from
 from Queue import Queue
 
 try:
@@ -56,8 +56,8 @@ class _PartialMessage(object):
         self.complete = False
 
     def add_header(self, payload):
-        class_id, weight, self.body_size = unpack('>HHQ', payload[:12])
-        self.msg._load_properties(payload[12:])
+        class_id, weight, self.body_size = unpack_from('>HHQ', payload)
+        self.msg._load_properties(payload, 12)
         self.complete = (self.body_size == 0)
 
     def add_payload(self, payload):
@@ -134,8 +134,8 @@ class MethodReader(object):
 
     def _process_method_frame(self, channel, payload):
         """Process Method frames"""
-        method_sig = unpack('>HH', payload[:4])
-        args = AMQPReader(payload[4:])
+        method_sig = unpack_from('>HH', payload)
+        args = AMQPReader(payload, 4)
 
         if method_sig in _CONTENT_METHODS:
             #
@@ -192,15 +192,33 @@ class MethodReader(object):
 
 class MethodWriter(object):
     """Convert AMQP methods into AMQP frames and send them out
-    to the peer."""
+    to the peer.
+
+    All the frames making up a method (the method frame, the content
+    header and the body frames) are written to the transport at once.
+
+    Between :meth:`begin_batch` and :meth:`end_batch` content-bearing
+    methods (e.g. ``basic.publish``) are kept in a buffer and written
+    together, so that publishing many messages only needs a few
+    writes.  The buffer is flushed when it exceeds :attr:`max_batch_size`
+    bytes, when any other method is sent (it may expect a reply), and
+    when the connection is waiting for methods from the peer.
+
+    """
+
+    #: Flush batched methods when the buffer exceeds this many bytes.
+    max_batch_size = 131072
 
     def __init__(self, dest, frame_max):
         self.dest = dest
         self.frame_max = frame_max
         self.bytes_sent = 0
+        self.batch_depth = 0
+        self._pending = []
+        self._pending_size = 0
 
     def write_method(self, channel, method_sig, args, content=None):
-        write_frame = self.dest.write_frame
+        frames = []
         payload = pack('>HH', method_sig[0], method_sig[1]) + args
 
         if content:
@@ -216,14 +234,42 @@ class MethodWriter(object):
                 body = body.encode(coding)
             properties = content._serialize_properties()
 
-        write_frame(1, channel, payload)
+        frames.append((1, channel, payload))
 
         if content:
             payload = pack('>HHQ', method_sig[0], 0, len(body)) + properties
 
-            write_frame(2, channel, payload)
+            frames.append((2, channel, payload))
 
             chunk_size = self.frame_max - 8
             for i in xrange(0, len(body), chunk_size):
-                write_frame(3, channel, body[i:i + chunk_size])
+                frames.append((3, channel, body[i:i + chunk_size]))
+
+        if self.batch_depth and content:
+            self._pending.extend(frames)
+            self._pending_size += len(body) + len(frames) * 8
+            if self._pending_size >= self.max_batch_size:
+                self.flush()
+        elif self._pending:
+            self._pending.extend(frames)
+            self.flush()
+        else:
+            self.dest.write_frames(frames)
         self.bytes_sent += 1
+
+    def begin_batch(self):
+        """Start buffering content-bearing methods, can be nested."""
+        self.batch_depth += 1
+
+    def end_batch(self):
+        """End the batch started by :meth:`begin_batch`, and write
+        the buffered methods if this was the outermost batch."""
+        self.batch_depth = max(self.batch_depth - 1, 0)
+        if not self.batch_depth:
+            self.flush()
+
+    def flush(self):
+        """Write all buffered frames to the transport."""
+        if self._pending:
+            frames, self._pending, self._pending_size = self._pending, [], 0
+            self.dest.write_frames(frames)
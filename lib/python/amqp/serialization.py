@@ -25,7 +25,7 @@ import sys
 
 from datetime import datetime
 from decimal import Decimal
-from struct import pack, unpack
+from struct import pack, unpack_from
 from time import mktime
 
 IS_PY3K = sys.version_info[0] >= 3
@@ -52,32 +52,49 @@ except NameError:
 
 
 class AMQPReader(object):
-    """Read higher-level AMQP types from a bytestream."""
-    def __init__(self, source):
+    """Read higher-level AMQP types from a bytestream.
+
+    Values are decoded directly from the source buffer with
+    :func:`struct.unpack_from`, so reading a method's arguments does
+    not need to copy the payload.
+
+    """
+    def __init__(self, source, offset=0):
         """Source should be either a file-like object with a read() method, or
-        a plain (non-unicode) string."""
+        a plain (non-unicode) string.  Reading starts at `offset`."""
         if isinstance(source, bytes):
-            self.input = BytesIO(source)
+            self.buf = source
         elif hasattr(source, 'read'):
-            self.input = source
+            self.buf = source.read()
         else:
             raise ValueError(
                 'AMQPReader needs a file-like object or plain string')
 
+        self.offset = offset
         self.bitcount = self.bits = 0
 
     def close(self):
-        self.input.close()
+        self.buf = bytes()
+        self.offset = 0
+
+    def _unpack(self, fmt, size):
+        self.bitcount = self.bits = 0
+        offset = self.offset
+        self.offset = offset + size
+        return unpack_from(fmt, self.buf, offset)[0]
 
     def read(self, n):
         """Read n bytes."""
         self.bitcount = self.bits = 0
-        return self.input.read(n)
+        offset = self.offset
+        self.offset = offset + n
+        return self.buf[offset:offset + n]
 
     def read_bit(self):
         """Read a single boolean value."""
         if not self.bitcount:
-            self.bits = ord(self.input.read(1))
+            self.bits = unpack_from('B', self.buf, self.offset)[0]
+            self.offset += 1
             self.bitcount = 8
         result = (self.bits & 1) == 1
         self.bits >>= 1
@@ -86,28 +103,23 @@ class AMQPReader(object):
 
     def read_octet(self):
         """Read one byte, return as an integer"""
-        self.bitcount = self.bits = 0
-        return unpack('B', self.input.read(1))[0]
+        return self._unpack('B', 1)
 
     def read_short(self):
         """Read an unsigned 16-bit integer"""
-        self.bitcount = self.bits = 0
-        return unpack('>H', self.input.read(2))[0]
+        return self._unpack('>H', 2)
 
     def read_long(self):
         """Read an unsigned 32-bit integer"""
-        self.bitcount = self.bits = 0
-        return unpack('>I', self.input.read(4))[0]
+        return self._unpack('>I', 4)
 
     def read_longlong(self):
         """Read an unsigned 64-bit integer"""
-        self.bitcount = self.bits = 0
-        return unpack('>Q', self.input.read(8))[0]
+        return self._unpack('>Q', 8)
 
     def read_float(self):
         """Read float value."""
-        self.bitcount = self.bits = 0
-        return unpack('>d', self.input.read(8))[0]
+        return self._unpack('>d', 8)
 
     def read_shortstr(self):
         """Read a short string that's stored in up to 255 bytes.
@@ -116,9 +128,7 @@ class AMQPReader(object):
         assume it's utf-8
 
         """
-        self.bitcount = self.bits = 0
-        slen = unpack('B', self.input.read(1))[0]
-        return self.input.read(slen).decode('utf-8')
+        return self.read(self._unpack('B', 1)).decode('utf-8')
 
     def read_longstr(self):
         """Read a string that's up to 2**32 bytes.
@@ -127,31 +137,27 @@ class AMQPReader(object):
         assume it's utf-8
 
         """
-        self.bitcount = self.bits = 0
-        slen = unpack('>I', self.input.read(4))[0]
-        return self.input.read(slen).decode('utf-8')
+        return self.read(self._unpack('>I', 4)).decode('utf-8')
 
     def read_table(self):
         """Read an AMQP table, and return as a Python dictionary."""
-        self.bitcount = self.bits = 0
-        tlen = unpack('>I', self.input.read(4))[0]
-        table_data = AMQPReader(self.input.read(tlen))
+        end = self._unpack('>I', 4) + self.offset
         result = {}
-        while table_data.input.tell() < tlen:
-            name = table_data.read_shortstr()
-            val = table_data.read_item()
+        while self.offset < end:
+            name = self.read_shortstr()
+            val = self.read_item()
             result[name] = val
         return result
 
     def read_item(self):
-        ftype = ord(self.input.read(1))
+        ftype = self._unpack('B', 1)
         if ftype == 83:  # 'S'
             val = self.read_longstr()
         elif ftype == 73:  # 'I'
-            val = unpack('>i', self.input.read(4))[0]
+            val = self._unpack('>i', 4)
         elif ftype == 68:  # 'D'
             d = self.read_octet()
-            n = unpack('>i', self.input.read(4))[0]
+            n = self._unpack('>i', 4)
             val = Decimal(n) / Decimal(10 ** d)
         elif ftype == 84:  # 'T'
             val = self.read_timestamp()
@@ -170,11 +176,10 @@ class AMQPReader(object):
         return val
 
     def read_array(self):
-        array_length = unpack('>I', self.input.read(4))[0]
-        array_data = AMQPReader(self.input.read(array_length))
+        end = self._unpack('>I', 4) + self.offset
         result = []
-        while array_data.input.tell() < array_length:
-            val = array_data.read_item()
+        while self.offset < end:
+            val = self.read_item()
             result.append(val)
         return result
 
@@ -404,11 +409,13 @@ class GenericContent(object):
 
         raise AttributeError(name)
 
-    def _load_properties(self, raw_bytes):
+    def _load_properties(self, raw_bytes, offset=0):
         """Given the raw bytes containing the property-flags and property-list
         from a content-frame-header, parse and insert into a dictionary
-        stored in this object as an attribute named 'properties'."""
-        r = AMQPReader(raw_bytes)
+        stored in this object as an attribute named 'properties'.
+
+        The property-flags start at `offset` in `raw_bytes`."""
+        r = AMQPReader(raw_bytes, offset)
 
         #
         # Read 16-bit shorts until we get one with a low bit set to zero
@@ -40,7 +40,7 @@ except:
     # Python 2.5 and lower
     bytes = str
 
-from struct import pack, unpack
+from struct import pack, unpack, unpack_from
 
 from .exceptions import AMQPError
 
@@ -49,6 +49,8 @@ AMQP_PORT = 5672
 # Yes, Advanced Message Queuing Protocol Protocol is redundant
 AMQP_PROTOCOL_HEADER = 'AMQP\x01\x01\x00\x09'.encode('latin_1')
 
+FRAME_END = pack('B', 0xce)
+
 # Match things like: [fe80::1]:5432, from RFC 2732
 IPV6_LITERAL = re.compile(r'\[([\.0-9a-f:]+)\](?::(\d+))?')
 
@@ -149,6 +151,15 @@ class _AbstractTransport(object):
             pack('>BHI%dsB' % size, frame_type, channel, size, payload, 0xce),
         )
 
+    def write_frames(self, frames):
+        """Write out a list of ``(frame_type, channel, payload)``
+        frames using a single write."""
+        parts = []
+        for frame_type, channel, payload in frames:
+            parts.extend((pack('>BHI', frame_type, channel, len(payload)),
+                          payload, FRAME_END))
+        self._write(bytes().join(parts))
+
 
 class SSLTransport(_AbstractTransport):
     """Transport that works over SSL"""
@@ -215,24 +226,56 @@ class TCPTransport(_AbstractTransport):
         do our own buffered reads."""
         self._write = self.sock.sendall
         self._read_buffer = bytes()
+        self._read_pos = 0
+
+    def _fill(self, n, initial=False):
+        """Receive until at least n unread bytes are buffered."""
+        available = len(self._read_buffer) - self._read_pos
+        if available >= n:
+            return
+        chunks = [self._read_buffer[self._read_pos:]]
+        try:
+            while available < n:
+                try:
+                    s = self.sock.recv(65536)
+                except socket.error, exc:
+                    if not initial and exc.errno in (errno.EAGAIN,
+                                                     errno.EINTR):
+                        continue
+                    raise
+                if not s:
+                    raise IOError('Socket closed')
+                chunks.append(s)
+                available += len(s)
+        finally:
+            # keep what was received, even if recv timed out.
+            self._read_buffer = bytes().join(chunks)
+            self._read_pos = 0
 
     def _read(self, n, initial=False):
         """Read exactly n bytes from the socket"""
-        while len(self._read_buffer) < n:
-            try:
-                s = self.sock.recv(65536)
-            except socket.error, exc:
-                if not initial and exc.errno in (errno.EAGAIN, errno.EINTR):
-                    continue
-                raise
-            if not s:
-                raise IOError('Socket closed')
-            self._read_buffer += s
-
-        result = self._read_buffer[:n]
-        self._read_buffer = self._read_buffer[n:]
-
-        return result
+        self._fill(n, initial)
+        pos = self._read_pos
+        self._read_pos = pos + n
+        return self._read_buffer[pos:pos + n]
+
+    def read_frame(self, unpack_from=unpack_from):
+        """Read an AMQP frame, decoding the header directly from
+        the receive buffer."""
+        self._fill(7, True)
+        frame_type, channel, size = unpack_from(
+            '>BHI', self._read_buffer, self._read_pos,
+        )
+        self._fill(size + 8)
+        buf, start = self._read_buffer, self._read_pos + 7
+        end = start + size
+        ch = unpack_from('B', buf, end)[0]
+        if ch == 206:  # '\xce'
+            self._read_pos = end + 1
+            return frame_type, channel, buf[start:end]
+        else:
+            raise AMQPError(
+                'Framing Error, received 0x%02x while expecting 0xce' % ch)
 
 
 def create_transport(host, connect_timeout, ssl=False):
@@ -88,6 +88,8 @@ TERMINATE = 2
 
 ACK = 0
 READY = 1
+ACK_READY = 2   # ack coalesced into the ready message
+BATCH = 3       # several result messages sent in one write
 
 #
 # Exit code constants
@@ -233,7 +235,7 @@ def soft_timeout_sighandler(signum, frame):
 
 
 def worker(inqueue, outqueue, initializer=None, initargs=(),
-           maxtasks=None, sentinel=None):
+           maxtasks=None, sentinel=None, ready_batch_size=1):
     # Re-init logging system.
     # Workaround for http://bugs.python.org/issue6721#msg140215
     # Python logging module uses RLock() objects which are broken after
@@ -274,6 +276,35 @@ def worker(inqueue, outqueue, initializer=None, initargs=(),
     if SIG_SOFT_TIMEOUT is not None:
         signal.signal(SIG_SOFT_TIMEOUT, soft_timeout_sighandler)
 
+    def send_result(message):
+        try:
+            put(message)
+        except Exception, exc:
+            state, args = message
+            _, _, tb = sys.exc_info()
+            try:
+                wrapped = MaybeEncodingError(exc, args[-1][1])
+                einfo = ExceptionInfo((MaybeEncodingError, wrapped, tb))
+                put((state, args[:-1] + ((False, einfo), )))
+            finally:
+                del(tb)
+
+    # results of coalesced jobs waiting to be sent as one BATCH message.
+    results = []
+
+    def flush_results():
+        if len(results) == 1:
+            send_result(results[0])
+        else:
+            try:
+                put((BATCH, results[:]))
+            except Exception:
+                # one of the results can't be pickled, so send them
+                # one by one to only fail the job responsible.
+                for message in results:
+                    send_result(message)
+        del results[:]
+
     exitcode = None
     completed = 0
     while maxtasks is None or (maxtasks and completed < maxtasks):
@@ -282,6 +313,10 @@ def worker(inqueue, outqueue, initializer=None, initargs=(),
             exitcode = EX_OK
             break
 
+        if results and not inqueue._reader.poll(0):
+            # don't keep results waiting while blocking for the next job.
+            flush_results()
+
         try:
             ready, task = poll(1.0)
             if not ready:
@@ -296,24 +331,35 @@ def worker(inqueue, outqueue, initializer=None, initargs=(),
             exitcode = EX_OK
             break
 
-        job, i, func, args, kwds = task
-        put((ACK, (job, i, time.time(), pid)))
+        # Tasks sent to dedicated process queues carry an extra flag
+        # telling us if the ack can be sent together with the result.
+        job, i, func, args, kwds = task[:5]
+        coalesce = len(task) > 5 and task[5]
+        if coalesce:
+            time_accepted = time.time()
+        else:
+            if results:
+                # results of earlier jobs must not wait for this one.
+                flush_results()
+            put((ACK, (job, i, time.time(), pid)))
         try:
             result = (True, func(*args, **kwds))
         except Exception:
             result = (False, ExceptionInfo())
-        try:
-            put((READY, (job, i, result)))
-        except Exception, exc:
-            _, _, tb = sys.exc_info()
-            try:
-                wrapped = MaybeEncodingError(exc, result[1])
-                einfo = ExceptionInfo((MaybeEncodingError, wrapped, tb))
-                put((READY, (job, i, (False, einfo))))
-            finally:
-                del(tb)
-
         completed += 1
+
+        if not coalesce:
+            send_result((READY, (job, i, result)))
+            continue
+        results.append((ACK_READY, (job, i, time_accepted, pid, result)))
+        if len(results) >= ready_batch_size or not inqueue._reader.poll(0):
+            flush_results()
+
+    if results:
+        try:
+            flush_results()
+        except (IOError, EOFError):
+            pass
     debug('worker exiting after %d tasks', completed)
     if exitcode is None and maxtasks:
         exitcode = EX_RECYCLE if completed == maxtasks else EX_FAILURE
@@ -404,11 +450,12 @@ class Supervisor(PoolThread):
 
 class TaskHandler(PoolThread):
 
-    def __init__(self, taskqueue, put, outqueue, pool):
+    def __init__(self, taskqueue, put, outqueue, pool, on_terminate=None):
         self.taskqueue = taskqueue
         self.put = put
         self.outqueue = outqueue
         self.pool = pool
+        self.on_terminate = on_terminate
         super(TaskHandler, self).__init__()
 
     def body(self):
@@ -460,6 +507,12 @@ class TaskHandler(PoolThread):
 
         debug('task handler exiting')
 
+    def terminate(self):
+        super(TaskHandler, self).terminate()
+        if self.on_terminate is not None:
+            # wake up put if it's waiting for a free process.
+            self.on_terminate()
+
     def on_stop_not_started(self):
         self.tell_others()
 
@@ -588,7 +641,8 @@ class TimeoutHandler(PoolThread):
 class ResultHandler(PoolThread):
 
     def __init__(self, outqueue, get, cache, poll,
-                 join_exited_workers, putlock, restart_state, check_timeouts):
+                 join_exited_workers, putlock, restart_state, check_timeouts,
+                 on_job_ready=None):
         self.outqueue = outqueue
         self.get = get
         self.cache = cache
@@ -599,17 +653,18 @@ class ResultHandler(PoolThread):
         self._it = None
         self._shutdown_complete = False
         self.check_timeouts = check_timeouts
+        self.on_job_ready = on_job_ready
         super(ResultHandler, self).__init__()
 
     def on_stop_not_started(self):
         # used when pool started without result handler thread.
         self.finish_at_shutdown(handle_timeouts=True)
 
-    def _process_result(self, timeout=1.0):
+    def _make_state_change_handler(self):
         cache = self.cache
-        poll = self.poll
         putlock = self.putlock
         restart_state = self.restart_state
+        on_job_ready = self.on_job_ready
 
         def on_ack(job, i, time_accepted, pid):
             try:
@@ -620,6 +675,8 @@ class ResultHandler(PoolThread):
 
         def on_ready(job, i, obj):
             restart_state.R = 0
+            if on_job_ready is not None:
+                on_job_ready(job, i)
             try:
                 item = cache[job]
             except KeyError:
@@ -632,14 +689,33 @@ class ResultHandler(PoolThread):
             except KeyError:
                 pass
 
-        state_handlers = {ACK: on_ack, READY: on_ready}
+        def on_ack_ready(job, i, time_accepted, pid, obj):
+            on_ack(job, i, time_accepted, pid)
+            on_ready(job, i, obj)
+
+        def on_batch(messages):
+            for message in messages:
+                on_state_change(message)
+
+        state_handlers = {ACK: on_ack, READY: on_ready,
+                          ACK_READY: on_ack_ready, BATCH: on_batch}
 
         def on_state_change(task):
             state, args = task
             try:
-                state_handlers[state](*args)
+                handler = state_handlers[state]
             except KeyError:
                 debug("Unknown job state: %s (args=%s)", state, args)
+            else:
+                if state == BATCH:
+                    handler(args)
+                else:
+                    handler(*args)
+        return on_state_change
+
+    def _process_result(self, timeout=1.0):
+        poll = self.poll
+        on_state_change = self._make_state_change_handler()
 
         while 1:
             try:
@@ -693,39 +769,8 @@ class ResultHandler(PoolThread):
         cache = self.cache
         poll = self.poll
         join_exited_workers = self.join_exited_workers
-        putlock = self.putlock
-        restart_state = self.restart_state
         check_timeouts = self.check_timeouts
-
-        def on_ack(job, i, time_accepted, pid):
-            try:
-                cache[job]._ack(i, time_accepted, pid)
-            except (KeyError, AttributeError):
-                # Object gone or doesn't support _ack (e.g. IMAPIterator).
-                pass
-
-        def on_ready(job, i, obj):
-            restart_state.R = 0
-            try:
-                item = cache[job]
-            except KeyError:
-                return
-            if not item.ready():
-                if putlock is not None:
-                    putlock.release()
-            try:
-                item._set(i, obj)
-            except KeyError:
-                pass
-
-        state_handlers = {ACK: on_ack, READY: on_ready}
-
-        def on_state_change(task):
-            state, args = task
-            try:
-                state_handlers[state](*args)
-            except KeyError:
-                debug("Unknown job state: %s (args=%s)", state, args)
+        on_state_change = self._make_state_change_handler()
 
         time_terminate = None
         while cache and self._state != TERMINATE:
@@ -777,6 +822,20 @@ class ResultHandler(PoolThread):
 class Pool(object):
     '''
     Class which supports an async version of applying functions to arguments.
+
+    With ``per_process_queues`` enabled every child process reads from
+    its own pipe, and the parent assigns jobs to the least busy child
+    instead of having all children compete for a lock on a shared queue.
+    This also enables two options reducing the number of result messages:
+
+    * ``coalesce_acks``: jobs without a soft/hard time limit send their
+      ack together with the result, so accept callbacks for those jobs
+      are called when the result arrives.
+
+    * ``ready_batch_size``: each child can be assigned up to this many jobs
+      at a time, and will buffer the results of coalesced jobs until its
+      queue is empty or the batch is full, sending them in one write.
+
     '''
     Process = Process
     Supervisor = Supervisor
@@ -796,7 +855,24 @@ class Pool(object):
                  threads=True,
                  semaphore=None,
                  putlocks=False,
-                 allow_restart=False):
+                 allow_restart=False,
+                 per_process_queues=False,
+                 coalesce_acks=False,
+                 ready_batch_size=1):
+        if (coalesce_acks or ready_batch_size > 1) and not per_process_queues:
+            raise ValueError(
+                'coalesce_acks and ready_batch_size requires '
+                'per_process_queues')
+        if ready_batch_size > 1 and not coalesce_acks:
+            raise ValueError('ready_batch_size requires coalesce_acks')
+        self.per_process_queues = per_process_queues
+        self.coalesce_acks = coalesce_acks
+        self.ready_batch_size = ready_batch_size
+        # (job, i) -> process, for jobs sent to a dedicated process queue.
+        self._assigned = {}
+        # jobs waiting for a free process when running without threads.
+        self._pending = collections.deque()
+        self._dispatch_cond = threading.Condition(threading.Lock())
         self._setup_queues()
         self._taskqueue = Queue.Queue()
         self._cache = {}
@@ -852,10 +928,10 @@ class Pool(object):
                 dict((w._popen.sentinel, self.maintain_pool)
                      for w in self._pool))
 
-        self._task_handler = self.TaskHandler(self._taskqueue,
-                                              self._quick_put,
-                                              self._outqueue,
-                                              self._pool)
+        self._task_handler = self.TaskHandler(
+            self._taskqueue, self._quick_put, self._outqueue, self._pool,
+            on_terminate=self._on_process_free if per_process_queues else None,
+        )
         if threads:
             self._task_handler.start()
 
@@ -880,6 +956,7 @@ class Pool(object):
             self._outqueue, self._quick_get, self._cache,
             self._poll_result, self._join_exited_workers,
             self._putlock, self.restart_state, check_timeouts,
+            on_job_ready=self._on_job_ready if per_process_queues else None,
         )
 
         if threads:
@@ -899,15 +976,24 @@ class Pool(object):
 
     def _create_worker_process(self, i):
         sentinel = Event() if self.allow_restart else None
+        inqueue = self._inqueue
+        if self.per_process_queues:
+            inqueue = self._make_process_queue()
         w = self.Process(
             target=worker,
             args=(
-                self._inqueue, self._outqueue,
+                inqueue, self._outqueue,
                 self._initializer, self._initargs,
                 self._maxtasksperchild,
-                sentinel
+                sentinel,
+                self.ready_batch_size,
             ),
         )
+        if self.per_process_queues:
+            w.inqueue = inqueue
+            w.outstanding = 0   # jobs sent but not yet ready
+            w.dispatched = 0    # total number of jobs sent
+            w.stopping = False  # sentinel sent
         self._pool.append(w)
         w.name = w.name.replace('Process', 'PoolWorker')
         w.daemon = True
@@ -916,8 +1002,129 @@ class Pool(object):
         if self.on_process_up:
             self.on_process_up(w)
         self._poolctrl[w.pid] = sentinel
+        if self.per_process_queues:
+            self._on_process_free()
         return w
 
+    def _make_process_queue(self):
+        from billiard.queues import SimpleQueue
+        return SimpleQueue()
+
+    def _free_process(self):
+        """Return the process with the least outstanding jobs that
+        can still accept a job, or :const:`None` if all are busy."""
+        maxtasks = self._maxtasksperchild
+        free = None
+        for w in self._pool:
+            if w.stopping or w.outstanding >= self.ready_batch_size:
+                continue
+            # never send a process more jobs than it will execute
+            # before exiting.
+            if maxtasks and w.dispatched >= maxtasks:
+                continue
+            if free is None or w.outstanding < free.outstanding:
+                free = w
+                if not w.outstanding:
+                    break
+        return free
+
+    def _assign(self, w, task):
+        job, i = task[0], task[1]
+        self._assigned[(job, i)] = w
+        w.outstanding += 1
+        w.dispatched += 1
+        if self.coalesce_acks:
+            return task + (self._can_coalesce(job), )
+        return task + (False, )
+
+    def _can_coalesce(self, job):
+        # the ack is needed to enforce time limits, as that is when
+        # the time limit starts counting.
+        if self.timeout or self.soft_timeout:
+            return False
+        job = self._cache.get(job)
+        return not (getattr(job, '_timeout', None) or
+                    getattr(job, '_soft_timeout', None))
+
+    def _put_job(self, task):
+        """Send task to the queue of a free process.
+
+        In threaded mode this blocks until a process is free (called by
+        the task handler), otherwise the task is buffered until
+        a process finishes a job (see :meth:`_on_job_ready`).
+
+        """
+        if not self.threads:
+            self._pending.append(task)
+            return self._dispatch_pending()
+        if task is None:
+            return self._put_sentinel()
+        with self._dispatch_cond:
+            while 1:
+                if self._task_handler._state == TERMINATE:
+                    raise IOError('pool terminated')
+                w = self._free_process()
+                if w is not None:
+                    break
+                # no timeout, as waiting with a timeout polls.
+                self._dispatch_cond.wait()
+            task = self._assign(w, task)
+        w.inqueue.put(task)
+
+    def _put_sentinel(self):
+        # the sentinel is sent to one process that has not got one yet,
+        # so that the task handler can still send one per process.
+        with self._dispatch_cond:
+            for w in self._pool:
+                if not w.stopping:
+                    w.stopping = True
+                    break
+            else:
+                return
+        w.inqueue.put(None)
+
+    def _dispatch_pending(self):
+        pending = self._pending
+        while pending:
+            if pending[0] is None:
+                pending.popleft()
+                self._put_sentinel()
+                continue
+            with self._dispatch_cond:
+                w = self._free_process()
+                if w is None:
+                    return
+                task = self._assign(w, pending.popleft())
+            w.inqueue.put(task)
+
+    def _on_process_free(self):
+        if self.threads:
+            with self._dispatch_cond:
+                self._dispatch_cond.notify_all()
+        else:
+            self._dispatch_pending()
+
+    def _on_job_ready(self, job, i):
+        with self._dispatch_cond:
+            w = self._assigned.pop((job, i), None)
+            if w is not None:
+                w.outstanding -= 1
+        if w is not None:
+            self._on_process_free()
+
+    def _forget_assigned(self, cleaned, exitcodes):
+        # jobs sent to a process that exited may not have been acked
+        # yet, so these are not found by their worker pids.
+        now = time.time()
+        with self._dispatch_cond:
+            for key, w in self._assigned.items():
+                if w.pid in cleaned:
+                    del self._assigned[key]
+                    job = self._cache.get(key[0])
+                    if job is not None and not job.ready() and \
+                            not job._worker_lost:
+                        job._worker_lost = (now, exitcodes[w.pid])
+
     def _join_exited_workers(self, shutdown=False):
         """Cleanup after any worker processes which have exited due to
         reaching their specified lifetime. Returns True if any workers were
@@ -962,6 +1169,8 @@ class Pool(object):
                 del self._pool[i]
                 del self._poolctrl[worker.pid]
         if cleaned:
+            if self.per_process_queues:
+                self._forget_assigned(cleaned, exitcodes)
             for job in self._cache.values():
                 for worker_pid in job.worker_pids():
                     if worker_pid in cleaned and not job.ready():
@@ -1012,6 +1221,8 @@ class Pool(object):
         raise StopIteration()
 
     def _worker_active(self, worker):
+        if self.per_process_queues and worker.outstanding:
+            return True
         for job in self._cache.values():
             if worker.pid in job.worker_pids():
                 return True
@@ -1059,6 +1270,8 @@ class Pool(object):
         self._inqueue = SimpleQueue()
         self._outqueue = SimpleQueue()
         self._quick_put = self._inqueue._writer.send
+        if self.per_process_queues:
+            self._quick_put = self._put_job
         self._quick_get = self._outqueue._reader.recv
 
         def _poll_result(timeout):
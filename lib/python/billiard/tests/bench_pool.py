@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""Measures no-op task throughput of :class:`billiard.pool.Pool`.
+
+Compares the shared input queue with dedicated per process queues
+(with and without coalesced acks and batched results) for an
+increasing number of processes::
+
+    $ python -m billiard.tests.bench_pool [n_tasks] [max_processes]
+
+"""
+from __future__ import absolute_import
+
+import sys
+import time
+
+from billiard.pool import Pool
+
+MODES = [
+    ('shared queue', {}),
+    ('per process queues', {'per_process_queues': True}),
+    ('+ coalesced acks', {'per_process_queues': True,
+                          'coalesce_acks': True}),
+    ('+ ready batches of 16', {'per_process_queues': True,
+                               'coalesce_acks': True,
+                               'ready_batch_size': 16}),
+]
+
+
+def noop(*args, **kwargs):
+    pass
+
+
+def bench(processes, n, **options):
+    pool = Pool(processes, **options)
+    try:
+        # warm up, so that all processes are started.
+        pool.map(noop, range(processes * 10), chunksize=1)
+        start = time.time()
+        results = [pool.apply_async(noop) for i in xrange(n)]
+        for result in results:
+            result.get()
+        return n / (time.time() - start)
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def main(argv=sys.argv):
+    n = int(argv[1]) if len(argv) > 1 else 20000
+    max_processes = int(argv[2]) if len(argv) > 2 else 8
+    processes = 1
+    print('%-24s %10s %14s' % ('mode', 'processes', 'tasks/s'))
+    while processes <= max_processes:
+        for name, options in MODES:
+            print('%-24s %10d %14.1f' % (
+                name, processes, bench(processes, n, **options)))
+        processes *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+from __future__ import absolute_import
+
+import os
+import unittest
+
+from billiard.exceptions import WorkerLostError
+from billiard.pool import Pool, MaybeEncodingError
+
+
+def identity(x):
+    return x
+
+
+def unpicklable(x):
+    return lambda: x
+
+
+def exit_process(x):
+    os._exit(x)
+
+
+class test_per_process_queues(unittest.TestCase):
+    options = {'per_process_queues': True}
+
+    def setUp(self):
+        self.pool = Pool(3, lost_worker_timeout=0.5, **self.options)
+
+    def tearDown(self):
+        self.pool.terminate()
+        self.pool.join()
+
+    def test_apply_async(self):
+        results = [self.pool.apply_async(identity, (i, ))
+                   for i in range(200)]
+        self.assertEqual([r.get(10) for r in results], range(200))
+        self.assertFalse(self.pool._assigned)
+
+    def test_map(self):
+        self.assertEqual(self.pool.map(identity, range(100), chunksize=1),
+                         range(100))
+        self.assertEqual(self.pool.map(identity, range(100), chunksize=10),
+                         range(100))
+
+    def test_imap(self):
+        self.assertEqual(list(self.pool.imap(identity, range(50))),
+                         range(50))
+
+    def test_time_limited_job(self):
+        result = self.pool.apply_async(identity, (1, ), timeout=10)
+        self.assertEqual(result.get(10), 1)
+
+    def test_unpicklable_result(self):
+        result = self.pool.apply_async(unpicklable, (1, ))
+        with self.assertRaises(MaybeEncodingError):
+            result.get(10)
+
+    def test_worker_lost(self):
+        result = self.pool.apply_async(exit_process, (3, ))
+        with self.assertRaises(WorkerLostError):
+            result.get(10)
+        self.assertEqual(self.pool.apply_async(identity, (1, )).get(10), 1)
+
+
+class test_coalesced_acks(test_per_process_queues):
+    options = {'per_process_queues': True, 'coalesce_acks': True}
+
+    def test_accept_callback(self):
+        accepted = []
+        result = self.pool.apply_async(
+            identity, (1, ),
+            accept_callback=lambda pid, time: accepted.append(pid),
+        )
+        self.assertEqual(result.get(10), 1)
+        self.assertTrue(accepted)
+
+
+class test_ready_batches(test_coalesced_acks):
+    options = {'per_process_queues': True, 'coalesce_acks': True,
+               'ready_batch_size': 8}
+
+
+class test_maxtasksperchild(unittest.TestCase):
+
+    def test_jobs_not_lost_when_recycled(self):
+        pool = Pool(2, maxtasksperchild=3, per_process_queues=True,
+                    coalesce_acks=True, ready_batch_size=4)
+        try:
+            self.assertEqual(pool.map(identity, range(50), chunksize=1),
+                             range(50))
+        finally:
+            pool.terminate()
+            pool.join()
+
+
+class test_mixed_jobs(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = Pool(1, per_process_queues=True, coalesce_acks=True,
+                         ready_batch_size=4)
+
+    def tearDown(self):
+        self.pool.terminate()
+        self.pool.join()
+
+    def test_coalesced_result_sent_before_time_limited_job(self):
+        first = self.pool.apply_async(identity, (1, ))
+        second = self.pool.apply_async(identity, (2, ), timeout=10)
+        self.assertEqual(second.get(10), 2)
+        self.assertEqual(first.get(3), 1)
+
+
+class test_options(unittest.TestCase):
+
+    def test_coalesce_requires_per_process_queues(self):
+        with self.assertRaises(ValueError):
+            Pool(1, coalesce_acks=True)
+
+    def test_batch_requires_coalesce(self):
+        with self.assertRaises(ValueError):
+            Pool(1, per_process_queues=True, ready_batch_size=4)
@@ -7,6 +7,7 @@
 
 """
 from __future__ import absolute_import
+from __future__ import with_statement
 
 from datetime import timedelta
 from weakref import WeakValueDictionary
@@ -169,6 +170,11 @@ class TaskProducer(Producer):
     utc = True
     event_dispatcher = None
     send_sent_event = False
+    aggregate_sent_event = False
+
+    #: Set while :meth:`publish_tasks` is sending a batch.
+    _batch_declared = None
+    _batch_events = None
 
     def __init__(self, channel=None, exchange=None, *args, **kwargs):
         self.retry = kwargs.pop('retry', self.retry)
@@ -176,6 +182,8 @@ class TaskProducer(Producer):
                                        self.retry_policy or {})
         self.send_sent_event = kwargs.pop('send_sent_event',
                                           self.send_sent_event)
+        self.aggregate_sent_event = kwargs.pop('aggregate_sent_event',
+                                               self.aggregate_sent_event)
         exchange = exchange or self.exchange
         self.queues = self.app.amqp.queues  # shortcut
         self.default_queue = self.app.amqp.default_queue
@@ -203,6 +211,12 @@ class TaskProducer(Producer):
             exchange = exchange or queue.exchange.name
             routing_key = routing_key or queue.routing_key
         declare = declare or ([queue] if queue else [])
+        declared = self._batch_declared
+        if declared is not None:
+            # only declare entities once for every batch.
+            declare = [entity for entity in declare
+                       if id(entity) not in declared]
+            declared.update(id(entity) for entity in declare)
 
         # merge default and custom policy
         retry = self.retry if retry is None else retry
@@ -251,29 +265,78 @@ class TaskProducer(Producer):
 
         signals.task_sent.send(sender=task_name, **body)
         if self.send_sent_event:
-            evd = event_dispatcher or self.event_dispatcher
             exname = exchange or self.exchange
             if isinstance(exname, Exchange):
                 exname = exname.name
-            evd.publish(
-                'task-sent',
-                {
-                    'uuid': task_id,
-                    'name': task_name,
-                    'args': safe_repr(task_args),
-                    'kwargs': safe_repr(task_kwargs),
-                    'retries': retries,
-                    'eta': eta,
-                    'expires': expires,
-                    'queue': qname,
-                    'exchange': exname,
-                    'routing_key': routing_key,
-                },
-                self, retry=retry, retry_policy=retry_policy,
-            )
+            fields = {
+                'uuid': task_id,
+                'name': task_name,
+                'args': safe_repr(task_args),
+                'kwargs': safe_repr(task_kwargs),
+                'retries': retries,
+                'eta': eta,
+                'expires': expires,
+                'queue': qname,
+                'exchange': exname,
+                'routing_key': routing_key,
+            }
+            if self._batch_events is not None:
+                self._batch_events.append(fields)
+            else:
+                evd = event_dispatcher or self.event_dispatcher
+                evd.publish('task-sent', fields, self,
+                            retry=retry, retry_policy=retry_policy)
         return task_id
     delay_task = publish_task   # XXX Compat
 
+    def publish_tasks(self, tasks, event_dispatcher=None,
+                      aggregate_sent_event=None, **options):
+        """Send many task messages at once.
+
+        :param tasks: Iterable of ``(task_name, args, kwargs, options)``
+            tuples, where options are the keyword arguments supported
+            by :meth:`publish_task`.
+        :keyword aggregate_sent_event: If sent events are enabled, send
+            a single ``tasks-sent`` event for the whole batch instead
+            of one ``task-sent`` event per task.  Default is taken from
+            the :setting:`CELERY_AGGREGATE_TASK_SENT_EVENTS` setting.
+
+        Any additional keyword arguments are used as default options
+        for all of the tasks.
+
+        Queues are only declared once, and the messages may be buffered
+        and sent to the broker together if the transport supports it
+        (see :meth:`~kombu.Producer.publish_batch`).
+
+        Returns the list of task ids.
+
+        """
+        if aggregate_sent_event is None:
+            aggregate_sent_event = self.aggregate_sent_event
+        aggregate = self.send_sent_event and aggregate_sent_event
+        publish_task = self.publish_task
+        task_ids = []
+        self._batch_declared = set()
+        if aggregate:
+            self._batch_events = []
+        try:
+            with self.publish_batch():
+                for task_name, args, kwargs, opts in tasks:
+                    if options:
+                        opts = dict(options, **opts)
+                    task_ids.append(publish_task(task_name, args, kwargs,
+                                                 **opts))
+            events = self._batch_events
+        finally:
+            self._batch_declared = self._batch_events = None
+        if aggregate and events:
+            evd = event_dispatcher or self.event_dispatcher
+            retry = options.get('retry')
+            evd.publish('tasks-sent', {'tasks': events}, self,
+                        retry=self.retry if retry is None else retry,
+                        retry_policy=options.get('retry_policy'))
+        return task_ids
+
     @cached_property
     def event_dispatcher(self):
         # We call Dispatcher.publish with a custom producer
@@ -374,6 +437,7 @@ class AMQP(object):
             retry=conf.CELERY_TASK_PUBLISH_RETRY,
             retry_policy=conf.CELERY_TASK_PUBLISH_RETRY_POLICY,
             send_sent_event=conf.CELERY_SEND_TASK_SENT_EVENT,
+            aggregate_sent_event=conf.CELERY_AGGREGATE_TASK_SENT_EVENTS,
             utc=conf.CELERY_ENABLE_UTC,
         )
     TaskPublisher = TaskProducer  # compat
@@ -151,8 +151,10 @@ def add_chunk_task(app):
 @shared_task
 def add_group_task(app):
     _app = app
+    from celery.app.task import Task as BaseTask
     from celery.canvas import maybe_subtask, subtask
     from celery.result import from_serializable
+    default_apply_async = BaseTask.apply_async.im_func
 
     class Group(app.Task):
         app = _app
@@ -171,13 +173,36 @@ def add_group_task(app):
                     [task.apply(group_id=group_id) for task in taskit],
                 )
             with app.producer_or_acquire() as pub:
-                [task.apply_async(group_id=group_id, publisher=pub,
-                                  add_to_parent=False) for task in taskit]
+                self._publish_members(pub, taskit, group_id)
             parent = get_current_worker_task()
             if parent:
                 parent.request.children.append(result)
             return result
 
+        def _publish_members(self, producer, tasks, group_id):
+            # Members using the default apply_async are sent in bulk,
+            # others (e.g. chains in a group) are applied one by one.
+            messages = []
+            with producer.publish_batch():
+                for task in tasks:
+                    try:
+                        T = task.type
+                    except KeyError:  # task not registered
+                        T = None
+                    if T is None or \
+                            T.apply_async.im_func is not default_apply_async:
+                        task.apply_async(group_id=group_id, publisher=producer,
+                                         add_to_parent=False)
+                        continue
+                    args, kwargs, options = task._merge(
+                        options={'group_id': group_id},
+                    )
+                    if T.__self__ is not None:
+                        args = (T.__self__, ) + tuple(args)
+                    messages.append(
+                        T._prepare_message(args, kwargs, **options))
+                producer.publish_tasks(messages)
+
         def prepare(self, options, tasks, args, **kwargs):
             AsyncResult = self.AsyncResult
             options['group_id'] = group_id = (
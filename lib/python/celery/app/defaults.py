@@ -91,6 +91,7 @@ NAMESPACES = {
     },
     'CELERY': {
         'ACKS_LATE': Option(False, type='bool'),
+        'AGGREGATE_TASK_SENT_EVENTS': Option(False, type='bool'),
         'ALWAYS_EAGER': Option(False, type='bool'),
         'AMQP_TASK_RESULT_EXPIRES': Option(
             type='float', deprecate_by='2.5', remove_by='4.0',
@@ -166,6 +167,8 @@ NAMESPACES = {
     },
     'CELERYD': {
         'AUTOSCALER': Option('celery.worker.autoscale.Autoscaler'),
+        'AUTOSCALE_POLICY': Option('reserved'),
+        'AUTOSCALE_TARGET_LATENCY': Option(10.0, type='float'),
         'AUTORELOADER': Option('celery.worker.autoreload.Autoreloader'),
         'BOOT_STEPS': Option((), type='tuple'),
         'CONCURRENCY': Option(0, type='int'),
@@ -174,6 +177,9 @@ NAMESPACES = {
         'FORCE_EXECV': Option(False, type='bool'),
         'HIJACK_ROOT_LOGGER': Option(True, type='bool'),
         'CONSUMER': Option(type='string'),
+        'ETA_DELAY_STORE': Option(type='string'),
+        'ETA_DELAY_THRESHOLD': Option(3600.0, type='float'),
+        'ETA_DELAY_INTERVAL': Option(10.0, type='float'),
         'LOG_FORMAT': Option(DEFAULT_PROCESS_LOG_FMT),
         'LOG_COLOR': Option(type='bool'),
         'LOG_LEVEL': Option('WARN', deprecate_by='2.4', remove_by='4.0',
@@ -197,6 +203,7 @@ NAMESPACES = {
         'SCHEDULER': Option('celery.beat.PersistentScheduler'),
         'SCHEDULE_FILENAME': Option('celerybeat-schedule'),
         'MAX_LOOP_INTERVAL': Option(0, type='float'),
+        'USE_HEAP': Option(False, type='bool'),
         'LOG_LEVEL': Option('INFO', deprecate_by='2.4', remove_by='4.0',
                             alt='--loglevel argument'),
         'LOG_FILE': Option(deprecate_by='2.4', remove_by='4.0',
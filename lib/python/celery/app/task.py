@@ -450,7 +450,6 @@ class Task(object):
         """
         producer = producer or publisher
         app = self._get_app()
-        router = router or self.app.amqp.router
         conf = app.conf
 
         # add 'self' if this is a bound method.
@@ -459,17 +458,14 @@ class Task(object):
 
         if conf.CELERY_ALWAYS_EAGER:
             return self.apply(args, kwargs, task_id=task_id, **options)
-        options = dict(extract_exec_options(self), **options)
-        options = router.route(options, self.name, args, kwargs)
+        name, args, kwargs, options = self._prepare_message(
+            args, kwargs, task_id, router, link, link_error, **options
+        )
 
         if connection:
             producer = app.amqp.TaskProducer(connection)
         with app.producer_or_acquire(producer) as P:
-            task_id = P.publish_task(self.name, args, kwargs,
-                                     task_id=task_id,
-                                     callbacks=maybe_list(link),
-                                     errbacks=maybe_list(link_error),
-                                     **options)
+            task_id = P.publish_task(name, args, kwargs, **options)
         result = self.AsyncResult(task_id)
         if add_to_parent:
             parent = get_current_worker_task()
@@ -477,6 +473,20 @@ class Task(object):
                 parent.request.children.append(result)
         return result
 
+    def _prepare_message(self, args=None, kwargs=None, task_id=None,
+                         router=None, link=None, link_error=None,
+                         **options):
+        # Returns the ``(name, args, kwargs, options)`` that
+        # :meth:`apply_async` passes on to the producer, also used by
+        # :meth:`~@amqp.TaskProducer.publish_tasks` to send tasks in bulk.
+        router = router or self.app.amqp.router
+        options = dict(extract_exec_options(self), **options)
+        options = router.route(options, self.name, args, kwargs)
+        options.update(task_id=task_id,
+                       callbacks=maybe_list(link),
+                       errbacks=maybe_list(link_error))
+        return self.name, args, kwargs, options
+
     def subtask_from_request(self, request=None, args=None, kwargs=None,
                              **extra_options):
 
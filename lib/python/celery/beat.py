@@ -10,12 +10,15 @@ from __future__ import absolute_import
 from __future__ import with_statement
 
 import errno
+import heapq
 import os
 import time
 import shelve
 import sys
 import traceback
 
+from itertools import count
+
 from billiard import Process, ensure_multiprocessing
 from kombu.utils import cached_property, reprcall
 from kombu.utils.functional import maybe_promise
@@ -147,17 +150,31 @@ class Scheduler(object):
     #: How often to sync the schedule (3 minutes by default)
     sync_every = 3 * 60
 
+    #: Keep the entries in a heap ordered by the time they are due next,
+    #: so that a tick only has to check the entries that are due
+    #: instead of every entry in the schedule.
+    use_heap = False
+
     _last_sync = None
 
+    #: heap of ``(time, seq, name)`` used when :attr:`use_heap` is set.
+    _heap = None
+    _heap_schedule = None
+    _heap_size = 0
+
     logger = logger  # compat
 
     def __init__(self, schedule=None, max_interval=None,
-                 app=None, Publisher=None, lazy=False, **kwargs):
+                 app=None, Publisher=None, lazy=False, use_heap=None,
+                 **kwargs):
         app = self.app = app_or_default(app)
         self.data = maybe_promise({} if schedule is None else schedule)
         self.max_interval = (max_interval
                              or app.conf.CELERYBEAT_MAX_LOOP_INTERVAL
                              or self.max_interval)
+        self.use_heap = (use_heap or app.conf.CELERYBEAT_USE_HEAP
+                         or self.use_heap)
+        self._heap_seq = count(0)
         self.Publisher = Publisher or app.amqp.TaskProducer
         if not lazy:
             self.setup_schedule()
@@ -192,6 +209,8 @@ class Scheduler(object):
         Executes all due tasks.
 
         """
+        if self.use_heap:
+            return self._tick_heap()
         remaining_times = []
         try:
             for entry in self.schedule.itervalues():
@@ -203,6 +222,48 @@ class Scheduler(object):
 
         return min(remaining_times + [self.max_interval])
 
+    def _tick_heap(self, heappop=heapq.heappop, heappush=heapq.heappush):
+        schedule = self.schedule
+        if (self._heap is None or schedule is not self._heap_schedule or
+                len(schedule) != self._heap_size):
+            self.populate_heap(schedule)
+        H, now, fired = self._heap, time.time(), []
+        while H and H[0][0] <= now:
+            name = heappop(H)[2]
+            entry = schedule.get(name)
+            if entry is None:  # removed from the schedule
+                self._heap_size -= 1
+                continue
+            fired.append((name, self.maybe_due(entry, self.publisher)))
+        for name, next_time_to_run in fired:
+            heappush(H, self._heap_event(
+                now + (next_time_to_run or self.max_interval), name))
+        if not H:
+            return self.max_interval
+        return max(min(H[0][0] - now, self.max_interval), 0)
+
+    def _heap_event(self, when, name):
+        return when, self._heap_seq.next(), name
+
+    def populate_heap(self, schedule=None):
+        """Build the heap of entries ordered by the time they are due
+        next, used by :meth:`tick` when :attr:`use_heap` is enabled.
+
+        This is done lazily at the next tick when the schedule changes.
+
+        """
+        schedule = self.schedule if schedule is None else schedule
+        now = time.time()
+        H = []
+        for name, entry in schedule.iteritems():
+            is_due, next_time_to_run = entry.is_due()
+            H.append(self._heap_event(
+                now if is_due else now + (next_time_to_run or
+                                          self.max_interval), name))
+        heapq.heapify(H)
+        self._heap, self._heap_schedule, self._heap_size = (
+            H, schedule, len(schedule))
+
     def should_sync(self):
         return (not self._last_sync or
                 (time.time() - self._last_sync) > self.sync_every)
@@ -258,6 +319,7 @@ class Scheduler(object):
     def add(self, **kwargs):
         entry = self.Entry(**kwargs)
         self.schedule[entry.name] = entry
+        self._heap = None
         return entry
 
     def _maybe_entry(self, name, entry):
@@ -269,6 +331,7 @@ class Scheduler(object):
         self.schedule.update(dict(
             (name, self._maybe_entry(name, entry))
             for name, entry in dict_.items()))
+        self._heap = None
 
     def merge_inplace(self, b):
         schedule = self.schedule
@@ -285,6 +348,7 @@ class Scheduler(object):
                 schedule[key].update(entry)
             else:
                 schedule[key] = entry
+        self._heap = None
 
     def _ensure_connected(self):
         # callback called for each retry while the connection
@@ -302,6 +366,7 @@ class Scheduler(object):
 
     def set_schedule(self, schedule):
         self.data = schedule
+        self._heap = None
     schedule = property(get_schedule, set_schedule)
 
     @cached_property
@@ -379,6 +444,7 @@ class PersistentScheduler(Scheduler):
 
     def set_schedule(self, schedule):
         self._store['entries'] = schedule
+        self._heap = None
     schedule = property(get_schedule, set_schedule)
 
     def sync(self):
@@ -291,6 +291,11 @@ class State(object):
             task.on_unknown_event(type, **fields)
         task.worker = worker
 
+    def tasks_event(self, type, fields):
+        """Process aggregated task event (e.g. ``tasks-sent``)."""
+        for task_fields in fields.pop('tasks'):
+            self.task_event(type, dict(fields, **task_fields))
+
     def event(self, event):
         with self._mutex:
             return self._dispatch_event(event)
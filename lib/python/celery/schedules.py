@@ -9,20 +9,20 @@
 """
 from __future__ import absolute_import
 
+import calendar
 import re
 
+from bisect import bisect_left
 from datetime import datetime, timedelta
 
-from dateutil.relativedelta import relativedelta
 from kombu.utils import cached_property
 
 from . import current_app
 from .utils import is_iterable
 from .utils.timeutils import (
     timedelta_seconds, weekday, maybe_timedelta, remaining,
-    humanize_seconds, timezone, maybe_make_aware
+    humanize_seconds, timezone, maybe_make_aware, make_aware, localize,
 )
-from .datastructures import AttributeDict
 
 
 def _weak_bool(s):
@@ -354,67 +354,46 @@ class crontab(schedule):
 
         return result
 
-    def _delta_to_next(self, last_run_at, next_hour, next_minute):
-        """
-        Takes a datetime of last run, next minute and hour, and
-        returns a relativedelta for the next scheduled day and time.
-        Only called when day_of_month and/or month_of_year cronspec
-        is specified to further limit scheduled task execution.
-        """
-        from bisect import bisect, bisect_left
+    def _next_wallclock(self, after):
+        """Returns the first (naive) wall clock time matching the crontab
+        that is later than the naive datetime `after`.
 
-        datedata = AttributeDict(year=last_run_at.year)
-        days_of_month = sorted(self.day_of_month)
-        months_of_year = sorted(self.month_of_year)
+        Uses the sorted fields built by :meth:`__init__`, so only the
+        matching months and days are visited, and the hour and minute
+        are found by bisection.
 
-        def day_out_of_range(year, month, day):
-            try:
-                datetime(year=year, month=month, day=day)
-            except ValueError:
-                return True
-            return False
-
-        def roll_over():
-            while 1:
-                flag = (datedata.dom == len(days_of_month) or
-                        day_out_of_range(datedata.year,
-                                         months_of_year[datedata.moy],
-                                         days_of_month[datedata.dom]))
-                if flag:
-                    datedata.dom = 0
-                    datedata.moy += 1
-                    if datedata.moy == len(months_of_year):
-                        datedata.moy = 0
-                        datedata.year += 1
-                else:
-                    break
-
-        if last_run_at.month in self.month_of_year:
-            datedata.dom = bisect(days_of_month, last_run_at.day)
-            datedata.moy = bisect_left(months_of_year, last_run_at.month)
-        else:
-            datedata.dom = 0
-            datedata.moy = bisect(months_of_year, last_run_at.month)
-            if datedata.moy == len(months_of_year):
-                datedata.moy = 0
-        roll_over()
-
-        while 1:
-            th = datetime(year=datedata.year,
-                          month=months_of_year[datedata.moy],
-                          day=days_of_month[datedata.dom])
-            if th.isoweekday() % 7 in self.day_of_week:
-                break
-            datedata.dom += 1
-            roll_over()
-
-        return relativedelta(year=datedata.year,
-                             month=months_of_year[datedata.moy],
-                             day=days_of_month[datedata.dom],
-                             hour=next_hour,
-                             minute=next_minute,
-                             second=0,
-                             microsecond=0)
+        """
+        start = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        hours, minutes, dow = self._hours, self._minutes, self.day_of_week
+        days_of_month, months = self._days_of_month, self._months
+
+        # the day of week pattern repeats every 400 years.
+        for year in xrange(start.year, start.year + 400):
+            this_year = year == start.year
+            for month in months[bisect_left(months, start.month)
+                                if this_year else 0:]:
+                this_month = this_year and month == start.month
+                last_day = calendar.monthrange(year, month)[1]
+                for day in days_of_month[bisect_left(days_of_month, start.day)
+                                         if this_month else 0:]:
+                    if day > last_day:
+                        break
+                    if (calendar.weekday(year, month, day) + 1) % 7 not in dow:
+                        continue  # Sunday is day 0, not day 6.
+                    hour = minute = 0
+                    if this_month and day == start.day:
+                        hour, minute = start.hour, start.minute
+                    i = bisect_left(hours, hour)
+                    if i < len(hours) and hours[i] == hour:
+                        j = bisect_left(minutes, minute)
+                        if j < len(minutes):
+                            return datetime(year, month, day,
+                                            hour, minutes[j])
+                        i += 1
+                    if i < len(hours):
+                        return datetime(year, month, day,
+                                        hours[i], minutes[0])
+        raise ValueError('%r never matches any date' % (self, ))
 
     def __init__(self, minute='*', hour='*', day_of_week='*',
                  day_of_month='*', month_of_year='*', nowfun=None):
@@ -429,6 +408,10 @@ class crontab(schedule):
         self.day_of_month = self._expand_cronspec(day_of_month, 31, 1)
         self.month_of_year = self._expand_cronspec(month_of_year, 12, 1)
         self.nowfun = nowfun
+        self._minutes = sorted(self.minute)
+        self._hours = sorted(self.hour)
+        self._days_of_month = sorted(self.day_of_month)
+        self._months = sorted(self.month_of_year)
 
     def now(self):
         return (self.nowfun or self.app.now)()
@@ -449,60 +432,35 @@ class crontab(schedule):
                                  self._orig_day_of_month,
                                  self._orig_month_of_year), None)
 
-    def remaining_estimate(self, last_run_at, tz=None):
-        """Returns when the periodic task should run next as a timedelta."""
-        tz = tz or self.tz
+    def next_after(self, last_run_at):
+        """Returns the first time after `last_run_at` the crontab
+        matches.
+
+        If :setting:`CELERY_ENABLE_UTC` is enabled the fields are matched
+        against the wall clock time in :setting:`CELERY_TIMEZONE`.  Times
+        skipped when the clock is turned forward for daylight saving time
+        are moved forward by the size of the gap, and times repeated when
+        the clock is turned back only match their first occurrence.
+
+        """
         last_run_at = self.maybe_make_aware(last_run_at)
-        dow_num = last_run_at.isoweekday() % 7  # Sunday is day 0, not day 7
-
-        execute_this_date = (last_run_at.month in self.month_of_year and
-                             last_run_at.day in self.day_of_month and
-                             dow_num in self.day_of_week)
-
-        execute_this_hour = (execute_this_date and
-                             last_run_at.hour in self.hour and
-                             last_run_at.minute < max(self.minute))
-
-        if execute_this_hour:
-            next_minute = min(minute for minute in self.minute
-                              if minute > last_run_at.minute)
-            delta = relativedelta(minute=next_minute,
-                                  second=0,
-                                  microsecond=0)
-        else:
-            next_minute = min(self.minute)
-            execute_today = (execute_this_date and
-                             last_run_at.hour < max(self.hour))
-
-            if execute_today:
-                next_hour = min(hour for hour in self.hour
-                                if hour > last_run_at.hour)
-                delta = relativedelta(hour=next_hour,
-                                      minute=next_minute,
-                                      second=0,
-                                      microsecond=0)
-            else:
-                next_hour = min(self.hour)
-                all_dom_moy = (self._orig_day_of_month == '*' and
-                               self._orig_month_of_year == '*')
-                if all_dom_moy:
-                    next_day = min([day for day in self.day_of_week
-                                    if day > dow_num] or self.day_of_week)
-                    add_week = next_day == dow_num
-
-                    delta = relativedelta(weeks=add_week and 1 or 0,
-                                          weekday=(next_day - 1) % 7,
-                                          hour=next_hour,
-                                          minute=next_minute,
-                                          second=0,
-                                          microsecond=0)
-                else:
-                    delta = self._delta_to_next(last_run_at,
-                                                next_hour, next_minute)
+        tz = last_run_at.tzinfo
+        if tz is None:
+            return self._next_wallclock(last_run_at)
+        if self.utc_enabled:
+            # beat stores its timestamps in UTC, so the fields have to
+            # be matched against the configured timezone instead.
+            tz = self.tz
+            last_run_at = localize(last_run_at, tz)
+        return make_aware(
+            self._next_wallclock(last_run_at.replace(tzinfo=None)), tz,
+        )
 
+    def remaining_estimate(self, last_run_at, tz=None):
+        """Returns when the periodic task should run next as a timedelta."""
         now = self.maybe_make_aware(self.now())
-        return remaining(self.to_local(last_run_at), delta,
-                         self.to_local(now))
+        return (self.to_local(self.next_after(last_run_at)) -
+                self.to_local(now))
 
     def is_due(self, last_run_at):
         """Returns tuple of two items `(is_due, next_time_to_run)`,
@@ -22,7 +22,7 @@ from celery.utils.log import get_task_logger
 #: list of methods that must be classmethods in the old API.
 _COMPAT_CLASSMETHODS = (
     'delay', 'apply_async', 'retry', 'apply', 'subtask_from_request',
-    'AsyncResult', 'subtask', '_get_request',
+    'AsyncResult', 'subtask', '_get_request', '_prepare_message',
 )
 
 
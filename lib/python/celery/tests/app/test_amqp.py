@@ -36,6 +36,39 @@ class test_TaskProducer(AppCase):
         prod.publish_task('tasks.add', (2, 2), {}, retry=False, chord=123)
         self.assertFalse(prod.connection.ensure.call_count)
 
+    def test_publish_tasks(self):
+        prod = self.app.amqp.TaskProducer(Mock())
+        prod.channel.connection.client.declared_entities = set()
+        prod.channel.publish_batch = None
+        prod.maybe_declare = Mock()
+        ids = prod.publish_tasks([
+            ('tasks.add', (i, i), {}, {'queue': 'foo'}) for i in range(10)
+        ] + [('tasks.add', (2, 2), {}, {'task_id': 'id'})], retry=False)
+        self.assertEqual(len(ids), 11)
+        self.assertEqual(ids[-1], 'id')
+        self.assertEqual(prod.channel.basic_publish.call_count, 11)
+        # foo and the default queue
+        self.assertEqual(prod.maybe_declare.call_count, 2)
+        self.assertIsNone(prod._batch_declared)
+
+    def test_publish_tasks_sent_event(self):
+        prod = self.app.amqp.TaskProducer(Mock(), send_sent_event=True)
+        prod.channel.connection.client.declared_entities = set()
+        prod.channel.publish_batch = None
+        prod.event_dispatcher = Mock()
+        tasks = [('tasks.add', (i, i), {}, {}) for i in range(3)]
+        prod.publish_tasks(tasks, retry=False)
+        self.assertEqual(prod.event_dispatcher.publish.call_count, 3)
+
+        prod.event_dispatcher = Mock()
+        ids = prod.publish_tasks(tasks, retry=False,
+                                 aggregate_sent_event=True)
+        self.assertEqual(prod.event_dispatcher.publish.call_count, 1)
+        type, fields, _ = prod.event_dispatcher.publish.call_args[0]
+        self.assertEqual(type, 'tasks-sent')
+        self.assertEqual([f['uuid'] for f in fields['tasks']], ids)
+        self.assertIsNone(prod._batch_events)
+
 
 class test_compat_TaskPublisher(AppCase):
 
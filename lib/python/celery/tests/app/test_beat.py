@@ -297,6 +297,88 @@ class test_Scheduler(Case):
         self.assertEqual(a.schedule['bar'].schedule._next_run_at, 40)
 
 
+class counting_schedule(mocked_schedule):
+
+    def __init__(self, *args, **kwargs):
+        mocked_schedule.__init__(self, *args, **kwargs)
+        self.checks = 0
+
+    def is_due(self, last_run_at):
+        self.checks += 1
+        return mocked_schedule.is_due(self, last_run_at)
+
+
+class test_Scheduler_heap(Case):
+
+    def setUp(self):
+        self.scheduler = mScheduler(use_heap=True)
+
+    def test_due_tick(self):
+        self.scheduler.add(name='test_due_tick', schedule=always_due)
+        self.assertAlmostEqual(self.scheduler.tick(), 1, 0)
+        self.assertEqual(len(self.scheduler.sent), 1)
+
+    def test_pending_tick(self):
+        self.scheduler.add(name='test_pending_tick',
+                           schedule=mocked_schedule(False, 100))
+        self.assertAlmostEqual(self.scheduler.tick(), 100, 0)
+        self.assertFalse(self.scheduler.sent)
+
+    def test_honors_max_interval(self):
+        maxi = self.scheduler.max_interval
+        self.scheduler.add(name='test_honors_max_interval',
+                           schedule=mocked_schedule(False, maxi * 4))
+        self.assertEqual(self.scheduler.tick(), maxi)
+
+    def test_empty(self):
+        self.assertEqual(self.scheduler.tick(), self.scheduler.max_interval)
+
+    def test_ticks(self):
+        nums = [600, 300, 650, 120, 250, 36]
+        self.scheduler.update_from_dict(dict(
+            ('test_ticks%s' % i, {'schedule': mocked_schedule(False, j)})
+            for i, j in enumerate(nums)))
+        self.assertAlmostEqual(self.scheduler.tick(), min(nums), 0)
+
+    def test_only_checks_due_entries(self):
+        due = counting_schedule(True, 100)
+        pending = counting_schedule(False, 100)
+        self.scheduler.add(name='due', schedule=due)
+        self.scheduler.add(name='pending', schedule=pending)
+        self.scheduler.tick()
+        self.assertEqual(due.checks, 2)  # populate + tick
+        self.assertEqual(pending.checks, 1)  # populate
+        self.assertEqual(len(self.scheduler.sent), 1)
+
+        self.scheduler.tick()
+        self.assertEqual(due.checks, 2)
+        self.assertEqual(pending.checks, 1)
+        self.assertEqual(len(self.scheduler.sent), 1)
+
+    def test_rebuilt_when_schedule_changes(self):
+        self.scheduler.add(name='pending',
+                           schedule=mocked_schedule(False, 100))
+        self.scheduler.tick()
+        self.scheduler.add(name='due', schedule=always_due)
+        self.assertAlmostEqual(self.scheduler.tick(), 1, 0)
+        self.assertEqual(len(self.scheduler.sent), 1)
+
+        self.scheduler.schedule = {}
+        self.assertEqual(self.scheduler.tick(), self.scheduler.max_interval)
+
+    def test_entry_replaced(self):
+        self.scheduler.add(name='due', schedule=always_due)
+        self.scheduler.populate_heap()
+        schedule = self.scheduler.schedule
+        schedule.pop('due')
+        schedule['other'] = self.scheduler.Entry(name='other',
+                                                 schedule=always_due)
+        self.scheduler.tick()
+        self.assertFalse(self.scheduler.sent)
+        self.scheduler.tick()
+        self.assertEqual(len(self.scheduler.sent), 1)
+
+
 def create_persistent_scheduler(shelv=None):
     if shelv is None:
         shelv = MockShelve()
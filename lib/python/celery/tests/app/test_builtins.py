@@ -99,6 +99,21 @@ class test_group(Case):
         x = group([add.s(4, 4), add.s(8, 8)])
         x.apply_async()
 
+    def test_run_publishes_in_bulk(self):
+        tasks, result, gid, args = self.task.prepare(
+            {}, [add.s(2, 2), add.s(4, 4), xsum.s([1, 2])], (),
+        )
+        with patch('celery.app.amqp.TaskProducer.publish_tasks') as pub:
+            self.task.run(tasks, result.serializable(), gid, args)
+            messages = pub.call_args[0][0]
+        self.assertEqual([m[0] for m in messages],
+                         [add.name, add.name, xsum.name])
+        self.assertEqual(messages[1][1], (4, 4))
+        for name, args, kwargs, options in messages:
+            self.assertEqual(options['group_id'], gid)
+        self.assertEqual([m[3]['task_id'] for m in messages],
+                         [r.id for r in result.results])
+
     def test_apply_async_with_parent(self):
         _task_stack.push(add)
         try:
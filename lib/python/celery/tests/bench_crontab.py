@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+"""Measures how long it takes to find the next run time of crontab
+schedules.
+
+Creates `n` random crontab schedules, then times
+:meth:`~celery.schedules.crontab.remaining_estimate` and
+:meth:`~celery.schedules.crontab.is_due` for all of them::
+
+    $ python -m celery.tests.bench_crontab [n]
+
+"""
+from __future__ import absolute_import
+
+import random
+import sys
+import time
+
+from datetime import datetime
+
+from celery.schedules import crontab
+
+
+def sample(n, first, k):
+    return random.sample(range(first, first + n), random.randint(1, k))
+
+
+def random_crontab():
+    kwargs = {'minute': sample(60, 0, 4), 'hour': sample(24, 0, 4)}
+    if random.random() < 0.3:
+        kwargs['day_of_week'] = sample(7, 0, 3)
+    if random.random() < 0.3:
+        kwargs['day_of_month'] = sample(28, 1, 3)
+    if random.random() < 0.2:
+        kwargs['month_of_year'] = sample(12, 1, 4)
+    return crontab(**kwargs)
+
+
+def bench(entries, fun):
+    start = time.time()
+    for entry, last_run_at in entries:
+        fun(entry, last_run_at)
+    return (time.time() - start) * 1000.0
+
+
+def main(argv=sys.argv):
+    n = int(argv[1]) if len(argv) > 1 else 10000
+    random.seed(n)
+    now = datetime.utcnow()
+    entries = []
+    for i in xrange(n):
+        entry = random_crontab()
+        entry.nowfun = lambda: now
+        last_run_at = datetime(2013, 1, 1, 12, random.randint(0, 59))
+        entries.append((entry, last_run_at))
+    print('%-24s %10s' % ('method', 'ms'))
+    for name, fun in [
+            ('remaining_estimate', lambda e, l: e.remaining_estimate(l)),
+            ('is_due', lambda e, l: e.is_due(l))]:
+        print('%-24s %10.1f' % (name, bench(entries, fun)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+"""Measures how long it takes to publish the members of a group.
+
+Runs the ``celery.group`` task for a group of `n` tasks, which publishes
+every member, using the in-memory transport (or `broker_url`)::
+
+    $ python -m celery.tests.bench_group [n] [broker_url]
+
+"""
+from __future__ import absolute_import
+
+import sys
+import time
+
+from celery import Celery, group
+
+
+def main(argv=sys.argv):
+    n = int(argv[1]) if len(argv) > 1 else 20000
+    url = argv[2] if len(argv) > 2 else 'memory://'
+    app = Celery(set_as_current=False, broker=url)
+    app.conf.CELERY_SEND_TASK_SENT_EVENT = False
+
+    @app.task()
+    def add(x, y):
+        return x + y
+
+    print('%-24s %14s' % ('benchmark', 'tasks/s'))
+    for name, aggregate in (('group', False), ('group sent-event', True)):
+        app.conf.CELERY_SEND_TASK_SENT_EVENT = aggregate
+        app.conf.CELERY_AGGREGATE_TASK_SENT_EVENTS = aggregate
+        app.amqp.__dict__.pop('TaskProducer', None)
+        g = group(add.s(i, i) for i in xrange(n))
+        G = app.tasks['celery.group']
+        tasks, result, gid, args = G.prepare({}, g.tasks, ())
+        start = time.time()
+        G.run(tasks, result.serializable(), gid, args)
+        print('%-24s %14.1f' % (name, n / (time.time() - start)))
+        with app.connection() as conn:
+            conn.default_channel.queue_purge('celery')
+
+
+if __name__ == '__main__':
+    main()
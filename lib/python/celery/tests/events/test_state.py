@@ -336,6 +336,18 @@ class test_State(Case):
                                                 'uuid': 'x',
                                                 'hostname': 'y'})
 
+    def test_tasks_sent(self):
+        s = State()
+        s.event(Event('tasks-sent', hostname='client', tasks=[
+            {'uuid': 'id1', 'name': 'tasks.add', 'args': '(2, 2)'},
+            {'uuid': 'id2', 'name': 'tasks.mul', 'args': '(4, 4)'},
+        ]))
+        self.assertEqual(s.event_count, 1)
+        self.assertEqual(s.tasks['id1'].name, 'tasks.add')
+        self.assertEqual(s.tasks['id2'].args, '(4, 4)')
+        self.assertEqual(s.tasks['id2'].state, states.PENDING)
+        self.assertTrue(s.tasks['id2'].sent)
+
     def test_callback(self):
         scratch = {}
 
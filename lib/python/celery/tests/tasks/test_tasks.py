@@ -25,6 +25,7 @@ from celery.utils import uuid
 from celery.utils.timeutils import parse_iso8601, timedelta_seconds
 
 from celery.tests.utils import Case, with_eager_tasks, WhateverIO
+from celery.tests.utils import skip_unless_module
 
 
 def now():
@@ -963,6 +964,59 @@ class test_crontab_remaining_estimate(Case):
                                    datetime(2010, 1, 28, 14, 30, 15))
         self.assertEqual(next, datetime(2010, 5, 29, 0, 5))
 
+    def test_month_of_year_next_year(self):
+        next = self.next_ocurrance(crontab(minute=30,
+                                           hour=14,
+                                           month_of_year=1),
+                                   datetime(2012, 4, 7, 8, 49, 14))
+        self.assertEqual(next, datetime(2013, 1, 1, 14, 30))
+
+    def test_never_matches(self):
+        with self.assertRaises(ValueError):
+            crontab(day_of_month=31, month_of_year=2).next_after(
+                datetime(2010, 1, 1))
+
+
+class test_crontab_next_after(Case):
+
+    def crontab(self, **kwargs):
+        import pytz
+        c = crontab(**kwargs)
+        c.tz = self.tz = pytz.timezone('US/Eastern')
+        c.utc_enabled = True
+        return c
+
+    @skip_unless_module('pytz')
+    def test_time_skipped_by_dst(self):
+        c = self.crontab(minute=30, hour=2)
+        next = c.next_after(self.tz.localize(datetime(2013, 3, 9, 2, 30)))
+        self.assertEqual(next, self.tz.localize(datetime(2013, 3, 10, 3, 30)))
+        next = c.next_after(next)
+        self.assertEqual(next, self.tz.localize(datetime(2013, 3, 11, 2, 30)))
+
+    @skip_unless_module('pytz')
+    def test_time_repeated_by_dst(self):
+        c = self.crontab(minute=30)
+        first = c.next_after(self.tz.localize(datetime(2013, 11, 3, 0, 30)))
+        self.assertEqual(first.utcoffset(), timedelta(hours=-4))
+        second = c.next_after(first)
+        self.assertEqual(second.utcoffset(), timedelta(hours=-5))
+        self.assertEqual(second - first, timedelta(hours=2))
+
+    @skip_unless_module('pytz')
+    def test_utc_last_run_at(self):
+        import pytz
+        c = self.crontab(minute=0, hour=9)
+        next = c.next_after(datetime(2013, 1, 1, 15, 0, tzinfo=pytz.utc))
+        self.assertEqual(next, self.tz.localize(datetime(2013, 1, 2, 9, 0)))
+
+    @skip_unless_module('pytz')
+    def test_utc_last_run_at_matched_in_local_time(self):
+        import pytz
+        c = self.crontab(minute=0, hour=23)
+        next = c.next_after(datetime(2013, 1, 2, 3, 0, tzinfo=pytz.utc))
+        self.assertEqual(next, self.tz.localize(datetime(2013, 1, 1, 23, 0)))
+
 
 class test_crontab_is_due(Case):
 
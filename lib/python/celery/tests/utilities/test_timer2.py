@@ -41,6 +41,65 @@ class test_Schedule(Case):
         x.cancel(tref)
         tref.cancel.assert_called_with()
 
+    def test_cancel_bookkeeping(self):
+        x = timer2.Schedule()
+        entries = [x.apply_at(time.time() + 100 + i, lambda: None)
+                   for i in range(10)]
+        entries[0].cancel()
+        entries[0].cancel()
+        self.assertEqual(x._cancelled, 1)
+        x.clear()
+        self.assertEqual(x._cancelled, 0)
+        entries[1].cancel()  # not in the heap anymore.
+        self.assertEqual(x._cancelled, 0)
+
+    def test_skipped_cancelled_entry_not_counted(self):
+        x = timer2.Schedule()
+        entry = x.apply_at(time.time() - 1, lambda: None)
+        x.apply_at(time.time() + 100, lambda: None)
+        entry.cancel()
+        self.assertEqual(x._cancelled, 1)
+        it = iter(x)
+        delay, e = it.next()
+        self.assertIsNone(e)
+        self.assertTrue(delay)
+        self.assertEqual(x._cancelled, 0)
+        self.assertEqual(len(x._queue), 1)
+
+    def test_compact(self):
+        x = timer2.Schedule()
+        x.compact_min = 4
+        now = time.time()
+        entries = [x.apply_at(now + 100 + i, lambda: None)
+                   for i in range(20)]
+        it = iter(x)
+        for entry in entries[:4]:
+            entry.cancel()
+        it.next()
+        self.assertEqual(len(x._queue), 20)  # not enough to compact
+
+        queue = x._queue
+        entries[10].cancel()
+        entries[11].cancel()
+        it.next()
+        self.assertIs(x._queue, queue)
+        self.assertEqual(len(x._queue), 14)
+        self.assertEqual(x._cancelled, 0)
+        self.assertIsNone(entries[0]._schedule)
+        self.assertEqual([e[2] for e in x.queue],
+                         entries[4:10] + entries[12:])
+
+    def test_queue_and_info(self):
+        x = timer2.Schedule()
+        now = time.time()
+        e1 = x.apply_at(now + 3, lambda: None)
+        e2 = x.apply_at(now + 1, lambda: None)
+        e3 = x.apply_at(now + 2, lambda: None)
+        e3.cancel()
+        self.assertEqual([e[2] for e in x.queue], [e2, e1])
+        self.assertEqual([i['item'] for i in x.info()], [e2, e1])
+        self.assertEqual(len(x._queue), 3)
+
     def test_handle_error(self):
         from datetime import datetime
         to_timestamp = timer2.to_timestamp
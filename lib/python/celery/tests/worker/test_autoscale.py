@@ -1,11 +1,14 @@
 from __future__ import absolute_import
 
 import sys
+import threading
 
 from time import time
 
+from kombu import Connection
 from mock import Mock, patch
 
+from celery import current_app
 from celery.concurrency.base import BasePool
 from celery.worker import state
 from celery.worker import autoscale
@@ -83,6 +86,25 @@ class test_Autoscaler(Case):
         x.body()
         self.assertEqual(x.pool.num_processes, 3)
 
+    def test_scale_down_amounts(self):
+        # Shrinks to the target, but never below min_concurrency.
+        x = autoscale.Autoscaler(MockPool(10), 10, 3)
+        for i in range(5):
+            state.reserved_requests.add(i)
+        try:
+            x._last_action = time() - 10000
+            x.maybe_scale()
+            self.assertEqual(x.pool.num_processes, 5)
+
+            x = autoscale.Autoscaler(MockPool(4), 10, 3)
+            state.reserved_requests.clear()
+            state.reserved_requests.update([1, 2])
+            x._last_action = time() - 10000
+            x.maybe_scale()
+            self.assertEqual(x.pool.num_processes, 3)
+        finally:
+            state.reserved_requests.clear()
+
     def test_run(self):
 
         class Scaler(autoscale.Autoscaler):
@@ -142,6 +164,14 @@ class test_Autoscaler(Case):
         self.assertEqual(info['max'], 10)
         self.assertEqual(info['min'], 3)
         self.assertEqual(info['current'], 3)
+        self.assertEqual(info['policy'], {'name': 'reserved'})
+
+    def test_policy_alias(self):
+        x = autoscale.Autoscaler(self.pool, 10, 3, policy='latency',
+                                 app=current_app)
+        self.assertIsInstance(x.policy, autoscale.LatencyPolicy)
+        self.assertEqual(x.policy.target_latency,
+                         current_app.conf.CELERYD_AUTOSCALE_TARGET_LATENCY)
 
     @patch('os._exit')
     def test_thread_crash(self, _exit):
@@ -161,3 +191,152 @@ class test_Autoscaler(Case):
             sys.stderr = p
         _exit.assert_called_with(1)
         self.assertTrue(stderr.write.call_count)
+
+
+class test_Policy(Case):
+
+    def test_not_implemented(self):
+        with self.assertRaises(NotImplementedError):
+            autoscale.Policy(Mock()).target()
+
+
+class test_LatencyPolicy(Case):
+
+    def setUp(self):
+        self.pool = MockPool(2)
+        self.scaler = autoscale.Autoscaler(
+            self.pool, 20, 2, policy=autoscale.LatencyPolicy,
+            app=current_app,
+        )
+        self.policy = self.scaler.policy
+        self.policy.target_latency = 10.0
+        self.policy.get_queue_depth = Mock()
+        self.policy.get_queue_depth.return_value = 0
+        state.task_runtime.clear()
+        state.task_wait_time.clear()
+
+    def tearDown(self):
+        state.task_runtime.clear()
+        state.task_wait_time.clear()
+        state.reserved_requests.clear()
+        state.active_requests.clear()
+
+    def test_scale_up_to_target_latency(self):
+        state.task_runtime.update(1.0)
+        self.policy.get_queue_depth.return_value = 100
+        self.scaler.maybe_scale()
+        # 100 tasks of 1s each done within 10s needs 10 processes.
+        self.assertEqual(self.pool.num_processes, 10)
+        info = self.scaler.info()['policy']
+        self.assertEqual(info['decision'], 'up')
+        self.assertEqual(info['queue_depth'], 100)
+        self.assertEqual(info['target'], 10)
+        self.assertEqual(info['name'], 'latency')
+
+    def test_limited_by_max_concurrency(self):
+        state.task_runtime.update(10.0)
+        self.policy.get_queue_depth.return_value = 1000
+        self.scaler.maybe_scale()
+        self.assertEqual(self.pool.num_processes, 20)
+
+    def test_without_runtime_uses_backlog(self):
+        self.policy.get_queue_depth.return_value = 5
+        self.assertEqual(self.policy.target(), 5)
+
+    def test_hysteresis(self):
+        self.pool.grow(8)
+        state.task_runtime.update(1.0)
+        self.policy.get_queue_depth.return_value = 60
+        self.assertEqual(self.policy.target(), 10)
+        self.assertEqual(self.policy.last_decision['decision'], 'hold')
+
+        self.policy._last_poll = None
+        self.policy.get_queue_depth.return_value = 40
+        self.assertEqual(self.policy.target(), 4)
+        self.assertEqual(self.policy.last_decision['decision'], 'down')
+
+    def test_busy_processes_are_kept(self):
+        self.pool.grow(8)
+        for i in range(7):
+            state.active_requests.add(i)
+        self.assertEqual(self.policy.target(), 10)
+
+    def test_scale_up_when_waiting(self):
+        for i in range(2):
+            state.active_requests.add(i)
+        state.task_runtime.update(0.01)
+        state.task_wait_time.update(30.0)
+        self.assertEqual(self.policy.target(), 3)
+        self.assertEqual(self.policy.last_decision['utilization'], 1.0)
+
+    def test_queue_depth_is_throttled(self):
+        self.policy.target()
+        self.policy.target()
+        self.assertEqual(self.policy.get_queue_depth.call_count, 1)
+        self.policy._last_poll -= self.policy.poll_interval
+        self.policy.target()
+        self.assertEqual(self.policy.get_queue_depth.call_count, 2)
+
+    def test_queue_depth_unavailable(self):
+        self.policy.queue_depth = 3
+        self.policy.get_queue_depth.return_value = None
+        self.policy.target()
+        self.assertEqual(self.policy.queue_depth, 3)
+
+    def test_queue_depth_error(self):
+        self.policy.queue_depth = 3
+        self.policy.get_queue_depth.side_effect = KeyError('foo')
+        with patch('celery.worker.autoscale.error') as error:
+            self.policy.target()
+            self.assertTrue(error.called)
+        self.assertEqual(self.policy.queue_depth, 3)
+
+    def test_poll_in_thread(self):
+        self.policy.poll_in_thread = True
+        polling, done = threading.Event(), threading.Event()
+
+        def get_queue_depth():
+            polling.set()
+            done.wait(10.0)
+            return 50
+        self.policy.get_queue_depth = Mock(side_effect=get_queue_depth)
+
+        # target() does not wait for the broker, and does not start
+        # another poll while the previous one is still running.
+        self.assertEqual(self.policy.target(), 0)
+        polling.wait(10.0)
+        self.policy._last_poll -= self.policy.poll_interval
+        self.policy.target()
+        self.assertEqual(self.policy.get_queue_depth.call_count, 1)
+
+        done.set()
+        self.policy._poller.join(10.0)
+        self.assertEqual(self.policy.target(), 50)
+
+
+class test_LatencyPolicy_queue_depth(Case):
+
+    def setUp(self):
+        self.conn = Connection('memory://')
+        self.queue = current_app.amqp.queues.new_missing('autoscale')
+        app = Mock()
+        app.connection_or_acquire.side_effect = (
+            lambda: Connection('memory://'))
+        app.amqp.queues.consume_from = {'autoscale': self.queue}
+        self.scaler = autoscale.Autoscaler(MockPool(2), 10, 1,
+                                           policy='latency', app=app)
+
+    def tearDown(self):
+        self.conn.release()
+
+    @patch('celery.worker.autoscale.warn')
+    def test_get_queue_depth(self, warn):
+        policy = self.scaler.policy
+        self.assertIsNone(policy.get_queue_depth())
+        self.assertTrue(warn.called)
+
+        channel = self.conn.default_channel
+        self.queue(channel).declare()
+        for i in range(3):
+            channel._put('autoscale', channel.prepare_message('x'))
+        self.assertEqual(policy.get_queue_depth(), 3)
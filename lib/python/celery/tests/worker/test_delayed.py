@@ -0,0 +1,146 @@
+from __future__ import absolute_import
+from __future__ import with_statement
+
+from kombu import Connection, Exchange, Queue, Producer
+from mock import Mock, patch
+
+from celery import current_app
+from celery.exceptions import ImproperlyConfigured
+from celery.task import task as task_dec
+from celery.utils import uuid
+from celery.worker.delayed import (
+    DelayStore,
+    RedisDelayStore,
+    get_delay_store,
+)
+from celery.worker.job import Request
+
+from celery.tests.utils import Case
+
+
+@task_dec()
+def delayed_add(x, y):
+    return x + y
+
+
+class MemoryDelayStore(DelayStore):
+
+    def __init__(self, *args, **kwargs):
+        super(MemoryDelayStore, self).__init__(*args, **kwargs)
+        self.entries = []
+
+    def add(self, eta, entry):
+        self.entries.append((eta, entry))
+
+    def pop_due(self, now, limit=None):
+        due = sorted(e for e in self.entries if e[0] <= now)[:limit]
+        for e in due:
+            self.entries.remove(e)
+        return [entry for _, entry in due]
+
+
+class test_DelayStore(Case):
+
+    def setUp(self):
+        self.conn = Connection('memory://')
+        self.queue = Queue('delayed', Exchange('delayed'), 'delayed')
+        self.queue(self.conn.default_channel).declare()
+        self.queue(self.conn.default_channel).purge()
+        self.producer = Producer(self.conn.default_channel)
+        self.store = MemoryDelayStore(app=current_app)
+
+    def tearDown(self):
+        self.conn.release()
+
+    def request(self, **kwargs):
+        body = dict({'task': delayed_add.name, 'id': uuid(),
+                     'args': (2, 2), 'kwargs': {}}, **kwargs)
+        return Request(body, app=current_app, delivery_info={
+            'exchange': 'delayed', 'routing_key': 'delayed'})
+
+    def test_park_and_move(self):
+        reqs = [self.request(eta='2100-01-01T00:00:%02d' % (i, ))
+                for i in range(3)]
+        for i, req in enumerate(reqs):
+            self.store.park(req, 100 + i)
+        self.assertEqual(self.store.move_due(now=50,
+                                             producer=self.producer), 0)
+        self.assertEqual(self.store.move_due(now=90, lookahead=11,
+                                             producer=self.producer), 2)
+        self.assertEqual(len(self.store.entries), 1)
+
+        queue = self.queue(self.conn.default_channel)
+        for req in reqs[:2]:
+            message = queue.get(no_ack=True)
+            self.assertEqual(message.payload['id'], req.id)
+            self.assertEqual(message.payload['eta'], req.request_dict['eta'])
+            self.assertEqual(list(message.payload['args']), [2, 2])
+        self.assertIsNone(queue.get(no_ack=True))
+
+    def test_move_in_batches(self):
+        for i in range(5):
+            self.store.park(self.request(), i)
+        self.assertEqual(self.store.move_due(now=10, limit=2,
+                                             producer=self.producer), 5)
+        self.assertFalse(self.store.entries)
+
+    def test_move_due_publish_fails(self):
+        for i in range(3):
+            self.store.park(self.request(), i)
+        self.store._republish = Mock(side_effect=IOError('broker down'))
+        with self.assertRaises(IOError):
+            self.store.move_due(now=10, producer=self.producer)
+        self.assertEqual(len(self.store.entries), 3)
+        self.assertTrue(all(eta <= 10 for eta, _ in self.store.entries))
+
+        del self.store._republish
+        self.assertEqual(self.store.move_due(now=10,
+                                             producer=self.producer), 3)
+        self.assertFalse(self.store.entries)
+
+    def test_not_implemented(self):
+        store = DelayStore()
+        with self.assertRaises(NotImplementedError):
+            store.add(1, 'x')
+        with self.assertRaises(NotImplementedError):
+            store.pop_due(1)
+
+
+class test_RedisDelayStore(Case):
+
+    def setUp(self):
+        with patch('celery.worker.delayed.RedisDelayStore.redis'):
+            self.store = RedisDelayStore('redis://h:1234/3')
+
+    def test_get_delay_store(self):
+        with patch('celery.worker.delayed.RedisDelayStore.redis') as redis:
+            store = get_delay_store('redis://localhost:6379/1', key='xyz')
+            self.assertIsInstance(store, RedisDelayStore)
+            self.assertEqual(store.key, 'xyz')
+            self.assertEqual(store.db, '1')
+            store.client
+            self.assertTrue(redis.Redis.called)
+
+    def test_missing_redis(self):
+        with patch('celery.worker.delayed.RedisDelayStore.redis', None):
+            with self.assertRaises(ImproperlyConfigured):
+                RedisDelayStore('redis://')
+
+    def test_add(self):
+        self.store.client = Mock()
+        self.store.add(123.0, 'entry')
+        self.store.client.execute_command.assert_called_with(
+            'ZADD', 'celery.delayed', 123.0, 'entry',
+        )
+
+    def test_pop_due(self):
+        client = self.store.client = Mock()
+        client.zrangebyscore.return_value = ['a', 'b', 'c']
+        client.pipeline.return_value.execute.return_value = [1, 0, 1]
+        self.assertEqual(self.store.pop_due(100, 10), ['a', 'c'])
+        client.zrangebyscore.assert_called_with(
+            'celery.delayed', '-inf', 100, start=0, num=10,
+        )
+
+        client.zrangebyscore.return_value = []
+        self.assertEqual(self.store.pop_due(100), [])
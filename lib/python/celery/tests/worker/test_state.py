@@ -1,5 +1,7 @@
 from __future__ import absolute_import
 
+from time import time
+
 from celery.datastructures import LimitedSet
 from celery.worker import state
 from celery.tests.utils import Case
@@ -115,3 +117,36 @@ class test_state(StateResetCase):
         for request in requests:
             state.task_ready(request)
         self.assertEqual(len(state.active_requests), 0)
+
+    def test_moving_averages(self):
+        state.task_runtime.clear()
+        state.task_wait_time.clear()
+        try:
+            request = SimpleReq('foo')
+            request.time_received = time() - 10
+            request.time_start = request.time_received + 4
+            state.task_accepted(request)
+            self.assertAlmostEqual(state.task_wait_time.value, 4.0)
+            state.task_ready(request)
+            self.assertAlmostEqual(state.task_runtime.value, 6.0, places=1)
+
+            eta_request = SimpleReq('foo')
+            eta_request.eta = 'x'
+            eta_request.time_received = time() - 100
+            eta_request.time_start = time()
+            state.task_accepted(eta_request)
+            self.assertAlmostEqual(state.task_wait_time.value, 4.0)
+        finally:
+            state.task_runtime.clear()
+            state.task_wait_time.clear()
+
+
+class test_MovingAverage(Case):
+
+    def test_update(self):
+        avg = state.MovingAverage(alpha=0.5)
+        self.assertIsNone(avg.value)
+        self.assertEqual(avg.update(4.0), 4.0)
+        self.assertEqual(avg.update(2.0), 3.0)
+        avg.clear()
+        self.assertIsNone(avg.value)
@@ -585,6 +585,60 @@ class test_Consumer(Case):
         with self.assertRaises(Empty):
             self.ready_queue.get_nowait()
 
+    def _eta_consumer(self, days=1):
+        l = MyKombuConsumer(self.ready_queue, timer=self.timer)
+        l.event_dispatcher = Mock()
+        l.task_consumer = Mock()
+        l.qos = QoS(l.task_consumer, 10)
+        l.delay_store = Mock()
+        l.delay_threshold = 3600
+        l.update_strategies()
+        m = create_message(
+            Mock(), task=foo_task.name, args=[2, 4, 8], kwargs={},
+            eta=(datetime.now() + timedelta(days=days)).isoformat(),
+        )
+        return l, m
+
+    def test_receive_message_eta_delay_store(self):
+        l, m = self._eta_consumer(days=1)
+        l.receive_message(m.decode(), m)
+        self.assertTrue(l.delay_store.park.called)
+        task, eta = l.delay_store.park.call_args[0]
+        self.assertEqual(task.name, foo_task.name)
+        self.assertTrue(m.acknowledged)
+        self.assertEqual(l.qos.value, 10)
+        self.assertTrue(self.timer.empty())
+
+    def test_receive_message_eta_below_delay_threshold(self):
+        l, m = self._eta_consumer(days=0.01)
+        l.receive_message(m.decode(), m)
+        self.assertFalse(l.delay_store.park.called)
+        self.assertFalse(m.acknowledged)
+        self.assertEqual(l.qos.value, 11)
+        self.timer.stop()
+        self.assertTrue(self.timer.queue)
+
+    def test_receive_message_eta_delay_store_error(self):
+        l, m = self._eta_consumer(days=1)
+        l.delay_store.park.side_effect = KeyError('foo')
+        l.receive_message(m.decode(), m)
+        self.assertFalse(m.acknowledged)
+        self.assertEqual(l.qos.value, 11)
+
+    def test_move_delayed_tasks(self):
+        l = MyKombuConsumer(self.ready_queue, timer=self.timer)
+        l.restart_delay_mover()
+        self.assertIsNone(l._delay_tref)
+
+        l.delay_store = Mock()
+        l.delay_interval = 10.0
+        l.restart_delay_mover()
+        self.assertTrue(l._delay_tref)
+        l.move_delayed_tasks()
+        l.delay_store.move_due.assert_called_with(lookahead=20.0)
+        l.delay_store.move_due.side_effect = KeyError('foo')
+        l.move_delayed_tasks()
+
     def test_reset_pidbox_node(self):
         l = MyKombuConsumer(self.ready_queue, timer=self.timer)
         l.pidbox_node = Mock()
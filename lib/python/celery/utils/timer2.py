@@ -41,6 +41,9 @@ logger = get_logger('timer2')
 class Entry(object):
     cancelled = False
 
+    #: The schedule this entry is currently waiting in, if any.
+    _schedule = None
+
     def __init__(self, fun, args=None, kwargs=None):
         self.fun = fun
         self.args = args or []
@@ -51,7 +54,11 @@ class Entry(object):
         return self.fun(*self.args, **self.kwargs)
 
     def cancel(self):
-        self.tref.cancelled = True
+        tref = self.tref
+        if not tref.cancelled:
+            tref.cancelled = True
+            if tref._schedule is not None:
+                tref._schedule._cancelled += 1
 
     def __repr__(self):
         return '<TimerEntry: %s(*%r, **%r)' % (
@@ -87,10 +94,18 @@ class Schedule(object):
 
     on_error = None
 
+    #: Cancelled entries stay in the heap until they are due, unless
+    #: there are more than :attr:`compact_min` of them and they make
+    #: up more than :attr:`compact_ratio` of the heap, in which
+    #: case they are all removed at once.
+    compact_min = 64
+    compact_ratio = 0.25
+
     def __init__(self, max_interval=None, on_error=None, **kwargs):
         self.max_interval = float(max_interval or DEFAULT_MAX_INTERVAL)
         self.on_error = on_error or self.on_error
         self._queue = []
+        self._cancelled = 0  # number of cancelled entries in the heap.
 
     def apply_entry(self, entry):
         try:
@@ -128,6 +143,7 @@ class Schedule(object):
 
     def _enter(self, eta, priority, entry):
         heapq.heappush(self._queue, (eta, priority, entry))
+        entry._schedule = self
         return entry
 
     def apply_at(self, eta, fun, args=(), kwargs={}, priority=0):
@@ -175,6 +191,9 @@ class Schedule(object):
         queue = self._queue
 
         while 1:
+            if self._cancelled > self.compact_min and \
+                    self._cancelled > len(queue) * self.compact_ratio:
+                self.compact()
             if queue:
                 eta, priority, entry = verify = queue[0]
                 now = nowfun()
@@ -185,21 +204,40 @@ class Schedule(object):
                     event = pop(queue)
 
                     if event is verify:
+                        entry._schedule = None
                         if not entry.cancelled:
                             yield None, entry
+                        else:
+                            self._cancelled -= 1
                         continue
                     else:
                         heapq.heappush(queue, event)
             else:
                 yield None, None
 
+    def compact(self):
+        """Remove cancelled entries from the heap."""
+        queue = self._queue
+        live = []
+        for event in queue:
+            if event[2].cancelled:
+                event[2]._schedule = None
+            else:
+                live.append(event)
+        heapq.heapify(live)
+        queue[:] = live  # modified in place, see :meth:`clear`.
+        self._cancelled = 0
+
     def empty(self):
         """Is the schedule empty?"""
         return not self._queue
 
     def clear(self):
+        for _, _, entry in self._queue:
+            entry._schedule = None
         self._queue[:] = []  # used because we can't replace the object
                              # and the operation is atomic.
+        self._cancelled = 0
 
     def info(self):
         return ({'eta': eta, 'priority': priority, 'item': item}
@@ -210,8 +248,9 @@ class Schedule(object):
 
     @property
     def queue(self):
-        events = list(self._queue)
-        return map(heapq.heappop, [events] * len(events))
+        """Sorted list of the entries that have not been cancelled."""
+        return sorted(event for event in self._queue
+                      if not event[2].cancelled)
 
 
 class Timer(threading.Thread):
@@ -23,13 +23,16 @@ from .text import pluralize
 
 try:
     import pytz
-    from pytz import AmbiguousTimeError
+    from pytz import AmbiguousTimeError, NonExistentTimeError
 except ImportError:                         # pragma: no cover
     pytz = None                             # noqa
 
     class AmbiguousTimeError(Exception):    # noqa
         pass
 
+    class NonExistentTimeError(Exception):  # noqa
+        pass
+
 
 C_REMDEBUG = os.environ.get('C_REMDEBUG', False)
 
@@ -278,7 +281,13 @@ def is_naive(dt):
 
 
 def make_aware(dt, tz):
-    """Sets the timezone for a datetime object."""
+    """Sets the timezone for a datetime object.
+
+    Ambiguous times (when the clock is turned back) are set to their
+    first occurrence, and times that do not exist (when the clock is
+    turned forward) are moved forward by the size of the gap.
+
+    """
     try:
         _localize = tz.localize
     except AttributeError:
@@ -290,6 +299,8 @@ def make_aware(dt, tz):
         except AmbiguousTimeError:
             return min(_localize(dt, is_dst=True),
                        _localize(dt, is_dst=False))
+        except NonExistentTimeError:
+            return tz.normalize(_localize(dt, is_dst=False))
 
 
 def localize(dt, tz):
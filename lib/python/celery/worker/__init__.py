@@ -291,6 +291,7 @@ class WorkController(configurated):
     timer_cls = from_config('timer')
     timer_precision = from_config('timer_precision')
     autoscaler_cls = from_config('autoscaler')
+    autoscale_policy = from_config()
     autoreloader_cls = from_config('autoreloader')
     schedule_filename = from_config()
     scheduler_cls = from_config('celerybeat_scheduler')
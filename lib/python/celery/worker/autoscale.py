@@ -10,6 +10,9 @@
     The autoscale thread is only enabled if autoscale
     has been enabled on the command line.
 
+    The number of processes to aim for is decided by a scaling policy,
+    selected by the :setting:`CELERYD_AUTOSCALE_POLICY` setting.
+
 """
 from __future__ import absolute_import
 from __future__ import with_statement
@@ -17,17 +20,27 @@ from __future__ import with_statement
 import threading
 
 from functools import partial
+from math import ceil
 from time import sleep, time
 
+from kombu.exceptions import StdChannelError
+
+from celery.utils.imports import symbol_by_name
 from celery.utils.log import get_logger
-from celery.utils.threads import bgThread
+from celery.utils.threads import Thread, bgThread
 
 from . import state
 from .bootsteps import StartStopComponent
 from .hub import DummyLock
 
 logger = get_logger(__name__)
-debug, info, error = logger.debug, logger.info, logger.error
+debug, info, warn, error = (logger.debug, logger.info,
+                            logger.warn, logger.error)
+
+POLICY_ALIASES = {
+    'reserved': 'celery.worker.autoscale:ReservedPolicy',
+    'latency': 'celery.worker.autoscale:LatencyPolicy',
+}
 
 
 class WorkerComponent(StartStopComponent):
@@ -42,6 +55,7 @@ class WorkerComponent(StartStopComponent):
         scaler = w.autoscaler = self.instantiate(
             w.autoscaler_cls,
             w.pool, w.max_concurrency, w.min_concurrency,
+            policy=w.autoscale_policy, app=w.app,
         )
         return scaler
 
@@ -53,8 +67,10 @@ class WorkerComponent(StartStopComponent):
         scaler = w.autoscaler = self.instantiate(
             w.autoscaler_cls,
             w.pool, w.max_concurrency, w.min_concurrency,
-            mutex=DummyLock(),
+            mutex=DummyLock(), policy=w.autoscale_policy, app=w.app,
         )
+        # the hub must not block on broker round trips.
+        scaler.policy.poll_in_thread = True
         w.hub.on_init.append(partial(self.on_poll_init, scaler))
 
     def create(self, w):
@@ -65,14 +81,18 @@ class WorkerComponent(StartStopComponent):
 class Autoscaler(bgThread):
 
     def __init__(self, pool, max_concurrency,
-                 min_concurrency=0, keepalive=30, mutex=None):
+                 min_concurrency=0, keepalive=30, mutex=None,
+                 policy=None, app=None):
         super(Autoscaler, self).__init__()
         self.pool = pool
+        self.app = app
         self.mutex = mutex or threading.Lock()
         self.max_concurrency = max_concurrency
         self.min_concurrency = min_concurrency
         self.keepalive = keepalive
         self._last_action = None
+        self.policy = symbol_by_name(policy or ReservedPolicy,
+                                     POLICY_ALIASES)(self)
 
         assert self.keepalive, 'cannot scale down too fast.'
 
@@ -83,12 +103,13 @@ class Autoscaler(bgThread):
 
     def _maybe_scale(self):
         procs = self.processes
-        cur = min(self.qty, self.max_concurrency)
+        cur = max(min(self.policy.target(), self.max_concurrency),
+                  self.min_concurrency)
         if cur > procs:
             self.scale_up(cur - procs)
             return True
         elif cur < procs:
-            self.scale_down((procs - cur) - self.min_concurrency)
+            self.scale_down(procs - cur)
             return True
 
     def maybe_scale(self):
@@ -149,7 +170,8 @@ class Autoscaler(bgThread):
         return {'max': self.max_concurrency,
                 'min': self.min_concurrency,
                 'current': self.processes,
-                'qty': self.qty}
+                'qty': self.qty,
+                'policy': self.policy.info()}
 
     @property
     def qty(self):
@@ -158,3 +180,162 @@ class Autoscaler(bgThread):
     @property
     def processes(self):
         return self.pool.num_processes
+
+
+class Policy(object):
+    """Base class for scaling policies.
+
+    A policy decides the number of pool processes the autoscaler
+    should aim for, which is then limited by the max and min
+    concurrency settings.
+
+    """
+    name = None
+
+    def __init__(self, scaler):
+        self.scaler = scaler
+
+    def target(self):
+        """Returns the number of processes wanted."""
+        raise NotImplementedError('subclass responsibility')
+
+    def info(self):
+        return {'name': self.name}
+
+
+class ReservedPolicy(Policy):
+    """Scale to the number of tasks reserved by this worker."""
+    name = 'reserved'
+
+    def target(self):
+        return self.scaler.qty
+
+
+class LatencyPolicy(Policy):
+    """Scale to work through the backlog within a target latency.
+
+    The backlog is the number of messages waiting in the queues
+    the worker consumes from, plus the tasks reserved by the worker.
+    The number of processes needed is estimated from the moving average
+    of task runtime, and is raised further when tasks already wait longer
+    than the target latency in a busy pool.
+
+    To avoid flapping the pool only shrinks when the processes needed
+    drops below :attr:`scale_down_ratio` of the current pool size.
+
+    """
+    name = 'latency'
+
+    #: Default target latency (seconds) if not set by the
+    #: :setting:`CELERYD_AUTOSCALE_TARGET_LATENCY` setting.
+    target_latency = 10.0
+
+    #: Minimum number of seconds between polling the queue depth.
+    poll_interval = 5.0
+
+    #: Poll the queue depth in a separate thread, so that :meth:`target`
+    #: never waits for the broker.  Enabled when used by the event loop.
+    poll_in_thread = False
+
+    #: Scale down when the processes needed is less than this
+    #: fraction of the current number of processes.
+    scale_down_ratio = 0.5
+
+    def __init__(self, scaler, target_latency=None, poll_interval=None):
+        super(LatencyPolicy, self).__init__(scaler)
+        app = scaler.app
+        if target_latency is None and app is not None:
+            target_latency = app.conf.CELERYD_AUTOSCALE_TARGET_LATENCY
+        self.target_latency = target_latency or self.target_latency
+        self.poll_interval = poll_interval or self.poll_interval
+        self.queue_depth = 0
+        self.last_decision = {}
+        self._last_poll = None
+        self._poller = None
+
+    def target(self):
+        now = time()
+        if self._last_poll is None or \
+                now - self._last_poll >= self.poll_interval:
+            self.maybe_poll(now)
+
+        procs = self.scaler.processes
+        active = len(state.active_requests)
+        backlog = self.queue_depth + len(state.reserved_requests)
+        runtime = state.task_runtime.value
+        wait = state.task_wait_time.value
+        needed = self.needed(backlog, runtime, wait, procs, active)
+        if needed > procs:
+            decision = 'up'
+        elif needed < procs * self.scale_down_ratio:
+            decision = 'down'
+        else:
+            decision, needed = 'hold', procs
+        self.last_decision = {
+            'decision': decision,
+            'target': needed,
+            'queue_depth': self.queue_depth,
+            'backlog': backlog,
+            'avg_runtime': runtime,
+            'avg_wait': wait,
+            'utilization': procs and float(active) / procs or 0.0,
+            'time': now,
+        }
+        return needed
+
+    def needed(self, backlog, runtime, wait, procs, active):
+        if runtime:
+            # processes needed to complete the backlog in time.
+            needed = int(ceil(backlog * runtime / self.target_latency))
+        else:
+            needed = backlog
+        if wait and wait > self.target_latency and active >= procs:
+            needed = max(needed, procs + 1)
+        # never ask to stop processes that are busy.
+        return max(needed, active)
+
+    def maybe_poll(self, now):
+        if self._poller is not None and self._poller.is_alive():
+            return  # previous poll still waiting for the broker.
+        self._last_poll = now
+        if self.poll_in_thread:
+            self._poller = Thread(target=self.poll)
+            self._poller.daemon = True
+            self._poller.start()
+        else:
+            self.poll()
+
+    def poll(self):
+        try:
+            depth = self.get_queue_depth()
+        except Exception, exc:
+            error('Autoscaler: cannot get queue depth: %r', exc,
+                  exc_info=True)
+        else:
+            if depth is not None:
+                self.queue_depth = depth
+
+    def get_queue_depth(self):
+        """Returns the number of messages ready in the queues consumed
+        from, or :const:`None` if the broker could not be reached."""
+        app = self.scaler.app
+        depth = 0
+        with app.connection_or_acquire() as conn:
+            errors = (conn.connection_errors + conn.channel_errors +
+                      (StdChannelError, ))
+            try:
+                channel = conn.channel()
+                try:
+                    for queue in app.amqp.queues.consume_from:
+                        depth += channel.queue_declare(queue=queue,
+                                                       passive=True)[1]
+                finally:
+                    channel.close()
+            except errors, exc:
+                warn('Autoscaler: cannot get queue depth: %r', exc)
+                return None
+        return depth
+
+    def info(self):
+        return dict(self.last_decision, name=self.name,
+                    target_latency=self.target_latency)
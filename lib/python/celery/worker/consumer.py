@@ -77,7 +77,7 @@ import logging
 import socket
 import threading
 
-from time import sleep
+from time import sleep, time
 from Queue import Empty
 
 from kombu.syn import _detect_environment
@@ -98,6 +98,7 @@ from celery.utils.timeutils import humanize_seconds, timezone
 from . import state
 from .bootsteps import StartStopComponent
 from .control import Panel
+from .delayed import get_delay_store
 from .heartbeat import Heart
 
 RUN = 0x1
@@ -312,6 +313,13 @@ class Consumer(object):
     #: as sending heartbeats.
     timer = None
 
+    #: Store for tasks with an ETA further away than
+    #: :attr:`delay_threshold` seconds, see :mod:`celery.worker.delayed`.
+    delay_store = None
+    delay_threshold = None
+    delay_interval = None
+    _delay_tref = None
+
     # Consumer state, can be RUN or CLOSE.
     _state = None
 
@@ -359,6 +367,13 @@ class Consumer(object):
         if not hub:
             self.amqheartbeat = 0
 
+        conf = self.app.conf
+        if conf.CELERYD_ETA_DELAY_STORE:
+            self.delay_store = get_delay_store(conf.CELERYD_ETA_DELAY_STORE,
+                                               app=self.app)
+            self.delay_threshold = conf.CELERYD_ETA_DELAY_THRESHOLD
+            self.delay_interval = conf.CELERYD_ETA_DELAY_INTERVAL
+
         if _detect_environment() == 'gevent':
             # there's a gevent bug that causes timeouts to not be reset,
             # so if the connection timeout is exceeded once, it can NEVER
@@ -532,6 +547,10 @@ class Consumer(object):
                       task.eta, exc, task.info(safe=True), exc_info=True)
                 task.acknowledge()
             else:
+                if self.delay_store is not None and \
+                        eta - time() > self.delay_threshold and \
+                        self.park_eta_task(task, eta):
+                    return
                 self.qos.increment_eventually()
                 self.timer.apply_at(
                     eta, self.apply_eta_task, (task, ), priority=6,
@@ -550,6 +569,39 @@ class Consumer(object):
             error('Control command error: %r', exc, exc_info=True)
             self.reset_pidbox_node()
 
+    def park_eta_task(self, task, eta):
+        """Move task with an ETA far into the future to the delay store,
+        returns :const:`False` if the task could not be stored."""
+        try:
+            self.delay_store.park(task, eta)
+        except Exception, exc:
+            error('Cannot store task %r in the delay store: %r',
+                  task.id, exc, exc_info=True)
+            return False
+        task.acknowledge()
+        return True
+
+    def move_delayed_tasks(self):
+        """Send tasks from the delay store that will soon be due
+        back to the broker."""
+        try:
+            moved = self.delay_store.move_due(
+                lookahead=self.delay_interval * 2,
+            )
+        except Exception, exc:
+            error('Cannot move tasks from the delay store: %r',
+                  exc, exc_info=True)
+        else:
+            if moved:
+                debug('Moved %s task(s) from the delay store.', moved)
+
+    def restart_delay_mover(self):
+        """Start polling the delay store at intervals."""
+        if self.delay_store is not None:
+            self._delay_tref = self.timer.apply_interval(
+                self.delay_interval * 1000.0, self.move_delayed_tasks,
+            )
+
     def apply_eta_task(self, task):
         """Method called by the timer to apply a task with an
         ETA/countdown."""
@@ -759,6 +811,9 @@ class Consumer(object):
         # Restart heartbeat thread.
         self.restart_heartbeat()
 
+        # Timer was cleared, so start polling the delay store again.
+        self.restart_delay_mover()
+
         # reload all task's execution strategies.
         self.update_strategies()
 
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+    celery.worker.delayed
+    ~~~~~~~~~~~~~~~~~~~~~
+
+    Stores for tasks with an ETA far into the future.
+
+    Instead of keeping these tasks in the worker's timer (and holding
+    on to the unacknowledged message), the worker parks them in a delay
+    store and acknowledges the message.  The store is polled at intervals,
+    and tasks that will soon be due are sent to the broker again, so that
+    only tasks with a near ETA are held in memory.
+
+    Enabled by the :setting:`CELERYD_ETA_DELAY_STORE` setting.
+
+"""
+from __future__ import absolute_import
+from __future__ import with_statement
+
+from time import time
+
+from kombu.serialization import encode
+from kombu.utils import cached_property
+from kombu.utils.url import _parse_url
+
+from celery.exceptions import ImproperlyConfigured
+from celery.utils.imports import symbol_by_name
+
+try:
+    import cPickle as pickle
+except ImportError:  # pragma: no cover
+    import pickle  # noqa
+
+try:
+    import redis
+except ImportError:  # pragma: no cover
+    redis = None  # noqa
+
+STORE_ALIASES = {
+    'redis': 'celery.worker.delayed:RedisDelayStore',
+}
+
+
+def get_delay_store(url, app=None, **kwargs):
+    """Create delay store from url, e.g. ``redis://localhost:6379/1``."""
+    scheme = url.split('://', 1)[0]
+    return symbol_by_name(scheme, STORE_ALIASES)(url, app=app, **kwargs)
+
+
+class DelayStore(object):
+    """Base class for delay stores.
+
+    Subclasses must implement :meth:`add` and :meth:`pop_due`.
+
+    """
+
+    def __init__(self, url=None, app=None, **kwargs):
+        self.url = url
+        self.app = app
+
+    def add(self, eta, entry):
+        """Store `entry` (a string) to be returned by :meth:`pop_due`
+        after the timestamp `eta`."""
+        raise NotImplementedError('subclass responsibility')
+
+    def pop_due(self, now, limit=None):
+        """Remove and return entries due at or before timestamp `now`."""
+        raise NotImplementedError('subclass responsibility')
+
+    def park(self, request, eta):
+        """Store the task message of `request`, which is due at
+        the timestamp `eta`."""
+        task = request.task
+        content_type, content_encoding, body = encode(
+            request.request_dict, serializer=task.serializer,
+        )
+        self.add(eta, pickle.dumps(
+            (body, content_type, content_encoding, request.delivery_info),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        ))
+
+    def move_due(self, now=None, lookahead=0, limit=1000, producer=None):
+        """Send task messages due within `lookahead` seconds to the broker
+        again, with the same exchange and routing key.
+
+        Returns the number of messages sent.  If sending fails the
+        entries that were taken from the store are added back, so that
+        they are sent again the next time.
+
+        """
+        now = time() if now is None else now
+        moved = 0
+        while 1:
+            entries = self.pop_due(now + lookahead, limit)
+            if entries:
+                try:
+                    self._republish(entries, producer)
+                except Exception:
+                    for entry in entries:
+                        self.add(now, entry)
+                    raise
+                moved += len(entries)
+            if not entries or len(entries) < limit:
+                return moved
+
+    def _republish(self, entries, producer=None):
+        with self.app.producer_or_acquire(producer) as P:
+            with P.publish_batch():
+                for entry in entries:
+                    body, content_type, content_encoding, delivery_info = (
+                        pickle.loads(entry))
+                    P.publish(body, content_type=content_type,
+                              content_encoding=content_encoding,
+                              exchange=delivery_info.get('exchange'),
+                              routing_key=delivery_info.get('routing_key'),
+                              priority=delivery_info.get('priority') or 0)
+
+
+class RedisDelayStore(DelayStore):
+    """Delay store using a Redis sorted set, scored by ETA.
+
+    Several workers can share the same store: an entry is only
+    sent again by the worker that managed to remove it from the set.
+
+    """
+
+    #: redis-py client module.
+    redis = redis
+
+    #: Name of the sorted set.
+    key = 'celery.delayed'
+
+    def __init__(self, url=None, app=None, key=None, **kwargs):
+        super(RedisDelayStore, self).__init__(url, app, **kwargs)
+        if self.redis is None:
+            raise ImproperlyConfigured(
+                'You need to install the redis library in order to use '
+                'the Redis delay store.')
+        _, self.host, self.port, _, self.password, db, _ = _parse_url(url)
+        self.db = db.strip('/') if db else 0
+        self.key = key or self.key
+
+    def add(self, eta, entry):
+        # ZADD argument order differs between the redis-py client classes.
+        self.client.execute_command('ZADD', self.key, eta, entry)
+
+    def pop_due(self, now, limit=None):
+        client = self.client
+        entries = client.zrangebyscore(self.key, '-inf', now,
+                                       start=0, num=limit or -1)
+        if not entries:
+            return []
+        pipe = client.pipeline()
+        for entry in entries:
+            pipe.zrem(self.key, entry)
+        # only keep the entries we removed, others were taken by
+        # another worker.
+        return [entry for entry, removed in zip(entries, pipe.execute())
+                if removed]
+
+    def __len__(self):
+        return self.client.zcard(self.key)
+
+    @cached_property
+    def client(self):
+        return self.redis.Redis(host=self.host or 'localhost',
+                                port=int(self.port or 6379),
+                                db=self.db, password=self.password)
@@ -72,8 +72,8 @@ class Request(object):
                  'task', 'eta', 'expires',
                  'request_dict', 'acknowledged', 'success_msg',
                  'error_msg', 'retry_msg', 'ignore_msg', 'utc',
-                 'time_start', 'worker_pid', '_already_revoked',
-                 '_terminate_on_ack', '_tzlocal')
+                 'time_start', 'time_received', 'worker_pid',
+                 '_already_revoked', '_terminate_on_ack', '_tzlocal')
 
     #: Format string used to log task success.
     success_msg = """\
@@ -123,6 +123,7 @@ class Request(object):
         self.task = task or self.app.tasks[name]
         self.acknowledged = self._already_revoked = False
         self.time_start = self.worker_pid = self._terminate_on_ack = None
+        self.time_received = time.time()
         self._tzlocal = None
 
         # timezone means the message is timezone-aware, and the only timezone
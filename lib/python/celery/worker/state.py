@@ -17,6 +17,7 @@ import platform
 import shelve
 
 from collections import defaultdict
+from time import time
 
 from kombu.utils import cached_property
 
@@ -47,6 +48,35 @@ total_count = defaultdict(int)
 #: the list of currently revoked tasks.  Persistent if statedb set.
 revoked = LimitedSet(maxlen=REVOKES_MAX, expires=REVOKE_EXPIRES)
 
+
+class MovingAverage(object):
+    """Exponentially weighted moving average.
+
+    :keyword alpha: Weight of a new sample, between 0 and 1.
+
+    """
+    value = None
+
+    def __init__(self, alpha=0.2):
+        self.alpha = alpha
+
+    def update(self, sample):
+        value = self.value
+        self.value = (sample if value is None
+                      else value + self.alpha * (sample - value))
+        return self.value
+
+    def clear(self):
+        self.value = None
+
+
+#: moving average of the time tasks spent executing (in seconds).
+task_runtime = MovingAverage()
+
+#: moving average of the time tasks waited in the worker from being
+#: received until started (in seconds), not counting ETA tasks.
+task_wait_time = MovingAverage()
+
 #: Updates global state when a task has been reserved.
 task_reserved = reserved_requests.add
 
@@ -58,12 +88,19 @@ def task_accepted(request):
     """Updates global state when a task has been accepted."""
     active_requests.add(request)
     total_count[request.name] += 1
+    received = getattr(request, 'time_received', None)
+    started = getattr(request, 'time_start', None)
+    if received and started and not getattr(request, 'eta', None):
+        task_wait_time.update(max(started - received, 0))
 
 
 def task_ready(request):
     """Updates global state when a task is ready."""
     active_requests.discard(request)
     reserved_requests.discard(request)
+    started = getattr(request, 'time_start', None)
+    if started:
+        task_runtime.update(max(time() - started, 0))
 
 
 C_BENCH = os.environ.get('C_BENCH') or os.environ.get('CELERY_BENCH')
@@ -59,6 +59,11 @@ class DebugToolbarMiddleware(object):
             if tag:
                 self.tag = u'</' + tag + u'>'
 
+            if settings.DEBUG_TOOLBAR_CONFIG.get('SQL_PROFILE', False):
+                # Installs the cursor hook, which profiles the queries of
+                # requests that don't show the toolbar.
+                import_module('debug_toolbar.panels.sql')
+
     def _show_toolbar(self, request):
         if getattr(settings, 'TEST', False):
             return False
@@ -10,7 +10,8 @@ from debug_toolbar.utils.compat.db import connections
 from debug_toolbar.middleware import DebugToolbarMiddleware
 from debug_toolbar.panels import DebugPanel
 from debug_toolbar.utils import sqlparse
-from debug_toolbar.utils.tracking.db import CursorWrapper
+from debug_toolbar.utils.tracking.db import CursorWrapper, \
+                                           ProfilingCursorWrapper, profiler
 from debug_toolbar.utils.tracking import replace_call
 
 
@@ -21,6 +22,8 @@ def cursor(func, self):
 
     djdt = DebugToolbarMiddleware.get_current()
     if not djdt:
+        if profiler is not None:
+            return ProfilingCursorWrapper(result, self, profiler)
         return result
     logger = djdt.get_panel(SQLDebugPanel)
 
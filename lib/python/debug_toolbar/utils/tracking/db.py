@@ -1,13 +1,19 @@
+import logging
+import os
+import re
+import socket
 import sys
 
 from datetime import datetime
-from threading import local
+from threading import local, Lock
+from time import time
 
 from django.conf import settings
 from django.template import Node
 from django.utils import simplejson
 from django.utils.encoding import force_unicode, smart_str
 from django.utils.hashcompat import sha_constructor
+from django.utils.importlib import import_module
 
 from debug_toolbar.utils import ms_from_timedelta, tidy_stacktrace, \
                                 get_template_info, get_stack
@@ -17,6 +23,17 @@ from debug_toolbar.utils.compat.db import connections
 SQL_WARNING_THRESHOLD = getattr(settings, 'DEBUG_TOOLBAR_CONFIG', {}) \
                             .get('SQL_WARNING_THRESHOLD', 500)
 
+# Production profiling of the queries run outside of the toolbar, see
+# ``QueryProfiler``.
+SQL_PROFILE_CONFIG = {
+    'SQL_PROFILE': False,
+    'SQL_PROFILE_SINK': 'debug_toolbar.utils.tracking.db.LoggingSink',
+    'SQL_PROFILE_INTERVAL': 60,
+    'SQL_PROFILE_SAMPLE_RATE': 100,
+    'SQL_PROFILE_SLOW_THRESHOLD': SQL_WARNING_THRESHOLD,
+}
+SQL_PROFILE_CONFIG.update(getattr(settings, 'DEBUG_TOOLBAR_CONFIG', {}))
+
 
 class SQLQueryTriggered(Exception):
     """Thrown when template panel triggers a query"""
@@ -168,3 +185,247 @@ class NormalCursorWrapper(object):
 
     def __iter__(self):
         return iter(self.cursor)
+
+
+class ProfilingCursorWrapper(object):
+    """
+    Wraps a cursor and passes the duration of queries on to a
+    ``QueryProfiler``, doing as little as possible for every query.
+    """
+
+    def __init__(self, cursor, db, profiler):
+        self.cursor = cursor
+        self.alias = getattr(db, 'alias', 'default')
+        self.profiler = profiler
+
+    def execute(self, sql, params=()):
+        __traceback_hide__ = True
+        start = time()
+        try:
+            return self.cursor.execute(sql, params)
+        finally:
+            stop = time()
+            self.profiler.add(self.alias, sql, (stop - start) * 1000, stop)
+
+    def executemany(self, sql, param_list):
+        __traceback_hide__ = True
+        start = time()
+        try:
+            return self.cursor.executemany(sql, param_list)
+        finally:
+            stop = time()
+            self.profiler.add(self.alias, sql, (stop - start) * 1000, stop)
+
+    def __getattr__(self, attr):
+        if attr in self.__dict__:
+            return self.__dict__[attr]
+        else:
+            return getattr(self.cursor, attr)
+
+    def __iter__(self):
+        return iter(self.cursor)
+
+
+_fingerprint_subs = (
+    (re.compile(r"'(?:[^']|'')*'"), '?'),
+    (re.compile(r'\b\d+(?:\.\d+)?\b'), '?'),
+    (re.compile(r'%s'), '?'),
+    (re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)'), '(...)'),
+    (re.compile(r'\s+'), ' '),
+)
+
+
+def fingerprint(sql):
+    """
+    Returns ``sql`` with literals and parameters replaced by ``?`` and
+    ``IN`` lists collapsed, so that queries differing only in their
+    values have the same fingerprint.
+    """
+    sql = smart_str(sql)
+    for regex, repl in _fingerprint_subs:
+        sql = regex.sub(repl, sql)
+    return sql.strip()
+
+
+class QueryProfiler(object):
+    """
+    Aggregates the queries run by this process, cheap enough to leave on
+    in production.
+
+    For every query only the duration is recorded, grouped by the SQL
+    (which for ORM queries only differs by the parameters). Every
+    ``interval`` seconds the groups are merged by ``fingerprint`` and
+    passed to ``sink.send``. A stack trace is kept for 1 in
+    ``sample_rate`` queries and for the slowest query above
+    ``slow_threshold`` milliseconds.
+
+    The 95th percentile is computed from the last ``max_durations``
+    durations of each query.
+    """
+    max_durations = 1000
+
+    def __init__(self, sink, interval=60, sample_rate=100,
+                 slow_threshold=SQL_WARNING_THRESHOLD):
+        self.sink = sink
+        self.interval = interval
+        self.sample_rate = sample_rate
+        self.slow_threshold = slow_threshold
+        self._lock = Lock()
+        self._stats = {}
+        self._counter = 0
+        self._last_export = time()
+
+    def add(self, alias, sql, duration, now):
+        __traceback_hide__ = True
+        key = (alias, sql)
+        self._lock.acquire()
+        try:
+            # [count, total time, durations, stack trace, stack duration]
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = [0, 0, [], None, 0]
+            count = stats[0]
+            stats[0] = count + 1
+            stats[1] += duration
+            if count < self.max_durations:
+                stats[2].append(duration)
+            else:
+                stats[2][count % self.max_durations] = duration
+            self._counter += 1
+            sample = (not self._counter % self.sample_rate
+                            and stats[3] is None) \
+                     or (duration > self.slow_threshold
+                            and duration > stats[4])
+        finally:
+            self._lock.release()
+        if sample:
+            stats[3] = tidy_stacktrace(reversed(get_stack()))
+            stats[4] = duration
+        if now - self._last_export >= self.interval:
+            self.export(now)
+
+    def export(self, now=None):
+        """
+        Sends the queries aggregated since the last export to the sink.
+        """
+        now = now or time()
+        self._lock.acquire()
+        try:
+            stats, self._stats = self._stats, {}
+            self._last_export = now
+        finally:
+            self._lock.release()
+        if stats:
+            try:
+                self.sink.send(self.aggregate(stats))
+            except Exception, e:
+                logging.exception(e)
+
+    def aggregate(self, stats):
+        merged = {}
+        for (alias, sql), (count, total, durations, stacktrace,
+                           stack_duration) in stats.iteritems():
+            key = (alias, fingerprint(sql))
+            query = merged.get(key)
+            if query is None:
+                query = merged[key] = {
+                    'alias': alias,
+                    'fingerprint': key[1],
+                    'count': 0,
+                    'total_time': 0,
+                    'durations': [],
+                    'stacktrace': None,
+                    'stack_duration': -1,
+                }
+            query['count'] += count
+            query['total_time'] += total
+            query['durations'].extend(durations)
+            if stacktrace is not None and \
+                    stack_duration > query['stack_duration']:
+                query['stacktrace'] = stacktrace
+                query['stack_duration'] = stack_duration
+        pid = os.getpid()
+        queries = merged.values()
+        for query in queries:
+            durations = sorted(query.pop('durations'))
+            query['p95_time'] = durations[int(len(durations) * 0.95)]
+            query['pid'] = pid
+            del query['stack_duration']
+        queries.sort(key=lambda q: q['total_time'], reverse=True)
+        return queries
+
+
+class LoggingSink(object):
+    """
+    Logs the exported queries, most time consuming first.
+    """
+    logger = logging.getLogger('debug_toolbar.sql_profile')
+
+    def send(self, queries):
+        for query in queries:
+            self.logger.info(
+                '[%s] %s: %d queries, %.2fms total, %.2fms p95: %s',
+                query['pid'], query['alias'], query['count'],
+                query['total_time'], query['p95_time'],
+                query['fingerprint'], extra={'data': query})
+
+
+class CacheSink(object):
+    """
+    Stores the last exported queries of each process in the cache, under
+    ``<key_prefix>.<hostname>.<pid>``.
+    """
+
+    def __init__(self, key_prefix='debug_toolbar.sql_profile', timeout=None):
+        self.key_prefix = key_prefix
+        self.timeout = timeout
+
+    def send(self, queries):
+        from django.core.cache import cache
+        key = '%s.%s.%s' % (self.key_prefix, socket.gethostname(),
+                            os.getpid())
+        cache.set(key, queries, self.timeout)
+
+
+class StatsdSink(object):
+    """
+    Sends the count, total and 95th percentile time of the exported
+    queries to statsd as gauges, named by a hash of the fingerprint.
+    """
+
+    def __init__(self, host='localhost', port=8125,
+                 prefix='debug_toolbar.sql'):
+        self.addr = (host, port)
+        self.prefix = prefix
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def send(self, queries):
+        for query in queries:
+            name = '%s.%s.%s' % (self.prefix, query['alias'], sha_constructor(
+                query['fingerprint']).hexdigest()[:12])
+            data = '%s.count:%d|g\n%s.total_time:%f|g\n%s.p95_time:%f|g' % (
+                name, query['count'], name, query['total_time'],
+                name, query['p95_time'])
+            try:
+                self.socket.sendto(data, self.addr)
+            except socket.error:
+                pass
+
+
+def get_profiler(config=SQL_PROFILE_CONFIG):
+    """
+    Returns the ``QueryProfiler`` configured by the ``SQL_PROFILE*``
+    settings in ``DEBUG_TOOLBAR_CONFIG``, or ``None`` if disabled.
+    """
+    if not config['SQL_PROFILE']:
+        return None
+    sink = config['SQL_PROFILE_SINK']
+    if isinstance(sink, basestring):
+        module, attr = sink.rsplit('.', 1)
+        sink = getattr(import_module(module), attr)()
+    return QueryProfiler(sink,
+                         interval=config['SQL_PROFILE_INTERVAL'],
+                         sample_rate=config['SQL_PROFILE_SAMPLE_RATE'],
+                         slow_threshold=config['SQL_PROFILE_SLOW_THRESHOLD'])
+
+profiler = get_profiler()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+
+"""
+bench_templates.py [n]
+
+Compares how long it takes to render templates with the tree-walking renderer
+and with the compiled templates enabled by the TEMPLATE_COMPILE setting.
+"""
+
+import sys
+import time
+
+from django.conf import settings
+
+TEMPLATES = (
+    ('variables', u'{{ user.name }} {{ user.email|lower }} {{ title|upper }} '
+                  u'{{ missing|default:"none" }} {{ user.profile.bio|truncatewords:5 }}'),
+    ('loop', u'<ul>{% for row in rows %}<li class="{% if forloop.first %}first'
+             u'{% endif %}">{{ forloop.counter }}. {{ row.name|capfirst }} '
+             u'({{ row.count }}){% if row.tags %}: {{ row.tags|join:", " }}'
+             u'{% endif %}</li>{% empty %}<li>none</li>{% endfor %}</ul>'),
+    ('nested loop', u'<table>{% for row in rows %}<tr>{% for cell in row.cells %}'
+                    u'<td>{{ cell }}</td>{% endfor %}</tr>{% endfor %}</table>'),
+    ('custom tags', u'{% for row in rows %}{% with name=row.name %}'
+                    u'{% cycle "odd" "even" %} {{ name }}{% endwith %}{% endfor %}'),
+)
+
+
+class Profile(object):
+    def __init__(self, bio):
+        self.bio = bio
+
+
+class User(object):
+    def __init__(self):
+        self.name = u'Jo <Doe>'
+        self.profile = Profile(u'Writes templates and benchmarks them on weekends.')
+
+    def email(self):
+        return u'JO@EXAMPLE.COM'
+
+
+def get_context():
+    from django.template import Context
+    rows = [{'name': u'row %d' % i, 'count': i, 'tags': [u'a', u'b&c'] * (i % 2),
+             'cells': range(10)} for i in range(100)]
+    return Context({'user': User(), 'title': u'Benchmark', 'rows': rows})
+
+
+def bench(source, n):
+    from django.template import Template
+    template = Template(source)
+    context = get_context()
+    start = time.time()
+    for i in xrange(n):
+        output = template.render(context)
+    return time.time() - start, output
+
+
+def main(argv=sys.argv):
+    n = len(argv) > 1 and int(argv[1]) or 1000
+    if not settings.configured:
+        settings.configure()
+    print '%-16s %12s %12s %8s' % ('template', 'tree (s)', 'compiled (s)', 'speedup')
+    for name, source in TEMPLATES:
+        settings.TEMPLATE_COMPILE = False
+        tree, expected = bench(source, n)
+        settings.TEMPLATE_COMPILE = True
+        compiled, output = bench(source, n)
+        assert output == expected, 'Compiled template %r renders differently.' % name
+        print '%-16s %12.3f %12.3f %7.2fx' % (name, tree, compiled, tree / compiled)
+
+if __name__ == '__main__':
+    main()
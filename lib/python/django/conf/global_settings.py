@@ -213,6 +213,10 @@ TEMPLATE_CONTEXT_PROCESSORS = (
 # Output to use in template system for invalid (e.g. misspelled) variables.
 TEMPLATE_STRING_IF_INVALID = ''
 
+# Whether to compile parsed templates to Python functions, which render faster
+# than walking the nodes. Ignored when TEMPLATE_DEBUG is True.
+TEMPLATE_COMPILE = False
+
 # Default email address to use for various automated correspondence from
 # the site managers.
 DEFAULT_FROM_EMAIL = 'webmaster@localhost'
@@ -454,6 +458,17 @@ MIDDLEWARE_CLASSES = (
 #     'django.middleware.gzip.GZipMiddleware',
 )
 
+# The zlib compression level (1-9) used by GZipMiddleware.
+GZIP_COMPRESS_LEVEL = 6
+
+# Responses shorter than this many bytes aren't compressed by GZipMiddleware.
+# Iterator responses are always compressed, as their length isn't known.
+GZIP_MIN_LENGTH = 200
+
+# Content type prefixes compressed by GZipMiddleware, e.g.
+# ('text/', 'application/json'). Empty to compress all content types.
+GZIP_CONTENT_TYPES = ()
+
 ############
 # SESSIONS #
 ############
@@ -498,6 +513,10 @@ PROFANITIES_LIST = ()
 
 AUTHENTICATION_BACKENDS = ('django.contrib.auth.backends.ModelBackend',)
 
+# The alias of the cache in which ModelBackend stores the permissions of
+# users between requests. None disables it.
+AUTH_PERMISSION_CACHE = None
+
 LOGIN_URL = '/accounts/login/'
 
 LOGOUT_URL = '/accounts/logout/'
@@ -613,6 +632,10 @@ STATICFILES_DIRS = ()
 # The default file storage backend used during the build process
 STATICFILES_STORAGE = 'django.contrib.staticfiles.storage.StaticFilesStorage'
 
+# The name of the manifest collectstatic keeps in STATICFILES_STORAGE to skip
+# unchanged files, e.g. 'staticfiles.json'. None to check every file.
+STATICFILES_MANIFEST = None
+
 # List of finder classes that know how to find static files in
 # various locations.
 STATICFILES_FINDERS = (
@@ -320,6 +320,7 @@ class ModelAdmin(BaseModelAdmin):
     save_as = False
     save_on_top = False
     paginator = Paginator
+    list_count_strategy = None
     inlines = []
 
     # Custom templates (designed to be over-ridden in subclasses)
@@ -507,6 +508,9 @@ class ModelAdmin(BaseModelAdmin):
             yield inline.get_formset(request, obj)
 
     def get_paginator(self, request, queryset, per_page, orphans=0, allow_empty_first_page=True):
+        if self.list_count_strategy is not None:
+            return self.paginator(queryset, per_page, orphans, allow_empty_first_page,
+                                  count_strategy=self.list_count_strategy)
         return self.paginator(queryset, per_page, orphans, allow_empty_first_page)
 
     def log_addition(self, request, object):
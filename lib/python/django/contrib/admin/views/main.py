@@ -162,6 +162,7 @@ class ChangeList(object):
         paginator = self.model_admin.get_paginator(request, self.query_set, self.list_per_page)
         # Get the number of objects, with admin filters applied.
         result_count = paginator.count
+        result_count_display = getattr(paginator, 'display_count', result_count)
 
         # Get the total number of objects, with no admin filters applied.
         # Perform a slight optimization: Check to see whether any filters were
@@ -170,9 +171,14 @@ class ChangeList(object):
         if not self.query_set.query.where:
             full_result_count = result_count
         else:
-            full_result_count = self.root_query_set.count()
-
-        can_show_all = result_count <= self.list_max_show_all
+            # Counted by the paginator too, so that the count strategy of
+            # the ModelAdmin applies.
+            full_result_count = self.model_admin.get_paginator(
+                request, self.root_query_set, self.list_per_page).count
+
+        # Only show all if the count is known to be small enough.
+        can_show_all = (result_count <= self.list_max_show_all and
+                        getattr(paginator, 'count_is_exact', True))
         multi_page = result_count > self.list_per_page
 
         # Get the list of objects to display on this page.
@@ -185,6 +191,7 @@ class ChangeList(object):
                 raise IncorrectLookupParameters
 
         self.result_count = result_count
+        self.result_count_display = result_count_display
         self.full_result_count = full_result_count
         self.result_list = result_list
         self.can_show_all = can_show_all
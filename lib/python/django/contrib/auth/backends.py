@@ -1,4 +1,6 @@
 from django.contrib.auth.models import User, Permission
+from django.contrib.auth.permission_cache import (get_permission_cache,
+    get_cached_permissions, set_cached_permissions)
 
 
 class ModelBackend(object):
@@ -25,22 +27,47 @@ class ModelBackend(object):
         if user_obj.is_anonymous() or obj is not None:
             return set()
         if not hasattr(user_obj, '_group_perm_cache'):
-            if user_obj.is_superuser:
-                perms = Permission.objects.all()
-            else:
-                perms = Permission.objects.filter(group__user=user_obj)
-            perms = perms.values_list('content_type__app_label', 'codename').order_by()
-            user_obj._group_perm_cache = set(["%s.%s" % (ct, name) for ct, name in perms])
+            if not self._load_cached_permissions(user_obj):
+                user_obj._group_perm_cache = self._get_group_permissions(user_obj)
         return user_obj._group_perm_cache
 
     def get_all_permissions(self, user_obj, obj=None):
         if user_obj.is_anonymous() or obj is not None:
             return set()
         if not hasattr(user_obj, '_perm_cache'):
-            user_obj._perm_cache = set([u"%s.%s" % (p.content_type.app_label, p.codename) for p in user_obj.user_permissions.select_related()])
-            user_obj._perm_cache.update(self.get_group_permissions(user_obj))
+            if not self._load_cached_permissions(user_obj):
+                user_obj._perm_cache = self._get_user_permissions(user_obj)
+                user_obj._perm_cache.update(self.get_group_permissions(user_obj))
         return user_obj._perm_cache
 
+    def _get_group_permissions(self, user_obj):
+        if user_obj.is_superuser:
+            perms = Permission.objects.all()
+        else:
+            perms = Permission.objects.filter(group__user=user_obj)
+        perms = perms.values_list('content_type__app_label', 'codename').order_by()
+        return set(["%s.%s" % (ct, name) for ct, name in perms])
+
+    def _get_user_permissions(self, user_obj):
+        return set([u"%s.%s" % (p.content_type.app_label, p.codename) for p in user_obj.user_permissions.select_related()])
+
+    def _load_cached_permissions(self, user_obj):
+        """
+        Sets both permission caches of user_obj from the cache given by the
+        AUTH_PERMISSION_CACHE setting, computing and storing them on a miss.
+        Returns False if that setting isn't set.
+        """
+        cache = get_permission_cache()
+        if cache is None:
+            return False
+        versions, perms = get_cached_permissions(cache, user_obj)
+        if perms is None:
+            group_perms = self._get_group_permissions(user_obj)
+            perms = (group_perms, self._get_user_permissions(user_obj) | group_perms)
+            set_cached_permissions(cache, user_obj, versions, perms)
+        user_obj._group_perm_cache, user_obj._perm_cache = perms
+        return True
+
     def has_perm(self, user_obj, perm, obj=None):
         if not user_obj.is_active:
             return False
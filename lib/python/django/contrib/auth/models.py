@@ -3,6 +3,7 @@ import urllib
 from django.core.exceptions import ImproperlyConfigured
 from django.core.mail import send_mail
 from django.db import models
+from django.db.models.signals import post_save, post_delete, m2m_changed
 from django.db.models.manager import EmptyManager
 from django.utils.crypto import get_random_string
 from django.utils.encoding import smart_str
@@ -13,6 +14,7 @@ from django.contrib import auth
 # UNUSABLE_PASSWORD is still imported here for backwards compatibility
 from django.contrib.auth.hashers import (
     check_password, make_password, is_password_usable, UNUSABLE_PASSWORD)
+from django.contrib.auth.permission_cache import invalidate_permissions
 from django.contrib.auth.signals import user_logged_in
 from django.contrib.contenttypes.models import ContentType
 
@@ -474,3 +476,47 @@ class AnonymousUser(object):
 
     def is_authenticated(self):
         return False
+
+
+def invalidate_permission_cache(sender, **kwargs):
+    """
+    A signal receiver which invalidates the cached permissions of all
+    users when a permission changes or a group is deleted.
+    """
+    invalidate_permissions()
+post_save.connect(invalidate_permission_cache, sender=Permission)
+post_delete.connect(invalidate_permission_cache, sender=Permission)
+post_delete.connect(invalidate_permission_cache, sender=Group)
+
+
+def invalidate_group_permission_cache(sender, action, **kwargs):
+    """
+    A signal receiver which invalidates the cached permissions of all
+    users when the permissions of a group change.
+    """
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate_permissions()
+m2m_changed.connect(invalidate_group_permission_cache,
+                    sender=Group.permissions.through)
+
+
+def invalidate_user_permission_cache(sender, instance, action, reverse,
+                                     pk_set, **kwargs):
+    """
+    A signal receiver which invalidates the cached permissions of the
+    users whose groups or permissions change.
+    """
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        invalidate_permissions([instance.pk])
+    elif pk_set is not None:
+        invalidate_permissions(pk_set)
+    else:
+        # Cleared from the group or permission side; the affected users
+        # are no longer known.
+        invalidate_permissions()
+m2m_changed.connect(invalidate_user_permission_cache,
+                    sender=User.groups.through)
+m2m_changed.connect(invalidate_user_permission_cache,
+                    sender=User.user_permissions.through)
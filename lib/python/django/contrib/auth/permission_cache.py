@@ -0,0 +1,104 @@
+"""
+A cache of the permissions computed by ``ModelBackend``, shared between
+requests and processes.
+
+Enabled by setting ``AUTH_PERMISSION_CACHE`` to the alias of one of the
+``CACHES``. The permission sets of a user are stored together with the
+global version and the version of that user they were computed at; both
+versions are changed by the signal receivers in
+``django.contrib.auth.models`` whenever permissions, groups or their
+assignments change, so stale entries are never used. Looking up the
+permissions of a user takes a single ``get_many`` call.
+"""
+import uuid
+
+from django.conf import settings
+from django.core.cache import get_cache
+
+KEY_PREFIX = 'django.contrib.auth.perms'
+GLOBAL_VERSION_KEY = '%s.version' % KEY_PREFIX
+
+_caches = {}
+
+
+def get_permission_cache():
+    """
+    Returns the cache set by ``AUTH_PERMISSION_CACHE``, or None if the
+    permission cache isn't enabled.
+    """
+    alias = getattr(settings, 'AUTH_PERMISSION_CACHE', None)
+    if not alias:
+        return None
+    try:
+        return _caches[alias]
+    except KeyError:
+        cache = _caches[alias] = get_cache(alias)
+        return cache
+
+
+def _user_keys(user_id):
+    return ('%s.version.%s' % (KEY_PREFIX, user_id),
+            '%s.%s' % (KEY_PREFIX, user_id))
+
+
+def _new_version():
+    return uuid.uuid4().hex
+
+
+def _get_or_add_version(cache, key):
+    version = _new_version()
+    if cache.add(key, version):
+        return version
+    return cache.get(key)
+
+
+def get_cached_permissions(cache, user):
+    """
+    Returns a ``(versions, permissions)`` tuple for ``user``, where
+    ``permissions`` is the ``(group_permissions, all_permissions)`` tuple
+    stored by ``set_cached_permissions``, or None if there is no valid
+    entry. ``versions`` should be passed on to ``set_cached_permissions``
+    after computing the permissions.
+    """
+    user_version_key, key = _user_keys(user.pk)
+    values = cache.get_many([GLOBAL_VERSION_KEY, user_version_key, key])
+    versions = (values.get(GLOBAL_VERSION_KEY), values.get(user_version_key))
+    entry = values.get(key)
+    if None not in versions:
+        if (entry is not None and
+                entry[:3] == versions + (user.is_superuser,)):
+            return versions, entry[3]
+        return versions, None
+    # The versions have to be read before the permissions are computed,
+    # otherwise a change made in between would go unnoticed.
+    versions = (
+        versions[0] or _get_or_add_version(cache, GLOBAL_VERSION_KEY),
+        versions[1] or _get_or_add_version(cache, user_version_key),
+    )
+    return versions, None
+
+
+def set_cached_permissions(cache, user, versions, permissions):
+    """
+    Stores the ``(group_permissions, all_permissions)`` tuple of ``user``,
+    computed after ``versions`` were returned by ``get_cached_permissions``.
+    """
+    if None in versions:
+        return
+    cache.set(_user_keys(user.pk)[1],
+              versions + (user.is_superuser, permissions))
+
+
+def invalidate_permissions(user_ids=None):
+    """
+    Invalidates the cached permissions of the users with the given ids,
+    or of all users if ``user_ids`` is None.
+    """
+    cache = get_permission_cache()
+    if cache is None:
+        return
+    if user_ids is None:
+        cache.set(GLOBAL_VERSION_KEY, _new_version())
+    else:
+        cache.set_many(dict((_user_keys(user_id)[0], _new_version())
+                            for user_id in user_ids))
@@ -1,6 +1,7 @@
 from django.contrib.auth.tests.auth_backends import (BackendTest,
     RowlevelBackendTest, AnonymousUserBackendTest, NoBackendsTest,
-    InActiveUserBackendTest, NoInActiveUserBackendTest)
+    InActiveUserBackendTest, NoInActiveUserBackendTest,
+    PermissionCacheBackendTest)
 from django.contrib.auth.tests.basic import BasicTestCase
 from django.contrib.auth.tests.context_processors import AuthContextProcessorTests
 from django.contrib.auth.tests.decorators import LoginRequiredTestCase
@@ -17,6 +18,8 @@ from django.contrib.auth.tests.models import (ProfileTestCase, NaturalKeysTestCa
     LoadDataWithoutNaturalKeysTestCase, LoadDataWithNaturalKeysTestCase,
     UserManagerTestCase)
 from django.contrib.auth.tests.hashers import TestUtilsHashPass
+from django.contrib.auth.tests.paginator import (KeysetPaginatorTest,
+    CountStrategyTest, ChangeListCountTest)
 from django.contrib.auth.tests.signals import SignalTestCase
 from django.contrib.auth.tests.tokens import TokenGeneratorTest
 from django.contrib.auth.tests.views import (AuthViewNamedURLTests,
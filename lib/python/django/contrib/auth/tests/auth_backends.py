@@ -1,5 +1,6 @@
 from django.conf import settings
 from django.contrib.auth.models import User, Group, Permission, AnonymousUser
+from django.contrib.auth.permission_cache import get_permission_cache
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ImproperlyConfigured
 from django.test import TestCase
@@ -98,6 +99,64 @@ class BackendTest(TestCase):
         user = User.objects.get(username='test2')
         self.assertEqual(len(user.get_all_permissions()), len(Permission.objects.all()))
 
+class PermissionCacheBackendTest(BackendTest):
+    """
+    Tests for ModelBackend with the shared permission cache enabled.
+    """
+
+    def setUp(self):
+        self.curr_cache = settings.AUTH_PERMISSION_CACHE
+        settings.AUTH_PERMISSION_CACHE = 'default'
+        get_permission_cache().clear()
+        super(PermissionCacheBackendTest, self).setUp()
+
+    def tearDown(self):
+        super(PermissionCacheBackendTest, self).tearDown()
+        get_permission_cache().clear()
+        settings.AUTH_PERMISSION_CACHE = self.curr_cache
+
+    def test_cached_between_instances(self):
+        user = User.objects.get(username='test')
+        content_type = ContentType.objects.get_for_model(Group)
+        perm = Permission.objects.create(name='test', content_type=content_type, codename='test')
+        user.user_permissions.add(perm)
+        self.assertEqual(user.get_all_permissions(), set([u'auth.test']))
+
+        user = User.objects.get(username='test')
+        self.assertNumQueries(0, user.get_all_permissions)
+        self.assertEqual(user.get_all_permissions(), set([u'auth.test']))
+        self.assertEqual(user.get_group_permissions(), set([]))
+
+    def test_invalidation(self):
+        user = User.objects.get(username='test')
+        content_type = ContentType.objects.get_for_model(Group)
+        perm = Permission.objects.create(name='test', content_type=content_type, codename='test')
+        group = Group.objects.create(name='test_group')
+        user.groups.add(group)
+        self.assertEqual(user.get_all_permissions(), set([]))
+
+        group.permissions.add(perm)
+        user = User.objects.get(username='test')
+        self.assertEqual(user.get_all_permissions(), set([u'auth.test']))
+
+        perm.codename = 'renamed'
+        perm.save()
+        user = User.objects.get(username='test')
+        self.assertEqual(user.get_all_permissions(), set([u'auth.renamed']))
+
+        group.user_set.remove(user)
+        user = User.objects.get(username='test')
+        self.assertEqual(user.get_all_permissions(), set([]))
+
+        user.user_permissions.add(perm)
+        user = User.objects.get(username='test')
+        self.assertEqual(user.get_all_permissions(), set([u'auth.renamed']))
+
+        perm.delete()
+        user = User.objects.get(username='test')
+        self.assertEqual(user.get_all_permissions(), set([]))
+
+
 class TestObj(object):
     pass
 
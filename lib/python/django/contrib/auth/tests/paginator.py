@@ -0,0 +1,152 @@
+from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.contrib.auth.models import User
+from django.core import signing
+from django.core.paginator import (Paginator, KeysetPaginator, InvalidPage,
+    CappedCount, ApproximateCount)
+from django.db import connection
+from django.test import TestCase
+from django.test.client import RequestFactory
+
+
+class PaginatorTestCase(TestCase):
+
+    def setUp(self):
+        # Few distinct names, so that the primary key has to break ties.
+        for i in range(13):
+            User.objects.create_user('user%02d' % i, 'user%02d@example.com' % i, 'test')
+            User.objects.filter(username='user%02d' % i).update(
+                first_name='first%d' % (i % 2), last_name='last%d' % (i % 3))
+
+class KeysetPaginatorTest(PaginatorTestCase):
+
+    def assertWalks(self, ordering, expected_ordering):
+        queryset = User.objects.all()
+        paginator = KeysetPaginator(queryset, 5, ordering=ordering)
+        self.assertEqual(paginator.ordering, expected_ordering)
+        expected = list(queryset.order_by(*expected_ordering))
+
+        # Forwards from the first page.
+        pages = [paginator.page()]
+        while pages[-1].has_next():
+            pages.append(paginator.page(pages[-1].next_cursor()))
+        self.assertEqual([len(page) for page in pages], [5, 5, 3])
+        self.assertEqual([obj for page in pages for obj in page], expected)
+        self.assertFalse(pages[0].has_previous())
+        self.assertEqual(pages[-1].next_cursor(), None)
+
+        # Backwards from the last page.
+        page = pages[-1]
+        seen = list(page)
+        while page.has_previous():
+            page = paginator.page(page.previous_cursor())
+            seen[:0] = list(page)
+            self.assertTrue(page.has_next())
+        self.assertEqual(seen, expected)
+        self.assertEqual(list(page), list(pages[0]))
+        self.assertEqual(page.previous_cursor(), None)
+
+    def test_ascending(self):
+        self.assertWalks(['last_name'], ('last_name', 'pk'))
+
+    def test_descending(self):
+        self.assertWalks(['-last_name'], ('-last_name', '-pk'))
+
+    def test_mixed(self):
+        self.assertWalks(['last_name', '-first_name'],
+                         ('last_name', '-first_name', '-pk'))
+        self.assertWalks(['-last_name', 'first_name', '-pk'],
+                         ('-last_name', 'first_name', '-pk'))
+
+    def test_default_ordering(self):
+        paginator = KeysetPaginator(User.objects.order_by('-username'), 5)
+        self.assertEqual(paginator.ordering, ('-username', '-pk'))
+
+    def test_invalid_cursor(self):
+        paginator = KeysetPaginator(User.objects.all(), 5, ordering=['last_name'])
+        cursor = paginator.page().next_cursor()
+        tampered = cursor[:-1] + (cursor[-1] == 'a' and 'b' or 'a')
+        self.assertRaises(InvalidPage, paginator.page, tampered)
+        self.assertRaises(InvalidPage, paginator.page, 'garbage')
+        # Correctly signed, but not a cursor of this ordering.
+        other = signing.dumps(['n', ['last1']], salt=KeysetPaginator.salt)
+        self.assertRaises(InvalidPage, paginator.page, other)
+        other = signing.dumps(['n', ['last1', 'x']], salt=KeysetPaginator.salt)
+        self.assertRaises(InvalidPage, paginator.page, other)
+
+class CountStrategyTest(PaginatorTestCase):
+
+    def test_capped_count(self):
+        queryset = User.objects.all()
+        self.assertEqual(CappedCount(20).count(queryset), (13, True))
+        self.assertEqual(CappedCount(13).count(queryset), (13, True))
+        self.assertEqual(CappedCount(10).count(queryset), (10, False))
+        self.assertEqual(CappedCount(10).count(range(13)), (10, False))
+        self.assertEqual(CappedCount(10).count(User.objects.none()), (0, True))
+        self.assertEqual(CappedCount(10).count(queryset.filter(pk__in=[])), (0, True))
+
+    def test_capped_count_paginator(self):
+        paginator = Paginator(User.objects.all(), 5, count_strategy=CappedCount(10))
+        self.assertEqual(paginator.count, 10)
+        self.assertFalse(paginator.count_is_exact)
+        self.assertEqual(paginator.display_count, u'10+')
+        self.assertEqual(paginator.num_pages, 2)
+
+        paginator = Paginator(User.objects.none(), 5, count_strategy=CappedCount(10))
+        self.assertEqual(paginator.count, 0)
+        self.assertEqual(list(paginator.page(1)), [])
+
+    def test_approximate_count(self):
+        strategy = ApproximateCount(threshold=10)
+        # SQLite keeps no statistics, so the count is exact.
+        self.assertEqual(strategy.count(User.objects.all()), (13, True))
+
+        original = connection.ops.estimated_row_count
+        connection.ops.estimated_row_count = lambda cursor, table_name: 1000
+        try:
+            self.assertEqual(strategy.count(User.objects.all()), (1000, False))
+            # Statistics are about the whole table; filtered querysets
+            # fall back to the exact count.
+            filtered = User.objects.filter(last_name='last0')
+            self.assertEqual(strategy.count(filtered), (5, True))
+            self.assertEqual(strategy.count(User.objects.all()[:3]), (3, True))
+            self.assertEqual(ApproximateCount(threshold=2000).count(User.objects.all()),
+                             (13, True))
+            self.assertEqual(strategy.format(1000, False), u'~1000')
+        finally:
+            connection.ops.estimated_row_count = original
+
+class CappedUserAdmin(admin.ModelAdmin):
+    list_count_strategy = CappedCount(10)
+    list_max_show_all = 20
+
+class ChangeListCountTest(PaginatorTestCase):
+
+    def get_changelist(self, model_admin, params=None):
+        request = RequestFactory().get('/', params or {})
+        return ChangeList(request, User, model_admin.list_display,
+            model_admin.list_display_links, model_admin.list_filter,
+            model_admin.date_hierarchy, model_admin.search_fields,
+            model_admin.list_select_related, model_admin.list_per_page,
+            model_admin.list_max_show_all, model_admin.list_editable,
+            model_admin)
+
+    def test_inexact_count(self):
+        cl = self.get_changelist(CappedUserAdmin(User, admin.AdminSite()))
+        self.assertEqual(cl.result_count, 10)
+        self.assertEqual(cl.result_count_display, u'10+')
+        # There are 13 users, so showing all isn't safe with a capped count.
+        self.assertFalse(cl.can_show_all)
+
+    def test_exact_count(self):
+        cl = self.get_changelist(CappedUserAdmin(User, admin.AdminSite()),
+                                 {'last_name': 'last0'})
+        self.assertEqual(cl.result_count, 5)
+        self.assertEqual(cl.result_count_display, u'5')
+        self.assertEqual(cl.full_result_count, 10)
+        self.assertTrue(cl.can_show_all)
+
+        cl = self.get_changelist(admin.ModelAdmin(User, admin.AdminSite()))
+        self.assertEqual(cl.result_count, 13)
+        self.assertEqual(cl.result_count_display, u'13')
+        self.assertTrue(cl.can_show_all)
@@ -4,12 +4,14 @@ import os
 import sys
 from optparse import make_option
 
+from django.conf import settings
 from django.core.files.storage import FileSystemStorage
 from django.core.management.base import CommandError, NoArgsCommand
 from django.utils.encoding import smart_str, smart_unicode
 from django.utils.datastructures import SortedDict
 
 from django.contrib.staticfiles import finders, storage
+from django.contrib.staticfiles.utils import Manifest, parallel_map
 
 
 class Command(NoArgsCommand):
@@ -42,6 +44,8 @@ class Command(NoArgsCommand):
             dest='use_default_ignore_patterns', default=True,
             help="Don't ignore the common private glob-style patterns 'CVS', "
                 "'.*' and '*~'."),
+        make_option('-j', '--workers', type='int', dest='workers', default=1,
+            help="The number of threads copying and post processing files."),
     )
     help = "Collect static files in a single location."
     requires_model_validation = False
@@ -52,6 +56,9 @@ class Command(NoArgsCommand):
         self.symlinked_files = []
         self.unmodified_files = []
         self.post_processed_files = []
+        # The paths handled so far, for fast lookups in the lists above
+        self.handled_files = set()
+        self.manifest = None
         self.storage = storage.staticfiles_storage
         try:
             self.storage.path('')
@@ -77,6 +84,7 @@ class Command(NoArgsCommand):
             ignore_patterns += ['CVS', '.*', '*~']
         self.ignore_patterns = list(set(ignore_patterns))
         self.post_process = options['post_process']
+        self.workers = max(1, int(options.get('workers') or 1))
 
     def collect(self):
         """
@@ -94,10 +102,10 @@ class Command(NoArgsCommand):
         if self.clear:
             self.clear_dir('')
 
-        if self.symlink:
-            handler = self.link_file
-        else:
-            handler = self.copy_file
+        if settings.STATICFILES_MANIFEST:
+            self.manifest = Manifest(self.storage, settings.STATICFILES_MANIFEST)
+            if not self.clear:
+                self.manifest.load()
 
         found_files = SortedDict()
         for finder in finders.get_finders():
@@ -110,13 +118,16 @@ class Command(NoArgsCommand):
 
                 if prefixed_path not in found_files:
                     found_files[prefixed_path] = (storage, path)
-                    handler(path, prefixed_path, storage)
+
+        parallel_map(self.collect_file, found_files.items(), self.workers)
 
         # Here we check if the storage backend has a post_process
         # method and pass it the list of modified files.
         if self.post_process and hasattr(self.storage, 'post_process'):
-            processor = self.storage.post_process(found_files,
-                                                  dry_run=self.dry_run)
+            options = {'dry_run': self.dry_run}
+            if self.manifest is not None or self.workers > 1:
+                options.update(manifest=self.manifest, workers=self.workers)
+            processor = self.storage.post_process(found_files, **options)
             for original_path, processed_path, processed in processor:
                 if processed:
                     self.log(u"Post-processed '%s' as '%s" %
@@ -125,6 +136,10 @@ class Command(NoArgsCommand):
                 else:
                     self.log(u"Skipped post-processing '%s'" % original_path)
 
+        if self.manifest is not None and not self.dry_run:
+            self.manifest.prune(found_files)
+            self.manifest.save()
+
         return {
             'modified': self.copied_files + self.symlinked_files,
             'unmodified': self.unmodified_files,
@@ -182,6 +197,22 @@ Type 'yes' to continue, or 'no' to cancel: """
             }
             self.stdout.write(smart_str(summary))
 
+    def collect_file(self, item):
+        """
+        Copies or links the file of a (prefixed_path, (storage, path)) item
+        of the found files, unless the manifest tells it's unchanged.
+        """
+        prefixed_path, (source_storage, path) = item
+        if (self.manifest is not None and
+                self.manifest.check(prefixed_path, source_storage, path, self.symlink)):
+            self.unmodified_files.append(prefixed_path)
+            self.log(u"Skipping '%s' (not modified)" % path)
+            return
+        if self.symlink:
+            self.link_file(path, prefixed_path, source_storage)
+        else:
+            self.copy_file(path, prefixed_path, source_storage)
+
     def log(self, msg, level=2):
         """
         Small log helper
@@ -213,35 +244,38 @@ Type 'yes' to continue, or 'no' to cancel: """
         Checks if the target file should be deleted if it already exists
         """
         if self.storage.exists(prefixed_path):
-            try:
-                # When was the target file modified last time?
-                target_last_modified = \
-                    self.storage.modified_time(prefixed_path)
-            except (OSError, NotImplementedError, AttributeError):
-                # The storage doesn't support ``modified_time`` or failed
-                pass
-            else:
+            # With a manifest, the source is already known to have changed.
+            if self.manifest is None:
                 try:
-                    # When was the source file modified last time?
-                    source_last_modified = source_storage.modified_time(path)
+                    # When was the target file modified last time?
+                    target_last_modified = \
+                        self.storage.modified_time(prefixed_path)
                 except (OSError, NotImplementedError, AttributeError):
+                    # The storage doesn't support ``modified_time`` or failed
                     pass
                 else:
-                    # The full path of the target file
-                    if self.local:
-                        full_path = self.storage.path(prefixed_path)
+                    try:
+                        # When was the source file modified last time?
+                        source_last_modified = source_storage.modified_time(path)
+                    except (OSError, NotImplementedError, AttributeError):
+                        pass
                     else:
-                        full_path = None
-                    # Skip the file if the source file is younger
-                    if target_last_modified >= source_last_modified:
-                        if not ((self.symlink and full_path
-                                 and not os.path.islink(full_path)) or
-                                (not self.symlink and full_path
-                                 and os.path.islink(full_path))):
-                            if prefixed_path not in self.unmodified_files:
-                                self.unmodified_files.append(prefixed_path)
-                            self.log(u"Skipping '%s' (not modified)" % path)
-                            return False
+                        # The full path of the target file
+                        if self.local:
+                            full_path = self.storage.path(prefixed_path)
+                        else:
+                            full_path = None
+                        # Skip the file if the source file is younger
+                        if target_last_modified >= source_last_modified:
+                            if not ((self.symlink and full_path
+                                     and not os.path.islink(full_path)) or
+                                    (not self.symlink and full_path
+                                     and os.path.islink(full_path))):
+                                if prefixed_path not in self.handled_files:
+                                    self.handled_files.add(prefixed_path)
+                                    self.unmodified_files.append(prefixed_path)
+                                self.log(u"Skipping '%s' (not modified)" % path)
+                                return False
             # Then delete the existing file if really needed
             if self.dry_run:
                 self.log(u"Pretending to delete '%s'" % path)
@@ -255,7 +289,7 @@ Type 'yes' to continue, or 'no' to cancel: """
         Attempt to link ``path``
         """
         # Skip this file if it was already copied earlier
-        if prefixed_path in self.symlinked_files:
+        if prefixed_path in self.handled_files:
             return self.log(u"Skipping '%s' (already linked earlier)" % path)
         # Delete the target file if needed or break
         if not self.delete_file(path, prefixed_path, source_storage):
@@ -273,7 +307,8 @@ Type 'yes' to continue, or 'no' to cancel: """
             except OSError:
                 pass
             os.symlink(source_path, full_path)
-        if prefixed_path not in self.symlinked_files:
+        if prefixed_path not in self.handled_files:
+            self.handled_files.add(prefixed_path)
             self.symlinked_files.append(prefixed_path)
 
     def copy_file(self, path, prefixed_path, source_storage):
@@ -281,7 +316,7 @@ Type 'yes' to continue, or 'no' to cancel: """
         Attempt to copy ``path`` with storage
         """
         # Skip this file if it was already copied earlier
-        if prefixed_path in self.copied_files:
+        if prefixed_path in self.handled_files:
             return self.log(u"Skipping '%s' (already copied earlier)" % path)
         # Delete the target file if needed or break
         if not self.delete_file(path, prefixed_path, source_storage):
@@ -301,5 +336,6 @@ Type 'yes' to continue, or 'no' to cancel: """
                     pass
             with source_storage.open(path) as source_file:
                 self.storage.save(prefixed_path, source_file)
-        if not prefixed_path in self.copied_files:
+        if not prefixed_path in self.handled_files:
+            self.handled_files.add(prefixed_path)
             self.copied_files.append(prefixed_path)
@@ -17,7 +17,8 @@ from django.utils.encoding import force_unicode, smart_str
 from django.utils.functional import LazyObject
 from django.utils.importlib import import_module
 
-from django.contrib.staticfiles.utils import check_settings, matches_patterns
+from django.contrib.staticfiles.utils import (check_settings, matches_patterns,
+                                             parallel_map)
 
 
 class StaticFilesStorage(FileSystemStorage):
@@ -131,9 +132,10 @@ class CachedFilesMixin(object):
 
         return unquote(final_url)
 
-    def url_converter(self, name):
+    def url_converter(self, name, dependencies=None):
         """
-        Returns the custom URL converter for the given file name.
+        Returns the custom URL converter for the given file name. The names
+        of the files it refers to are added to the ``dependencies`` list.
         """
         def converter(matchobj):
             """
@@ -164,6 +166,8 @@ class CachedFilesMixin(object):
                 else:
                     start, end = 1, sub_level - 1
             joined_result = '/'.join(name_parts[:-start] + url_parts[end:])
+            if dependencies is not None:
+                dependencies.append(unquote(joined_result))
             hashed_url = self.url(unquote(joined_result), force=True)
             file_name = hashed_url.split('/')[-1:]
             relative_url = '/'.join(url.split('/')[:-1] + file_name)
@@ -172,7 +176,8 @@ class CachedFilesMixin(object):
             return 'url("%s")' % unquote(relative_url)
         return converter
 
-    def post_process(self, paths, dry_run=False, **options):
+    def post_process(self, paths, dry_run=False, manifest=None, workers=1,
+                     **options):
         """
         Post process the given list of files (called from collectstatic).
 
@@ -185,66 +190,95 @@ class CachedFilesMixin(object):
 
         If either of these are performed on a file, then that file is considered
         post-processed.
+
+        Given the ``manifest`` of collectstatic, only the files that changed,
+        and the adjustable files referring to them, are processed again. Both
+        operations are run by ``workers`` threads.
         """
         # don't even dare to process the files if we're in dry run mode
         if dry_run:
             return
 
-        # where to store the new paths
-        hashed_paths = {}
-
         # build a list of adjustable files
         matches = lambda path: matches_patterns(path, self._patterns.keys())
-        adjustable_paths = [path for path in paths if matches(path)]
+        adjustable_paths = set([path for path in paths if matches(path)])
 
-        # then sort the files by the directory level
-        path_level = lambda name: len(name.split(os.sep))
-        for name in sorted(paths.keys(), key=path_level, reverse=True):
+        def is_current(name):
+            entry = manifest and manifest.entries.get(name)
+            return (entry is not None and name not in manifest.changed
+                    and 'hashed_name' in entry)
 
+        def hash_file(name):
+            if is_current(name):
+                return manifest.entries[name]['hashed_name'], False
             # use the original, local file, not the copied-but-unprocessed
             # file, which might be somewhere far away, like S3
             storage, path = paths[name]
             with storage.open(path) as original_file:
-
                 # generate the hash with the original content, even for
                 # adjustable files.
                 hashed_name = self.hashed_name(name, original_file)
-
-                # then get the original's file content..
+                if name in adjustable_paths:
+                    # saved once adjusted below
+                    return hashed_name, None
+                # or handle the case in which neither processing nor
+                # a change to the original file happened
+                if self.exists(hashed_name):
+                    return hashed_name, False
                 if hasattr(original_file, 'seek'):
                     original_file.seek(0)
+                saved_name = self._save(hashed_name, original_file)
+                return force_unicode(saved_name.replace('\\', '/')), True
 
-                hashed_file_exists = self.exists(hashed_name)
-                processed = False
+        def adjust_file(name):
+            dependencies = []
+            storage, path = paths[name]
+            with storage.open(path) as original_file:
+                content = original_file.read()
+            # apply each replacement pattern to the content
+            converter = self.url_converter(name, dependencies)
+            for patterns in self._patterns.values():
+                for pattern in patterns:
+                    content = pattern.sub(converter, content)
+            hashed_name = hashed_names[name]
+            if self.exists(hashed_name):
+                self.delete(hashed_name)
+            # then save the processed result
+            saved_name = self._save(hashed_name, ContentFile(smart_str(content)))
+            return force_unicode(saved_name.replace('\\', '/')), dependencies
 
-                # ..to apply each replacement pattern to the content
-                if name in adjustable_paths:
-                    content = original_file.read()
-                    converter = self.url_converter(name)
-                    for patterns in self._patterns.values():
-                        for pattern in patterns:
-                            content = pattern.sub(converter, content)
-                    if hashed_file_exists:
-                        self.delete(hashed_name)
-                    # then save the processed result
-                    content_file = ContentFile(smart_str(content))
-                    saved_name = self._save(hashed_name, content_file)
-                    hashed_name = force_unicode(saved_name.replace('\\', '/'))
-                    processed = True
-                else:
-                    # or handle the case in which neither processing nor
-                    # a change to the original file happened
-                    if not hashed_file_exists:
-                        processed = True
-                        saved_name = self._save(hashed_name, original_file)
-                        hashed_name = force_unicode(saved_name.replace('\\', '/'))
-
-                # and then set the cache accordingly
-                hashed_paths[self.cache_key(name)] = hashed_name
-                yield name, hashed_name, processed
-
-        # Finally set the cache
-        self.cache.set_many(hashed_paths)
+        # then sort the files by the directory level
+        path_level = lambda name: len(name.split(os.sep))
+        names = sorted(paths.keys(), key=path_level, reverse=True)
+
+        hashed_names, processed = {}, {}
+        for name, (hashed_name, was_processed) in zip(
+                names, parallel_map(hash_file, names, workers)):
+            hashed_names[name], processed[name] = hashed_name, was_processed
+
+        # set the cache before adjusting, so that references are converted
+        # to the new hashed names
+        self.cache.set_many(dict([(self.cache_key(name), hashed_name)
+                                  for name, hashed_name in hashed_names.items()]))
+
+        # adjust the files that changed or refer to files that changed
+        changed = manifest and manifest.changed
+        adjust = [name for name in names if processed[name] is None or
+                  (name in adjustable_paths and [dependency for dependency in
+                   manifest.entries[name].get('dependencies', ())
+                   if dependency in changed])]
+        for name, (hashed_name, dependencies) in zip(
+                adjust, parallel_map(adjust_file, adjust, workers)):
+            hashed_names[name], processed[name] = hashed_name, True
+            if manifest is not None:
+                manifest.entries[name]['dependencies'] = dependencies
+        self.cache.set_many(dict([(self.cache_key(name), hashed_names[name])
+                                  for name in adjust]))
+
+        for name in names:
+            if manifest is not None:
+                manifest.entries[name]['hashed_name'] = hashed_names[name]
+            yield name, hashed_names[name], processed[name]
 
 
 class CachedStaticFilesStorage(CachedFilesMixin, StaticFilesStorage):
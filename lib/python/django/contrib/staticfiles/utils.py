@@ -1,7 +1,15 @@
+from __future__ import with_statement
+
+import hashlib
 import os
 import fnmatch
+import sys
+import threading
+import Queue
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
+from django.core.files.base import ContentFile
+from django.utils import simplejson
 
 def matches_patterns(path, patterns=None):
     """
@@ -55,3 +63,124 @@ def check_settings(base_url=None):
             (settings.MEDIA_ROOT == settings.STATIC_ROOT)):
         raise ImproperlyConfigured("The MEDIA_ROOT and STATIC_ROOT "
                                    "settings must have different values")
+
+def parallel_map(func, items, workers=1):
+    """
+    Returns ``[func(item) for item in items]``, computed by up to
+    ``workers`` threads. The first exception raised by ``func`` stops the
+    workers and is raised again.
+    """
+    items = list(items)
+    if workers <= 1 or len(items) <= 1:
+        return map(func, items)
+    results = [None] * len(items)
+    errors = []
+    queue = Queue.Queue()
+    for item in enumerate(items):
+        queue.put(item)
+
+    def worker():
+        while not errors:
+            try:
+                i, item = queue.get_nowait()
+            except Queue.Empty:
+                return
+            try:
+                results[i] = func(item)
+            except Exception:
+                errors.append(sys.exc_info())
+
+    threads = [threading.Thread(target=worker)
+               for i in range(min(workers, len(items)))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0][0], errors[0][1], errors[0][2]
+    return results
+
+class Manifest(object):
+    """
+    Records the size, modification time and content hash of the source of
+    every collected file, with the name it was post-processed to and the
+    files it refers to, so that collectstatic can skip unchanged files
+    without looking at the target storage.
+
+    Stored as JSON in the target storage, under the name given by the
+    STATICFILES_MANIFEST setting.
+    """
+    version = 1
+
+    def __init__(self, storage, name):
+        self.storage = storage
+        self.name = name
+        self.entries = {}
+        # The paths whose source changed since the manifest was saved.
+        self.changed = set()
+        self.lock = threading.Lock()
+
+    def load(self):
+        if not self.storage.exists(self.name):
+            return
+        manifest = self.storage.open(self.name)
+        try:
+            try:
+                data = simplejson.loads(manifest.read())
+            except ValueError:
+                return
+        finally:
+            manifest.close()
+        if data.get('version') == self.version:
+            self.entries = data['files']
+
+    def save(self):
+        content = simplejson.dumps({'version': self.version,
+                                    'files': self.entries})
+        if self.storage.exists(self.name):
+            self.storage.delete(self.name)
+        self.storage.save(self.name, ContentFile(content))
+
+    def file_hash(self, source_path):
+        md5 = hashlib.md5()
+        source_file = open(source_path, 'rb')
+        try:
+            for chunk in iter(lambda: source_file.read(64 * 1024), ''):
+                md5.update(chunk)
+        finally:
+            source_file.close()
+        return md5.hexdigest()
+
+    def check(self, prefixed_path, source_storage, path, link=False):
+        """
+        Returns True if the source of ``prefixed_path`` is unchanged since
+        it was collected. Otherwise records the new source and marks the
+        path as changed.
+        """
+        source_path = source_storage.path(path)
+        stat = os.stat(source_path)
+        size, mtime = stat.st_size, int(stat.st_mtime)
+        entry = self.entries.get(prefixed_path)
+        if entry is not None and entry['link'] == link and entry['size'] == size:
+            if entry['mtime'] == mtime:
+                return True
+            # Touched, e.g. by a fresh checkout, but possibly not changed.
+            file_hash = self.file_hash(source_path)
+            if entry['hash'] == file_hash:
+                entry['mtime'] = mtime
+                return True
+        else:
+            file_hash = self.file_hash(source_path)
+        with self.lock:
+            self.entries[prefixed_path] = {
+                'size': size, 'mtime': mtime, 'hash': file_hash, 'link': link,
+            }
+            self.changed.add(prefixed_path)
+        return False
+
+    def prune(self, paths):
+        """
+        Forgets the files that aren't in ``paths`` any more.
+        """
+        for name in set(self.entries) - set(paths):
+            del self.entries[name]
@@ -0,0 +1,60 @@
+import os
+from optparse import make_option
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.encoding import smart_str
+
+
+class Command(BaseCommand):
+    option_list = BaseCommand.option_list + (
+        make_option('--domain', '-d', dest='domain', default='djangojs',
+            help='The gettext domain of the catalogs. Default is "djangojs".'),
+        make_option('--packages', '-p', dest='packages', default='django.conf',
+            help='The +-delimited packages to load translations from. '
+                 'Default is "django.conf".'),
+        make_option('--locale', '-l', dest='locales', action='append', default=[],
+            help='The language to write the catalog of. Use multiple times '
+                 'to write more. Default is all the LANGUAGES.'),
+        make_option('--output', '-o', dest='output',
+            help='The directory to write the catalogs to. Default is the '
+                 '"jsi18n" directory of STATIC_ROOT.'),
+    )
+    help = ('Writes the JavaScript translation catalog of each language to '
+            '<output>/<language>/<domain>.js, to be served as a static file '
+            'instead of by the javascript_catalog view.')
+
+    requires_model_validation = False
+
+    def handle(self, **options):
+        from django.conf import settings
+        from django.utils import translation
+        from django.views.i18n import (get_catalog_packages, get_catalog_paths,
+            render_javascript_catalog)
+
+        output = options.get('output')
+        if not output:
+            if not settings.STATIC_ROOT:
+                raise CommandError('Set the STATIC_ROOT setting or use --output.')
+            output = os.path.join(settings.STATIC_ROOT, 'jsi18n')
+        domain = options.get('domain')
+        languages = options.get('locales') or [code for code, name in settings.LANGUAGES]
+        paths = get_catalog_paths(get_catalog_packages(options.get('packages')))
+        verbosity = int(options.get('verbosity'))
+
+        for language in languages:
+            translation.activate(language)
+            try:
+                src = render_javascript_catalog(domain, paths)
+            finally:
+                translation.deactivate()
+            directory = os.path.join(output, language)
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+            filename = os.path.join(directory, '%s.js' % domain)
+            f = open(filename, 'w')
+            try:
+                f.write(smart_str(src))
+            finally:
+                f.close()
+            if verbosity > 0:
+                self.stdout.write('Wrote %s\n' % filename)
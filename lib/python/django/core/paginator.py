@@ -1,5 +1,8 @@
 from math import ceil
 
+from django.core import signing
+from django.core.exceptions import ValidationError
+
 class InvalidPage(Exception):
     pass
 
@@ -9,13 +12,114 @@ class PageNotAnInteger(InvalidPage):
 class EmptyPage(InvalidPage):
     pass
 
+class CountStrategy(object):
+    """
+    Counts the objects of a Paginator. Subclasses implement count(), which
+    returns a (count, exact) tuple.
+    """
+    # The format of a count that isn't exact.
+    inexact_format = u'%s'
+
+    def count(self, object_list):
+        raise NotImplementedError
+
+    def format(self, count, exact=True):
+        if exact:
+            return unicode(count)
+        return self.inexact_format % count
+
+class ExactCount(CountStrategy):
+    """
+    Counts all the objects, with COUNT(*) for a QuerySet. The default.
+    """
+    def count(self, object_list):
+        try:
+            return object_list.count(), True
+        except (AttributeError, TypeError):
+            # AttributeError if object_list has no count() method.
+            # TypeError if object_list.count() requires arguments
+            # (i.e. is of type list).
+            return len(object_list), True
+
+class CappedCount(CountStrategy):
+    """
+    Counts at most limit objects, so that the cost of counting doesn't
+    grow with the table. Larger counts are reported as limit, inexact
+    (shown as "10000+"), and the pages after it can't be reached.
+    """
+    inexact_format = u'%s+'
+
+    def __init__(self, limit=10000):
+        self.limit = int(limit)
+
+    def count(self, object_list):
+        if hasattr(object_list, 'query'):
+            count = self._count_queryset(object_list)
+        else:
+            count = len(object_list[:self.limit + 1])
+        if count > self.limit:
+            return self.limit, False
+        return count, True
+
+    def _count_queryset(self, queryset):
+        from django.db import connections
+        from django.db.models.query import EmptyQuerySet
+        from django.db.models.sql.datastructures import EmptyResultSet
+        if isinstance(queryset, EmptyQuerySet):
+            return 0
+        # QuerySet.count() ignores a slice when counting, so the limited
+        # query is counted in a subquery.
+        query = queryset.values('pk')[:self.limit + 1].query
+        try:
+            sql, params = query.get_compiler(queryset.db).as_sql()
+        except EmptyResultSet:
+            return 0
+        cursor = connections[queryset.db].cursor()
+        cursor.execute('SELECT COUNT(*) FROM (%s) subquery' % sql, params)
+        return cursor.fetchone()[0]
+
+class ApproximateCount(CountStrategy):
+    """
+    Estimates the number of rows of an unfiltered QuerySet from the
+    statistics of the database, which costs the same for any table size.
+    Falls back to the fallback strategy (ExactCount by default) for
+    filtered querysets, other object lists, databases without statistics
+    and estimates below threshold, where counting is cheap anyway.
+
+    The estimate may be off in either direction; the last pages may be
+    empty or miss some objects.
+    """
+    inexact_format = u'~%s'
+
+    def __init__(self, threshold=10000, fallback=None):
+        self.threshold = int(threshold)
+        self.fallback = fallback or ExactCount()
+
+    def count(self, object_list):
+        estimate = self.estimate(object_list)
+        if estimate is None or estimate < self.threshold:
+            return self.fallback.count(object_list)
+        return estimate, False
+
+    def estimate(self, object_list):
+        query = getattr(object_list, 'query', None)
+        if (query is None or query.where or query.having or query.distinct
+                or query.low_mark or query.high_mark is not None):
+            return None
+        from django.db import connections
+        connection = connections[object_list.db]
+        return connection.ops.estimated_row_count(connection.cursor(),
+                                                  query.model._meta.db_table)
+
 class Paginator(object):
-    def __init__(self, object_list, per_page, orphans=0, allow_empty_first_page=True):
+    def __init__(self, object_list, per_page, orphans=0, allow_empty_first_page=True,
+                 count_strategy=None):
         self.object_list = object_list
         self.per_page = int(per_page)
         self.orphans = int(orphans)
         self.allow_empty_first_page = allow_empty_first_page
-        self._num_pages = self._count = None
+        self.count_strategy = count_strategy or ExactCount()
+        self._num_pages = self._count = self._count_is_exact = None
 
     def validate_number(self, number):
         "Validates the given 1-based page number."
@@ -44,16 +148,21 @@ class Paginator(object):
     def _get_count(self):
         "Returns the total number of objects, across all pages."
         if self._count is None:
-            try:
-                self._count = self.object_list.count()
-            except (AttributeError, TypeError):
-                # AttributeError if object_list has no count() method.
-                # TypeError if object_list.count() requires arguments
-                # (i.e. is of type list).
-                self._count = len(self.object_list)
+            self._count, self._count_is_exact = self.count_strategy.count(self.object_list)
         return self._count
     count = property(_get_count)
 
+    def _get_count_is_exact(self):
+        "Returns False if count was capped or estimated by the count strategy."
+        self._get_count()
+        return self._count_is_exact
+    count_is_exact = property(_get_count_is_exact)
+
+    def _get_display_count(self):
+        "Returns count formatted for display, e.g. u'10000+' if capped."
+        return self.count_strategy.format(self.count, self.count_is_exact)
+    display_count = property(_get_display_count)
+
     def _get_num_pages(self):
         "Returns the total number of pages."
         if self._num_pages is None:
@@ -156,3 +265,129 @@ class Page(object):
         if self.number == self.paginator.num_pages:
             return self.paginator.count
         return self.number * self.paginator.per_page
+
+
+class KeysetPaginator(object):
+    """
+    Paginates a QuerySet by seeking past the last object of the previous
+    page on an ordered, unique tuple of fields, instead of with OFFSET, so
+    every page costs one query of per_page + 1 rows at any depth. There is
+    no count; pages are addressed by the opaque, signed cursor tokens of
+    KeysetPage.next_cursor() and KeysetPage.previous_cursor().
+
+    ordering defaults to the ordering of the QuerySet or its model; the
+    primary key is appended to it unless already included. The fields
+    must be local to the model and not nullable, and should be indexed
+    together in that order.
+    """
+    salt = 'django.core.paginator.KeysetPaginator'
+
+    def __init__(self, object_list, per_page, ordering=None):
+        self.object_list = object_list
+        self.per_page = int(per_page)
+        opts = object_list.model._meta
+        if ordering is None:
+            ordering = object_list.query.order_by or opts.ordering
+        ordering = list(ordering)
+        names = [name.lstrip('-') for name in ordering]
+        if 'pk' not in names and opts.pk.name not in names:
+            ordering.append(ordering and ordering[-1].startswith('-') and '-pk' or 'pk')
+        self.ordering = tuple(ordering)
+        self.fields = [name.lstrip('-') == 'pk' and opts.pk or
+                       opts.get_field(name.lstrip('-')) for name in self.ordering]
+
+    def page(self, cursor=None):
+        "Returns the KeysetPage at the given cursor, or the first one."
+        if cursor is None:
+            reverse = False
+            queryset = self.object_list.order_by(*self.ordering)
+        else:
+            reverse, values = self.decode_cursor(cursor)
+            queryset = self.object_list.filter(self._seek(values, reverse))
+            queryset = queryset.order_by(*self._ordering(reverse))
+        object_list = list(queryset[:self.per_page + 1])
+        more = len(object_list) > self.per_page
+        del object_list[self.per_page:]
+        if reverse:
+            object_list.reverse()
+            return KeysetPage(object_list, self, has_next=True, has_previous=more)
+        return KeysetPage(object_list, self, has_next=more,
+                          has_previous=cursor is not None)
+
+    def encode_cursor(self, obj, reverse=False):
+        "Returns the cursor of the page after obj, or before it if reverse."
+        values = [field.value_to_string(obj) for field in self.fields]
+        return signing.dumps([reverse and 'p' or 'n', values],
+                             salt=self.salt, compress=True)
+
+    def decode_cursor(self, cursor):
+        "Returns a (reverse, values) tuple for the given cursor."
+        try:
+            direction, values = signing.loads(cursor, salt=self.salt)
+            if len(values) != len(self.fields):
+                raise ValueError
+            values = [field.to_python(value)
+                      for field, value in zip(self.fields, values)]
+        except (signing.BadSignature, ValidationError, TypeError, ValueError):
+            raise InvalidPage('That cursor is not valid')
+        return direction == 'p', values
+
+    def _ordering(self, reverse):
+        if not reverse:
+            return self.ordering
+        return [name.startswith('-') and name[1:] or '-' + name
+                for name in self.ordering]
+
+    def _seek(self, values, reverse):
+        # (a, b) > (x, y) is a > x OR (a = x AND b > y), with each
+        # comparison following the direction of its field.
+        from django.db.models import Q
+        seek = None
+        for i, name in enumerate(self._ordering(reverse)):
+            lookups = dict([(str(prev.lstrip('-')), value)
+                            for prev, value in zip(self.ordering[:i], values)])
+            op = name.startswith('-') and 'lt' or 'gt'
+            lookups['%s__%s' % (name.lstrip('-'), op)] = values[i]
+            if seek is None:
+                seek = Q(**lookups)
+            else:
+                seek |= Q(**lookups)
+        return seek
+
+class KeysetPage(object):
+    def __init__(self, object_list, paginator, has_next, has_previous):
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __repr__(self):
+        return '<KeysetPage of %s objects>' % len(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def has_next(self):
+        return self._has_next and bool(self.object_list)
+
+    def has_previous(self):
+        return self._has_previous and bool(self.object_list)
+
+    def has_other_pages(self):
+        return self.has_previous() or self.has_next()
+
+    def next_cursor(self):
+        "Returns the cursor of the next page, or None if this is the last."
+        if self.has_next():
+            return self.paginator.encode_cursor(self.object_list[-1])
+
+    def previous_cursor(self):
+        "Returns the cursor of the previous page, or None if this is the first."
+        if self.has_previous():
+            return self.paginator.encode_cursor(self.object_list[0], reverse=True)
@@ -40,7 +40,8 @@ connection = DefaultConnectionProxy()
 backend = load_backend(connection.settings_dict['ENGINE'])
 
 # Register an event that closes the database connection
-# when a Django request is finished.
+# when a Django request is finished, unless the CONN_MAX_AGE
+# setting of the database allows to keep it for the next request.
 def close_connection(**kwargs):
     # Avoid circular imports
     from django.db import transaction
@@ -49,9 +50,16 @@ def close_connection(**kwargs):
         # state. Once a good db connection is again available, the
         # connection state will be cleaned up.
         transaction.abort(conn)
-        connections[conn].close()
+        connections[conn].close_if_unusable_or_obsolete(rollback=True)
 signals.request_finished.connect(close_connection)
 
+# Register an event that closes the persistent database connections
+# that got too old since the last request.
+def close_old_connections(**kwargs):
+    for conn in connections.all():
+        conn.close_if_unusable_or_obsolete()
+signals.request_started.connect(close_old_connections)
+
 # Register an event that resets connection.queries
 # when a Django request is started.
 def reset_queries(**kwargs):
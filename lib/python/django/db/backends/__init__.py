@@ -5,6 +5,7 @@ try:
 except ImportError:
     import dummy_thread as thread
 from contextlib import contextmanager
+from time import time
 
 from django.conf import settings
 from django.db import DEFAULT_DB_ALIAS
@@ -32,6 +33,10 @@ class BaseDatabaseWrapper(object):
         self.alias = alias
         self.use_debug_cursor = None
 
+        # Persistent connection related attributes, see CONN_MAX_AGE.
+        self.close_at = None
+        self.errors_occurred = False
+
         # Transaction related attributes
         self.transaction_state = []
         self.savepoint_state = 0
@@ -310,13 +315,61 @@ class BaseDatabaseWrapper(object):
             self.connection.close()
             self.connection = None
 
+    def is_usable(self):
+        """
+        Tests if the database connection still works, after errors occurred
+        on it. Backends that can't tell return False, so that the connection
+        is closed.
+        """
+        return False
+
+    def connection_opened(self):
+        """
+        Sets when the new connection must be closed, according to the
+        CONN_MAX_AGE setting (None keeps it open without a time limit).
+        """
+        max_age = self.settings_dict.get('CONN_MAX_AGE', 0)
+        self.close_at = None if max_age is None else time() + max_age
+        self.errors_occurred = False
+
+    def close_if_unusable_or_obsolete(self, rollback=False):
+        """
+        Closes the connection if it is older than CONN_MAX_AGE, or if errors
+        occurred and it doesn't work anymore. If `rollback` is True, a
+        transaction left open on a connection that is kept is rolled back.
+        """
+        if self.connection is None:
+            return
+        if self.close_at is None and \
+                self.settings_dict.get('CONN_MAX_AGE', 0) is not None:
+            # The connection wasn't opened through cursor().
+            self.connection_opened()
+        if self.close_at is not None and time() >= self.close_at:
+            self.close()
+            return
+        if rollback:
+            try:
+                self._rollback()
+            except Exception:
+                self.close()
+                return
+        if self.errors_occurred:
+            if self.is_usable():
+                self.errors_occurred = False
+            else:
+                self.close()
+
     def cursor(self):
         self.validate_thread_sharing()
+        connection = self.connection
+        raw_cursor = self._cursor()
+        if self.connection is not connection:
+            self.connection_opened()
         if (self.use_debug_cursor or
             (self.use_debug_cursor is None and settings.DEBUG)):
-            cursor = self.make_debug_cursor(self._cursor())
+            cursor = self.make_debug_cursor(raw_cursor)
         else:
-            cursor = util.CursorWrapper(self._cursor(), self)
+            cursor = util.CursorWrapper(raw_cursor, self)
         return cursor
 
     def make_debug_cursor(self, cursor):
@@ -613,6 +666,14 @@ class BaseDatabaseOperations(object):
 
         return smart_unicode(sql) % u_params
 
+    def estimated_row_count(self, cursor, table_name):
+        """
+        Returns the number of rows in the given table estimated from the
+        statistics of the database, without counting them, or None if the
+        database keeps no such statistics.
+        """
+        return None
+
     def last_insert_id(self, cursor, table_name, pk_name):
         """
         Given a cursor object that has just performed an INSERT statement into
@@ -230,6 +230,16 @@ class DatabaseOperations(BaseDatabaseOperations):
     def fulltext_search_sql(self, field_name):
         return 'MATCH (%s) AGAINST (%%s IN BOOLEAN MODE)' % field_name
 
+    def estimated_row_count(self, cursor, table_name):
+        # An estimate for InnoDB tables, exact for MyISAM ones.
+        cursor.execute("""
+            SELECT table_rows FROM information_schema.tables
+            WHERE table_schema = DATABASE() AND table_name = %s""", [table_name])
+        row = cursor.fetchone()
+        if row is None or row[0] is None:
+            return None
+        return int(row[0])
+
     def last_executed_query(self, cursor, sql, params):
         # With MySQLdb, cursor objects have an (undocumented) "_last_executed"
         # attribute where the exact query sent to the database is saved.
@@ -350,14 +360,22 @@ class DatabaseWrapper(BaseDatabaseWrapper):
 
     def _valid_connection(self):
         if self.connection is not None:
-            try:
-                self.connection.ping()
+            # Only ping the server after errors occurred on the connection.
+            if not self.errors_occurred or self.is_usable():
+                self.errors_occurred = False
                 return True
-            except DatabaseError:
-                self.connection.close()
-                self.connection = None
+            self.connection.close()
+            self.connection = None
         return False
 
+    def is_usable(self):
+        try:
+            self.connection.ping()
+        except DatabaseError:
+            return False
+        else:
+            return True
+
     def _cursor(self):
         new_connection = False
         if not self._valid_connection():
@@ -456,6 +456,15 @@ class DatabaseWrapper(BaseDatabaseWrapper):
     def _valid_connection(self):
         return self.connection is not None
 
+    def is_usable(self):
+        try:
+            # Use a cx_Oracle cursor directly, bypassing Django's utilities.
+            self.connection.cursor().execute("SELECT 1 FROM DUAL")
+        except Database.Error:
+            return False
+        else:
+            return True
+
     def _connect_string(self):
         settings_dict = self.settings_dict
         if not settings_dict['HOST'].strip():
@@ -148,6 +148,15 @@ class DatabaseWrapper(BaseDatabaseWrapper):
             )
             raise
 
+    def is_usable(self):
+        try:
+            # Use a psycopg cursor directly, bypassing Django's utilities.
+            self.connection.cursor().execute("SELECT 1")
+        except Database.Error:
+            return False
+        else:
+            return True
+
     def _get_pg_version(self):
         if self._pg_version is None:
             self._pg_version = get_version(self.connection)
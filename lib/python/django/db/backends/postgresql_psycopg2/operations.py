@@ -56,6 +56,15 @@ class DatabaseOperations(BaseDatabaseOperations):
             return 'HOST(%s)'
         return '%s'
 
+    def estimated_row_count(self, cursor, table_name):
+        # reltuples is maintained by VACUUM, ANALYZE and CREATE INDEX.
+        cursor.execute("SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+                       [self.quote_name(table_name)])
+        row = cursor.fetchone()
+        if row is None or row[0] < 0:
+            return None
+        return int(row[0])
+
     def last_insert_id(self, cursor, table_name, pk_name):
         # Use pg_get_serial_sequence to get the underlying sequence name
         # from the table name and column name (available since PostgreSQL 8)
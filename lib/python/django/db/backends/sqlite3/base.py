@@ -322,6 +322,9 @@ class DatabaseWrapper(BaseDatabaseWrapper):
                         % (table_name, bad_row[0], table_name, column_name, bad_row[1],
                         referenced_table_name, referenced_column_name))
 
+    def is_usable(self):
+        return True
+
     def close(self):
         self.validate_thread_sharing()
         # If database is in memory, closing the connection destroys the
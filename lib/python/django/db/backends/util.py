@@ -4,6 +4,7 @@ import hashlib
 from time import time
 
 from django.conf import settings
+from django.db.utils import DatabaseError
 from django.utils.log import getLogger
 from django.utils.timezone import utc
 
@@ -20,6 +21,23 @@ class CursorWrapper(object):
         if self.db.is_managed():
             self.db.set_dirty()
 
+    def execute(self, *args, **kwargs):
+        self.set_dirty()
+        try:
+            return self.cursor.execute(*args, **kwargs)
+        except DatabaseError:
+            # The connection is checked before it is reused.
+            self.db.errors_occurred = True
+            raise
+
+    def executemany(self, *args, **kwargs):
+        self.set_dirty()
+        try:
+            return self.cursor.executemany(*args, **kwargs)
+        except DatabaseError:
+            self.db.errors_occurred = True
+            raise
+
     def __getattr__(self, attr):
         self.set_dirty()
         if attr in self.__dict__:
@@ -38,6 +56,9 @@ class CursorDebugWrapper(CursorWrapper):
         start = time()
         try:
             return self.cursor.execute(sql, params)
+        except DatabaseError:
+            self.db.errors_occurred = True
+            raise
         finally:
             stop = time()
             duration = stop - start
@@ -55,6 +76,9 @@ class CursorDebugWrapper(CursorWrapper):
         start = time()
         try:
             return self.cursor.executemany(sql, param_list)
+        except DatabaseError:
+            self.db.errors_occurred = True
+            raise
         finally:
             stop = time()
             duration = stop - start
@@ -710,6 +710,15 @@ class HttpResponse(object):
 
     content = property(_get_content, _set_content)
 
+    def _get_streaming(self):
+        """
+        Returns True if the content is an iterator, which is consumed by
+        reading content or iterating over the response.
+        """
+        return self._base_content_is_iter
+
+    streaming = property(_get_streaming)
+
     def __iter__(self):
         self._iterator = iter(self._container)
         return self
@@ -108,8 +108,9 @@ class CommonMiddleware(object):
                                   fail_silently=True)
                 return response
 
-        # Use ETags, if requested.
-        if settings.USE_ETAGS:
+        # Use ETags, if requested. Streamed responses are left alone, as
+        # their content would have to be read to compute one.
+        if settings.USE_ETAGS and (response.has_header('ETag') or not response.streaming):
             if response.has_header('ETag'):
                 etag = response['ETag']
             else:
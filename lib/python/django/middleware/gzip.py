@@ -1,6 +1,8 @@
 import re
 
-from django.utils.text import compress_string
+from django.conf import settings
+from django.utils.encoding import smart_str
+from django.utils.text import compress_sequence, compress_string
 from django.utils.cache import patch_vary_headers
 
 re_accepts_gzip = re.compile(r'\bgzip\b')
@@ -10,10 +12,15 @@ class GZipMiddleware(object):
     This middleware compresses content if the browser allows gzip compression.
     It sets the Vary header accordingly, so that caches will base their storage
     on the Accept-Encoding header.
+
+    Responses whose content is an iterator are compressed chunk by chunk as
+    they are sent, without a Content-Length. The compression level, minimum
+    length and content types are set by the GZIP_COMPRESS_LEVEL,
+    GZIP_MIN_LENGTH and GZIP_CONTENT_TYPES settings.
     """
     def process_response(self, request, response):
         # It's not worth attempting to compress really short responses.
-        if len(response.content) < 200:
+        if not response.streaming and len(response.content) < settings.GZIP_MIN_LENGTH:
             return response
 
         patch_vary_headers(response, ('Accept-Encoding',))
@@ -22,9 +29,13 @@ class GZipMiddleware(object):
         if response.has_header('Content-Encoding'):
             return response
 
+        ctype = response.get('Content-Type', '').lower()
+        if settings.GZIP_CONTENT_TYPES:
+            if not [t for t in settings.GZIP_CONTENT_TYPES if ctype.startswith(t)]:
+                return response
+
         # MSIE have issues with gzipped response of various content types.
         if "msie" in request.META.get('HTTP_USER_AGENT', '').lower():
-            ctype = response.get('Content-Type', '').lower()
             if not ctype.startswith("text/") or "javascript" in ctype:
                 return response
 
@@ -32,15 +43,31 @@ class GZipMiddleware(object):
         if not re_accepts_gzip.search(ae):
             return response
 
-        # Return the compressed content only if it's actually shorter.
-        compressed_content = compress_string(response.content)
-        if len(compressed_content) >= len(response.content):
-            return response
+        if response.streaming:
+            response.content = self._compress_iterator(response._container,
+                                                       response._charset)
+            del response['Content-Length']
+        else:
+            # Return the compressed content only if it's actually shorter.
+            compressed_content = compress_string(response.content,
+                                                 settings.GZIP_COMPRESS_LEVEL)
+            if len(compressed_content) >= len(response.content):
+                return response
+            response.content = compressed_content
+            response['Content-Length'] = str(len(response.content))
 
         if response.has_header('ETag'):
             response['ETag'] = re.sub('"$', ';gzip"', response['ETag'])
 
-        response.content = compressed_content
         response['Content-Encoding'] = 'gzip'
-        response['Content-Length'] = str(len(response.content))
         return response
+
+    def _compress_iterator(self, container, charset):
+        try:
+            for chunk in compress_sequence(
+                    (smart_str(chunk, charset) for chunk in container),
+                    settings.GZIP_COMPRESS_LEVEL):
+                yield chunk
+        finally:
+            if hasattr(container, 'close'):
+                container.close()
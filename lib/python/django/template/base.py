@@ -150,7 +150,11 @@ def compile_string(template_string, origin):
         lexer_class, parser_class = Lexer, Parser
     lexer = lexer_class(template_string, origin)
     parser = parser_class(lexer.tokenize())
-    return parser.parse()
+    nodelist = parser.parse()
+    if settings.TEMPLATE_COMPILE:
+        from django.template.compiler import compile_nodelist
+        nodelist = compile_nodelist(nodelist)
+    return nodelist
 
 class Token(object):
     def __init__(self, token_type, contents):
@@ -0,0 +1,384 @@
+"""
+Compiles the NodeLists of parsed templates to Python functions.
+
+Enabled by the TEMPLATE_COMPILE setting. Instead of walking the nodes on each
+render, a compiled NodeList calls a function generated from them, in which:
+
+* text is a constant;
+* variable lookups are unrolled per call site, with a fast path for dicts
+  and for objects that only support attribute lookup;
+* filters are called directly, with their flags looked up once;
+* {% for %} and {% if %} are inlined, and a loop whose body is entirely
+  compiled reads its loop variable and ``forloop`` from Python locals.
+
+Any other node is rendered by calling its ``render()`` method, after its own
+child NodeLists have been compiled. The output, and the context seen by the
+nodes, are the same as with the tree-walking renderer.
+"""
+from types import InstanceType
+
+from django.conf import settings
+from django.template import base
+from django.template.base import (Node, NodeList, TextNode, VariableNode,
+    Variable, VariableDoesNotExist, _render_value_in_context)
+from django.template.defaulttags import ForNode, IfNode
+from django.utils.encoding import force_unicode
+from django.utils.html import escape
+from django.utils.safestring import (SafeData, EscapeData, mark_safe,
+    mark_for_escaping)
+from django.utils.timezone import localtime
+
+
+class CompiledNodeList(NodeList):
+    """
+    A NodeList rendered by a function compiled from its nodes.
+    """
+    def __init__(self, nodes, func):
+        super(CompiledNodeList, self).__init__(nodes)
+        self.func = func
+
+    def render(self, context):
+        return self.func(context)
+
+
+def compile_nodelist(nodelist):
+    """
+    Returns a CompiledNodeList rendering the same output as ``nodelist``.
+
+    Subclasses of NodeList, such as the DebugNodeList used when TEMPLATE_DEBUG
+    is set, are returned unchanged.
+    """
+    if type(nodelist) is not NodeList:
+        return nodelist
+    compiler = _Compiler()
+    compiler.emit(0, 'def render(context):')
+    compiler.emit(1, '_bits = []')
+    compiler.emit(1, '_append = _bits.append')
+    compiler.nodelist(nodelist, 1, {})
+    compiler.emit(1, "return _mark_safe(u''.join(_bits))")
+    source = '\n'.join(compiler.lines) + '\n'
+    exec compile(source, '<compiled template>', 'exec') in compiler.namespace
+    return CompiledNodeList(nodelist, compiler.namespace['render'])
+
+
+# Runtime helpers used by the generated code.
+
+# Whether the instances of a type may support item lookup.
+_item_lookup_types = {}
+
+
+def _lookup(current, bit):
+    "One step of Variable._resolve_lookup()."
+    cls = type(current)
+    if cls is dict:
+        if bit in current:
+            return current[bit]
+    else:
+        try:
+            item_lookup = _item_lookup_types[cls]
+        except KeyError:
+            item_lookup = _item_lookup_types[cls] = (
+                cls is InstanceType or hasattr(cls, '__getitem__'))
+        if not item_lookup:
+            try:
+                return getattr(current, bit)
+            except (TypeError, AttributeError):
+                raise VariableDoesNotExist("Failed lookup for key [%s] in %r",
+                                           (bit, current))
+    try:
+        return current[bit]
+    except (TypeError, AttributeError, KeyError):
+        try:
+            return getattr(current, bit)
+        except (TypeError, AttributeError):
+            try:
+                return current[int(bit)]
+            except (IndexError, ValueError, KeyError, TypeError):
+                raise VariableDoesNotExist("Failed lookup for key [%s] in %r",
+                                           (bit, current))
+
+
+def _call(current):
+    "Calls a callable found by a lookup, as Variable._resolve_lookup() does."
+    if getattr(current, 'do_not_call_in_templates', False):
+        return current
+    if getattr(current, 'alters_data', False):
+        return settings.TEMPLATE_STRING_IF_INVALID
+    try:
+        return current()
+    except TypeError:
+        return settings.TEMPLATE_STRING_IF_INVALID
+
+
+def _silent(e):
+    if getattr(e, 'silent_variable_failure', False):
+        return settings.TEMPLATE_STRING_IF_INVALID
+    raise
+
+
+def _invalid(var):
+    """
+    Returns the value of a variable that doesn't exist, as determined by
+    FilterExpression.resolve(), and whether its filters should be applied.
+    """
+    string_if_invalid = settings.TEMPLATE_STRING_IF_INVALID
+    if string_if_invalid:
+        if base.invalid_var_format_string is None:
+            base.invalid_var_format_string = '%s' in string_if_invalid
+        if base.invalid_var_format_string:
+            return string_if_invalid % var, False
+        return string_if_invalid, False
+    return string_if_invalid, True
+
+
+def _render_value(value, context):
+    if value.__class__ is unicode:
+        if context.autoescape:
+            return escape(value)
+        return value
+    return _render_value_in_context(value, context)
+
+
+_RUNTIME = {
+    '_lookup': _lookup,
+    '_call': _call,
+    '_silent': _silent,
+    '_invalid': _invalid,
+    '_render_value': _render_value,
+    '_force_unicode': force_unicode,
+    '_mark_safe': mark_safe,
+    '_mark_for_escaping': mark_for_escaping,
+    '_localtime': localtime,
+    '_SafeData': SafeData,
+    '_EscapeData': EscapeData,
+    '_VariableDoesNotExist': VariableDoesNotExist,
+}
+
+
+def _is_compiled(nodelist):
+    """
+    Returns True if every node in ``nodelist`` is compiled inline, so that
+    no other code can change the context while it is rendered.
+    """
+    for node in nodelist:
+        cls = type(node)
+        if cls is ForNode:
+            if not (_is_compiled(node.nodelist_loop) and
+                    _is_compiled(node.nodelist_empty)):
+                return False
+        elif cls is IfNode:
+            for condition, nodes in node.conditions_nodelists:
+                if not _is_compiled(nodes):
+                    return False
+        elif isinstance(node, Node) and cls not in (TextNode, VariableNode):
+            return False
+    return True
+
+
+class _Compiler(object):
+    def __init__(self):
+        self.lines = []
+        self.namespace = dict(_RUNTIME)
+        self.counter = 0
+
+    def emit(self, indent, line):
+        self.lines.append('    ' * indent + line)
+
+    def name(self, prefix):
+        self.counter += 1
+        return '%s%d' % (prefix, self.counter)
+
+    def constant(self, value):
+        name = self.name('_c')
+        self.namespace[name] = value
+        return name
+
+    def nodelist(self, nodelist, indent, scope):
+        """
+        Emits the code appending the output of the nodes to ``_bits``.
+        ``scope`` maps the names of variables known to be the topmost in the
+        context to the Python locals holding their values.
+        """
+        start = len(self.lines)
+        for node in nodelist:
+            cls = type(node)
+            if not isinstance(node, Node):
+                self.emit(indent, '_append(%s)' % self.constant(force_unicode(node)))
+            elif cls is TextNode:
+                self.emit(indent, '_append(%s)' % self.constant(force_unicode(node.s)))
+            elif cls is VariableNode:
+                self.variable_node(node, indent, scope)
+            elif cls is ForNode:
+                self.for_node(node, indent, scope)
+            elif cls is IfNode:
+                self.if_node(node, indent, scope)
+            else:
+                for attr in node.child_nodelists:
+                    child = getattr(node, attr, None)
+                    if isinstance(child, NodeList):
+                        setattr(node, attr, compile_nodelist(child))
+                self.emit(indent, '_append(_force_unicode(%s.render(context)))'
+                                  % self.constant(node))
+        if len(self.lines) == start:
+            self.emit(indent, 'pass')
+
+    def variable_node(self, node, indent, scope):
+        value = self.name('_v')
+        self.emit(indent, 'try:')
+        self.filter_expression(node.filter_expression, value, indent + 1, scope)
+        self.emit(indent, 'except UnicodeDecodeError:')
+        self.emit(indent + 1, "_append(u'')")
+        self.emit(indent, 'else:')
+        self.emit(indent + 1, '_append(_render_value(%s, context))' % value)
+
+    def filter_expression(self, expression, target, indent, scope,
+                          ignore_failures=False):
+        "Emits the code assigning the value of ``expression`` to ``target``."
+        var = expression.var
+        filters = expression.filters
+        if isinstance(var, Variable):
+            apply_filters = filters and self.name('_f') or '_f'
+            self.emit(indent, 'try:')
+            if var.lookups is not None and not var.translate:
+                self.lookups(var.lookups, target, indent + 1, scope)
+            else:
+                self.emit(indent + 1, '%s = %s.resolve(context)'
+                                      % (target, self.constant(var)))
+            if filters:
+                self.emit(indent + 1, '%s = True' % apply_filters)
+            self.emit(indent, 'except _VariableDoesNotExist:')
+            if ignore_failures:
+                self.emit(indent + 1, '%s, %s = None, True' % (target, apply_filters))
+            else:
+                self.emit(indent + 1, '%s, %s = _invalid(%s)'
+                                      % (target, apply_filters, self.constant(var)))
+            self.emit(indent, 'except Exception, _e:')
+            self.emit(indent + 1, '%s = _silent(_e)' % target)
+            if filters:
+                self.emit(indent + 1, '%s = True' % apply_filters)
+                self.emit(indent, 'if %s:' % apply_filters)
+                indent += 1
+        else:
+            self.emit(indent, '%s = %s' % (target, self.constant(var)))
+        for func, args in filters:
+            self.filter(func, args, target, indent)
+
+    def lookups(self, lookups, target, indent, scope):
+        first = lookups[0]
+        if first in scope:
+            self.emit(indent, '%s = %s' % (target, scope[first]))
+        else:
+            self.emit(indent, 'try:')
+            self.emit(indent + 1, '%s = context[%r]' % (target, first))
+            self.emit(indent, 'except KeyError:')
+            self.emit(indent + 1, '%s = _lookup(context, %r)' % (target, first))
+        self.emit(indent, 'if callable(%s):' % target)
+        self.emit(indent + 1, '%s = _call(%s)' % (target, target))
+        for bit in lookups[1:]:
+            self.emit(indent, '%s = _lookup(%s, %r)' % (target, target, bit))
+            self.emit(indent, 'if callable(%s):' % target)
+            self.emit(indent + 1, '%s = _call(%s)' % (target, target))
+
+    def filter(self, func, args, target, indent):
+        arg_names = [target]
+        for lookup, arg in args:
+            if not lookup:
+                arg_names.append(self.constant(mark_safe(arg)))
+            else:
+                name = self.name('_a')
+                self.emit(indent, '%s = %s.resolve(context)' % (name, self.constant(arg)))
+                arg_names.append(name)
+        if getattr(func, 'needs_autoescape', False):
+            arg_names.append('autoescape=context.autoescape')
+        if getattr(func, 'expects_localtime', False):
+            self.emit(indent, '%s = _localtime(%s, context.use_tz)' % (target, target))
+        result = self.name('_r')
+        self.emit(indent, '%s = %s(%s)' % (result, self.constant(func), ', '.join(arg_names)))
+        if getattr(func, 'is_safe', False):
+            self.emit(indent, 'if isinstance(%s, _SafeData):' % target)
+            self.emit(indent + 1, '%s = _mark_safe(%s)' % (target, result))
+            self.emit(indent, 'elif isinstance(%s, _EscapeData):' % target)
+        else:
+            self.emit(indent, 'if isinstance(%s, _EscapeData):' % target)
+        self.emit(indent + 1, '%s = _mark_for_escaping(%s)' % (target, result))
+        self.emit(indent, 'else:')
+        self.emit(indent + 1, '%s = %s' % (target, result))
+
+    def for_node(self, node, indent, scope):
+        # Mirrors ForNode.render().
+        values, len_values = self.name('_values'), self.name('_len')
+        loop_dict, i, item = self.name('_loop'), self.name('_i'), self.name('_item')
+        parentloop = self.name('_parentloop')
+        self.emit(indent, "if 'forloop' in context:")
+        self.emit(indent + 1, "%s = context['forloop']" % parentloop)
+        self.emit(indent, 'else:')
+        self.emit(indent + 1, '%s = {}' % parentloop)
+        self.emit(indent, 'context.push()')
+        self.emit(indent, 'try:')
+        self.filter_expression(node.sequence, values, indent + 1, scope,
+                               ignore_failures=True)
+        self.emit(indent, 'except _VariableDoesNotExist:')
+        self.emit(indent + 1, '%s = []' % values)
+        self.emit(indent, 'if %s is None:' % values)
+        self.emit(indent + 1, '%s = []' % values)
+        self.emit(indent, "if not hasattr(%s, '__len__'):" % values)
+        self.emit(indent + 1, '%s = list(%s)' % (values, values))
+        self.emit(indent, '%s = len(%s)' % (len_values, values))
+        self.emit(indent, 'if %s < 1:' % len_values)
+        self.emit(indent + 1, 'context.pop()')
+        self.nodelist(node.nodelist_empty, indent + 1, scope)
+        self.emit(indent, 'else:')
+        indent += 1
+        if node.is_reversed:
+            self.emit(indent, '%s = reversed(%s)' % (values, values))
+        self.emit(indent, "%s = context['forloop'] = {'parentloop': %s}"
+                          % (loop_dict, parentloop))
+        self.emit(indent, 'for %s, %s in enumerate(%s):' % (i, item, values))
+        body = indent + 1
+        self.emit(body, "%s['counter0'] = %s" % (loop_dict, i))
+        self.emit(body, "%s['counter'] = %s + 1" % (loop_dict, i))
+        self.emit(body, "%s['revcounter'] = %s - %s" % (loop_dict, len_values, i))
+        self.emit(body, "%s['revcounter0'] = %s - %s - 1" % (loop_dict, len_values, i))
+        self.emit(body, "%s['first'] = (%s == 0)" % (loop_dict, i))
+        self.emit(body, "%s['last'] = (%s == %s - 1)" % (loop_dict, i, len_values))
+        loop_scope = dict(scope)
+        for name in tuple(node.loopvars) + ('forloop',):
+            loop_scope.pop(name, None)
+        if len(node.loopvars) > 1:
+            pop_context, unpacked = self.name('_pop'), self.name('_unpacked')
+            self.emit(body, '%s = False' % pop_context)
+            self.emit(body, 'try:')
+            self.emit(body + 1, '%s = dict(zip(%s, %s))'
+                                % (unpacked, self.constant(node.loopvars), item))
+            self.emit(body, 'except TypeError:')
+            self.emit(body + 1, 'pass')
+            self.emit(body, 'else:')
+            self.emit(body + 1, '%s = True' % pop_context)
+            self.emit(body + 1, 'context.update(%s)' % unpacked)
+            self.nodelist(node.nodelist_loop, body, loop_scope)
+            self.emit(body, 'if %s:' % pop_context)
+            self.emit(body + 1, 'context.pop()')
+        else:
+            self.emit(body, 'context[%r] = %s' % (node.loopvars[0], item))
+            if _is_compiled(node.nodelist_loop):
+                loop_scope[node.loopvars[0]] = item
+                loop_scope['forloop'] = loop_dict
+            self.nodelist(node.nodelist_loop, body, loop_scope)
+        self.emit(indent, 'context.pop()')
+
+    def if_node(self, node, indent, scope):
+        # Mirrors IfNode.render().
+        for condition, nodelist in node.conditions_nodelists:
+            if condition is None:
+                self.nodelist(nodelist, indent, scope)
+                return
+            match = self.name('_m')
+            self.emit(indent, 'try:')
+            self.emit(indent + 1, '%s = %s.eval(context)' % (match, self.constant(condition)))
+            self.emit(indent, 'except _VariableDoesNotExist:')
+            self.emit(indent + 1, '%s = None' % match)
+            self.emit(indent, 'if %s:' % match)
+            self.nodelist(nodelist, indent + 1, scope)
+            self.emit(indent, 'else:')
+            indent += 1
+        self.emit(indent, 'pass')
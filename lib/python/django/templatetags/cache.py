@@ -6,6 +6,10 @@ from django.utils.http import urlquote
 
 register = Library()
 
+# The name of the context variable holding the PrefetchedFragments of
+# the enclosing {% cache_prefetch %} tag. Templates can't refer to it.
+PREFETCH_VAR = '_cache_prefetch'
+
 class CacheNode(Node):
     def __init__(self, nodelist, expire_time_var, fragment_name, vary_on):
         self.nodelist = nodelist
@@ -13,24 +17,94 @@ class CacheNode(Node):
         self.fragment_name = fragment_name
         self.vary_on = vary_on
 
-    def render(self, context):
+    def get_expire_time(self, context):
         try:
             expire_time = self.expire_time_var.resolve(context)
         except VariableDoesNotExist:
             raise TemplateSyntaxError('"cache" tag got an unknown variable: %r' % self.expire_time_var.var)
         try:
-            expire_time = int(expire_time)
+            return int(expire_time)
         except (ValueError, TypeError):
             raise TemplateSyntaxError('"cache" tag got a non-integer timeout value: %r' % expire_time)
+
+    def get_cache_key(self, context):
         # Build a unicode key for this fragment and all vary-on's.
         args = hashlib.md5(u':'.join([urlquote(resolve_variable(var, context)) for var in self.vary_on]))
-        cache_key = 'template.cache.%s.%s' % (self.fragment_name, args.hexdigest())
-        value = cache.get(cache_key)
+        return 'template.cache.%s.%s' % (self.fragment_name, args.hexdigest())
+
+    def render(self, context):
+        expire_time = self.get_expire_time(context)
+        cache_key = self.get_cache_key(context)
+        prefetched = context.get(PREFETCH_VAR)
+        if prefetched is not None:
+            value = prefetched.get(cache_key)
+        else:
+            value = cache.get(cache_key)
         if value is None:
             value = self.nodelist.render(context)
-            cache.set(cache_key, value, expire_time)
+            if prefetched is not None:
+                prefetched.set(cache_key, value, expire_time)
+            else:
+                cache.set(cache_key, value, expire_time)
         return value
 
+class PrefetchedFragments(object):
+    """
+    The cached fragments of a {% cache_prefetch %} tag, fetched with a
+    single get_many. Fragments rendered on a miss are stored with one
+    set_many per timeout by flush().
+    """
+    def __init__(self, keys):
+        self.values = keys and cache.get_many(keys) or {}
+        self.fetched = set(keys)
+        self.misses = {}
+
+    def get(self, key):
+        if key in self.values:
+            return self.values[key]
+        if key not in self.fetched:
+            # A fragment whose key couldn't be known up front, e.g. one
+            # varying on a {% for %} loop variable.
+            self.fetched.add(key)
+            value = cache.get(key)
+            if value is not None:
+                self.values[key] = value
+            return value
+        return None
+
+    def set(self, key, value, expire_time):
+        self.values[key] = value
+        self.misses.setdefault(expire_time, {})[key] = value
+
+    def flush(self):
+        for expire_time, values in self.misses.items():
+            cache.set_many(values, expire_time)
+        self.misses = {}
+
+class CachePrefetchNode(Node):
+    def __init__(self, nodelist):
+        self.nodelist = nodelist
+        self.cache_nodes = nodelist.get_nodes_by_type(CacheNode)
+
+    def render(self, context):
+        keys = set()
+        for node in self.cache_nodes:
+            try:
+                keys.add(node.get_cache_key(context))
+            except VariableDoesNotExist:
+                # Varies on a variable that is only set further in, e.g.
+                # by a {% for %} loop.
+                pass
+        prefetched = PrefetchedFragments(list(keys))
+        context.push()
+        context[PREFETCH_VAR] = prefetched
+        try:
+            output = self.nodelist.render(context)
+        finally:
+            context.pop()
+        prefetched.flush()
+        return output
+
 @register.tag('cache')
 def do_cache(parser, token):
     """
@@ -59,3 +133,29 @@ def do_cache(parser, token):
     if len(tokens) < 3:
         raise TemplateSyntaxError(u"'%r' tag requires at least 2 arguments." % tokens[0])
     return CacheNode(nodelist, tokens[1], tokens[2], tokens[3:])
+
+@register.tag('cache_prefetch')
+def do_cache_prefetch(parser, token):
+    """
+    This will fetch the cached fragments of all the ``{% cache %}`` tags
+    it contains with a single request to the cache, and store the ones
+    that were missing with a single request per timeout after rendering.
+
+    Usage::
+
+        {% load cache %}
+        {% cache_prefetch %}
+            {% cache 500 sidebar %} .. {% endcache %}
+            {% cache 500 footer request.user.username %} .. {% endcache %}
+        {% endcache_prefetch %}
+
+    Fragments varying on variables set within the tag, like ``{% for %}``
+    loop variables, and fragments of included templates are fetched one
+    by one as usual.
+    """
+    nodelist = parser.parse(('endcache_prefetch',))
+    parser.delete_first_token()
+    tokens = token.contents.split()
+    if len(tokens) != 1:
+        raise TemplateSyntaxError(u"'%r' tag takes no arguments." % tokens[0])
+    return CachePrefetchNode(nodelist)
@@ -1,6 +1,7 @@
 import re
 import unicodedata
 import warnings
+import zlib
 from gzip import GzipFile
 from htmlentitydefs import name2codepoint
 
@@ -277,13 +278,25 @@ phone2numeric = allow_lazy(phone2numeric)
 
 # From http://www.xhaus.com/alan/python/httpcomp.html#gzip
 # Used with permission.
-def compress_string(s):
+def compress_string(s, compresslevel=6):
     zbuf = StringIO()
-    zfile = GzipFile(mode='wb', compresslevel=6, fileobj=zbuf)
+    zfile = GzipFile(mode='wb', compresslevel=compresslevel, fileobj=zbuf)
     zfile.write(s)
     zfile.close()
     return zbuf.getvalue()
 
+def compress_sequence(sequence, compresslevel=6):
+    """
+    Returns a generator of the gzip compressed strings of sequence, flushed
+    after every item so that each part can be sent as soon as it's ready.
+    """
+    # 16 + MAX_WBITS selects the gzip format.
+    zobj = zlib.compressobj(compresslevel, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for item in sequence:
+        if item:
+            yield zobj.compress(item) + zobj.flush(zlib.Z_SYNC_FLUSH)
+    yield zobj.flush()
+
 ustring_re = re.compile(u"([\u0080-\uffff])")
 
 def javascript_quote(s, quote_double_quotes=False):
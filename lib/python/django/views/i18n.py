@@ -1,3 +1,4 @@
+import hashlib
 import os
 import gettext as gettext_module
 
@@ -6,9 +7,10 @@ from django.conf import settings
 from django.utils import importlib
 from django.utils.translation import check_for_language, activate, to_locale, get_language
 from django.utils.text import javascript_quote
-from django.utils.encoding import smart_unicode
+from django.utils.encoding import smart_str, smart_unicode
 from django.utils.formats import get_format_modules, get_format
-from django.utils.http import is_safe_url
+from django.utils.cache import patch_vary_headers
+from django.utils.http import is_safe_url, parse_etags, quote_etag
 
 
 def set_language(request):
@@ -167,34 +169,23 @@ def null_javascript_catalog(request, domain=None, packages=None):
     src = [NullSource, InterPolate, LibFormatHead, get_formats(), LibFormatFoot]
     return http.HttpResponse(''.join(src), 'text/javascript')
 
-def javascript_catalog(request, domain='djangojs', packages=None):
+def get_catalog_packages(packages=None):
     """
-    Returns the selected language catalog as a javascript library.
-
-    Receives the list of packages to check for translations in the
-    packages parameter either from an infodict or as a +-delimited
-    string from the request. Default is 'django.conf'.
-
-    Additionally you can override the gettext domain for this view,
-    but usually you don't want to do that, as JavaScript messages
-    go to the djangojs domain. But this might be needed if you
-    deliver your JavaScript source from Django templates.
+    Returns the list of packages to load translations from, given as a
+    list or as a +-delimited string. Default is 'django.conf'.
     """
-    if request.GET:
-        if 'language' in request.GET:
-            if check_for_language(request.GET['language']):
-                activate(request.GET['language'])
     if packages is None:
         packages = ['django.conf']
     if isinstance(packages, basestring):
         packages = packages.split('+')
-    packages = [p for p in packages if p == 'django.conf' or p in settings.INSTALLED_APPS]
-    default_locale = to_locale(settings.LANGUAGE_CODE)
-    locale = to_locale(get_language())
-    t = {}
+    return [p for p in packages if p == 'django.conf' or p in settings.INSTALLED_APPS]
+
+def get_catalog_paths(packages):
+    """
+    Returns the locale directories of the given packages, followed by the
+    ones listed in the LOCALE_PATHS setting.
+    """
     paths = []
-    en_selected = locale.startswith('en')
-    en_catalog_missing = True
     # paths of requested packages
     for package in packages:
         p = importlib.import_module(package)
@@ -202,6 +193,18 @@ def javascript_catalog(request, domain='djangojs', packages=None):
         paths.append(path)
     # add the filesystem paths listed in the LOCALE_PATHS setting
     paths.extend(list(reversed(settings.LOCALE_PATHS)))
+    return paths
+
+def render_javascript_catalog(domain, paths):
+    """
+    Returns the JavaScript source of the catalog of the active language,
+    merged from the catalogs of the given domain found in the given paths.
+    """
+    default_locale = to_locale(settings.LANGUAGE_CODE)
+    locale = to_locale(get_language())
+    t = {}
+    en_selected = locale.startswith('en')
+    en_catalog_missing = True
     # first load all english languages files for defaults
     for path in paths:
         try:
@@ -279,5 +282,72 @@ def javascript_catalog(request, domain='djangojs', packages=None):
     src.append(LibFormatHead)
     src.append(get_formats())
     src.append(LibFormatFoot)
-    src = ''.join(src)
-    return http.HttpResponse(src, 'text/javascript')
+    return ''.join(src)
+
+
+# The rendered catalogs, keyed by language, domain, packages and the
+# modification times of the catalog files they're made of.
+_catalog_cache = {}
+
+def get_javascript_catalog(domain, packages):
+    """
+    Returns a (source, etag) tuple for the catalog of the active language,
+    rendered once per combination of language, domain, packages and
+    modification times of the .mo files used.
+    """
+    paths = get_catalog_paths(packages)
+    language = get_language()
+    mo_files = []
+    for locale in sorted(set(['en', to_locale(settings.LANGUAGE_CODE), to_locale(language)])):
+        for path in paths:
+            mo_files.extend(gettext_module.find(domain, path, [locale], all=True))
+    mtimes = tuple([(mo_file, os.path.getmtime(mo_file)) for mo_file in mo_files])
+    key = (language, settings.LANGUAGE_CODE, domain, tuple(packages), mtimes)
+    try:
+        return _catalog_cache[key]
+    except KeyError:
+        pass
+    src = render_javascript_catalog(domain, paths)
+    etag = quote_etag(hashlib.md5(smart_str(src)).hexdigest())
+    if len(_catalog_cache) >= 100:
+        # Old .mo files, most likely; start over.
+        _catalog_cache.clear()
+    entry = _catalog_cache[key] = (src, etag)
+    return entry
+
+def javascript_catalog(request, domain='djangojs', packages=None):
+    """
+    Returns the selected language catalog as a javascript library.
+
+    Receives the list of packages to check for translations in the
+    packages parameter either from an infodict or as a +-delimited
+    string from the request. Default is 'django.conf'.
+
+    Additionally you can override the gettext domain for this view,
+    but usually you don't want to do that, as JavaScript messages
+    go to the djangojs domain. But this might be needed if you
+    deliver your JavaScript source from Django templates.
+
+    The rendered catalog is kept in memory until a .mo file changes, and
+    is sent with an ETag of its content, so that clients can revalidate
+    it. As the language is negotiated, there's no Last-Modified header.
+    The compilejsi18n management command writes the catalogs to static
+    files instead.
+    """
+    if request.GET:
+        if 'language' in request.GET:
+            if check_for_language(request.GET['language']):
+                activate(request.GET['language'])
+    packages = get_catalog_packages(packages)
+    src, etag = get_javascript_catalog(domain, packages)
+
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match is not None and (
+            etag in ['"%s"' % e for e in parse_etags(if_none_match)] or
+            if_none_match == '*'):
+        response = http.HttpResponseNotModified()
+    else:
+        response = http.HttpResponse(src, 'text/javascript')
+    response['ETag'] = etag
+    patch_vary_headers(response, ('Accept-Language', 'Cookie'))
+    return response
@@ -46,7 +46,7 @@ class DjangoLoader(BaseLoader):
     def _install_signal_handlers(self):
         # Need to close any open database connection after
         # any embedded celerybeat process forks.
-        signals.beat_embedded_init.connect(self.close_database)
+        signals.beat_embedded_init.connect(self.close_forked_database)
         signals.worker_ready.connect(self.warn_if_debug)
 
     def now(self, utc=False):
@@ -67,11 +67,16 @@ class DjangoLoader(BaseLoader):
             settings.CELERY_ENABLE_UTC = False
         return DictAttribute(settings)
 
-    def _close_database(self):
-        try:
-            funs = [conn.close for conn in db.connections]
-        except AttributeError:
-            funs = [db.close_connection]  # pre multidb
+    def _close_database(self, force=False):
+        if force:
+            try:
+                funs = [conn.close for conn in db.connections.all()]
+            except AttributeError:
+                funs = [db.close_connection]  # pre multidb
+        else:
+            # keeps connections open for reuse if allowed by the
+            # CONN_MAX_AGE database setting.
+            funs = [db.close_connection]
 
         for close in funs:
             try:
@@ -90,6 +95,11 @@ class DjangoLoader(BaseLoader):
             self._close_database()
         self._db_reuse += 1
 
+    def close_forked_database(self, **kwargs):
+        # connections inherited from the parent process
+        # must never be reused.
+        self._close_database(force=True)
+
     def close_cache(self):
         try:
             cache.cache.close()
@@ -124,7 +134,8 @@ class DjangoLoader(BaseLoader):
         """
         self.import_default_modules()
 
-        self.close_database()
+        # the connections would be inherited by the pool processes.
+        self._close_database(force=True)
         self.close_cache()
 
     def warn_if_debug(self, **kwargs):
@@ -156,7 +167,7 @@ class DjangoLoader(BaseLoader):
                 _maybe_close_fd(db.connection.connection)
 
         # use the _ version to avoid DB_REUSE preventing the conn.close() call
-        self._close_database()
+        self._close_database(force=True)
         self.close_cache()
 
     def mail_admins(self, subject, body, fail_silently=False, **kwargs):
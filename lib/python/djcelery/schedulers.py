@@ -210,6 +210,7 @@ class DatabaseScheduler(Scheduler):
                     "Couldn't add entry %r to database schedule: %r. "
                     "Contents: %r" % (name, exc, entry))
         self.schedule.update(s)
+        self._heap = None
 
     def install_default_entries(self, data):
         entries = {}
@@ -233,6 +234,8 @@ class DatabaseScheduler(Scheduler):
 
         if update:
             self.sync()
+            # a new schedule also makes the scheduler rebuild its heap
+            # at the next tick (when CELERYBEAT_USE_HEAP is enabled).
             self._schedule = self.all_as_schedule()
             if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(
@@ -2,7 +2,7 @@ from __future__ import absolute_import
 
 from collections import defaultdict
 from datetime import datetime, timedelta
-from time import time
+from time import mktime, time
 
 from django.db import transaction
 from django.conf import settings
@@ -11,6 +11,7 @@ from django.core.exceptions import ObjectDoesNotExist
 from celery import states
 from celery.events.state import Task
 from celery.events.snapshot import Polaroid
+from celery.utils.functional import LRUCache
 from celery.utils.timeutils import maybe_iso8601, timezone
 
 from .models import WorkerState, TaskState
@@ -28,6 +29,7 @@ EXPIRE_ERROR = getattr(settings, "CELERYCAM_EXPIRE_ERROR",
 EXPIRE_PENDING = getattr(settings, "CELERYCAM_EXPIRE_PENDING",
                          timedelta(days=5))
 NOT_SAVED_ATTRIBUTES = frozenset(['name', 'args', 'kwargs', 'eta'])
+LAST_WRITE_CACHE_SIZE = 10000  # task states remembered between shutters.
 
 
 def aware_tstamp(secs):
@@ -35,6 +37,13 @@ def aware_tstamp(secs):
     return timezone.to_local_fallback(datetime.fromtimestamp(secs))
 
 
+def utc_eta(eta):
+    """Convert eta the same way :meth:`TaskState.save` does, as bulk
+    inserts and updates bypass it."""
+    if eta is not None:
+        return datetime.utcfromtimestamp(mktime(eta.timetuple()))
+
+
 class Camera(Polaroid):
     TaskState = TaskState
     WorkerState = WorkerState
@@ -50,6 +59,7 @@ class Camera(Polaroid):
     def __init__(self, *args, **kwargs):
         super(Camera, self).__init__(*args, **kwargs)
         self._last_worker_write = defaultdict(lambda: (None, None))
+        self._last_task_write = LRUCache(limit=LAST_WRITE_CACHE_SIZE)
 
     def get_heartbeat(self, worker):
         try:
@@ -68,8 +78,7 @@ class Camera(Polaroid):
             self._last_worker_write[hostname] = (time(), obj)
         return obj
 
-    def handle_task(self, (uuid, task), worker=None):
-        """Handle snapshotted event."""
+    def task_defaults(self, task, worker=None):
         if task.worker and task.worker.hostname:
             worker = self.handle_worker((task.worker.hostname, task.worker))
 
@@ -89,8 +98,87 @@ class Camera(Polaroid):
         # do not overwrite this fields in TaskState instance row
         [defaults.pop(attr, None) for attr in NOT_SAVED_ATTRIBUTES
                                     if defaults[attr] is None]
+        return defaults
+
+    def handle_task(self, (uuid, task), worker=None):
+        """Handle snapshotted event."""
+        defaults = self.task_defaults(task, worker)
         return self.update_task(task.state, task_id=uuid, defaults=defaults)
 
+    def handle_tasks(self, tasks):
+        """Handle a batch of snapshotted tasks.
+
+        Existing rows are fetched with a single query, new rows are
+        written using one bulk insert, and updates are grouped so that
+        tasks with identical changes share a single ``UPDATE``.  Tasks
+        that did not change since the last write are skipped.
+
+        Returns the number of rows inserted or updated.
+
+        """
+        pending = {}
+        for uuid, task in tasks:
+            defaults = self.task_defaults(task)
+            if self._last_task_write.get(uuid) != defaults:
+                pending[uuid] = defaults
+        if not pending:
+            return 0
+
+        objects = self.TaskState.objects
+        existing = dict((obj.task_id, obj) for obj in
+                            objects.filter(task_id__in=pending.keys()))
+        created, updates = [], defaultdict(list)
+        for uuid, defaults in pending.iteritems():
+            fields = dict(defaults)
+            if "eta" in fields:
+                fields["eta"] = utc_eta(fields["eta"])
+            obj = existing.get(uuid)
+            if obj is None:
+                if fields.get("name"):
+                    created.append(self.TaskState(task_id=uuid, **fields))
+                continue
+            fields = self.merge_fields(fields["state"], obj.state, fields)
+            changed = tuple(sorted((k, v) for k, v in fields.iteritems()
+                                if not self._field_equal(obj, k, v)))
+            if changed:
+                updates[changed].append(obj)
+
+        self.bulk_create(created)
+        for changed, objs in updates.iteritems():
+            objects.filter(pk__in=[obj.pk for obj in objs]) \
+                   .update(**dict(changed))
+
+        self._last_task_write.update(pending)
+        return len(created) + sum(len(objs) for objs in updates.itervalues())
+
+    @property
+    def can_bulk_create(self):
+        return hasattr(self.TaskState.objects, "bulk_create")
+
+    def bulk_create(self, objs):
+        if not objs:
+            return
+        if self.can_bulk_create:
+            return self.TaskState.objects.bulk_create(objs)
+        # Django < 1.4
+        for obj in objs:
+            obj.save_base(force_insert=True)
+
+    def merge_fields(self, state, current_state, fields):
+        """Fields to write for an event that may be older than the
+        stored state: the fields only sent with the ``task-received``
+        event are not overwritten."""
+        if states.state(state) < states.state(current_state):
+            keep = Task.merge_rules[states.RECEIVED]
+            return dict((k, v) for k, v in fields.iteritems()
+                            if k not in keep)
+        return fields
+
+    def _field_equal(self, obj, key, value):
+        if key == "worker":
+            return obj.worker_id == (value.pk if value else None)
+        return getattr(obj, key) == value
+
     def update_task(self, state, **kwargs):
         objects = self.TaskState.objects
         defaults = kwargs.pop("defaults", None) or {}
@@ -102,11 +190,7 @@ class Camera(Polaroid):
             obj, created = objects.get_or_create(defaults=defaults, **kwargs)
             return obj
         else:
-            if states.state(state) < states.state(obj.state):
-                keep = Task.merge_rules[states.RECEIVED]
-                defaults = dict((k, v)
-                                    for k, v in defaults.items()
-                                        if k not in keep)
+            defaults = self.merge_fields(state, obj.state, defaults)
 
         for k, v in defaults.items():
             setattr(obj, k, v)
@@ -133,10 +217,10 @@ class Camera(Polaroid):
             return
 
         def _handle_tasks():
-            for i, task in enumerate(state.tasks.items()):
-                self.handle_task(task)
-                if not i % commit_every:
-                    transaction.commit()
+            tasks = state.tasks.items()
+            for i in xrange(0, len(tasks), commit_every):
+                self.handle_tasks(tasks[i:i + commit_every])
+                transaction.commit()
 
         self._autocommit(lambda: map(self.handle_worker,
                                      state.workers.items()))
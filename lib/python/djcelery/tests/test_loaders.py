@@ -1,6 +1,8 @@
 from __future__ import absolute_import
+from __future__ import with_statement
 
 from celery import loaders
+from mock import Mock, patch
 
 from djcelery import loaders as djloaders
 from djcelery.tests.utils import unittest
@@ -35,6 +37,22 @@ class TestDjangoLoader(unittest.TestCase):
         finally:
             djloaders._RACE_PROTECTION = False
 
+    def test_close_database(self):
+        with patch("djcelery.loaders.db") as db:
+            conn = Mock()
+            db.connections.all.return_value = [conn]
+            self.loader._close_database()
+            self.assertTrue(db.close_connection.called)
+            self.assertFalse(conn.close.called)
+
+            self.loader._close_database(force=True)
+            self.assertTrue(conn.close.called)
+
+            db.connections = object()
+            db.close_connection.reset_mock()
+            self.loader.close_forked_database()
+            self.assertTrue(db.close_connection.called)
+
     def test_find_related_module_no_path(self):
         self.assertFalse(djloaders.find_related_module("sys", "tasks"))
 
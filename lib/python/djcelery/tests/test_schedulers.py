@@ -147,6 +147,16 @@ class test_DatabaseScheduler(unittest.TestCase):
         self.m3.delete()
         self.assertRaises(KeyError, self.s.schedule.__getitem__, self.m3.name)
 
+    def test_schedule_changed_rebuilds_heap(self):
+        for entry in self.s.schedule.values():
+            entry.schedule = schedule(timedelta(seconds=10))
+        self.s.populate_heap()
+        self.assertIs(self.s._heap_schedule, self.s.schedule)
+
+        self.m2.args = "[16, 16]"
+        self.m2.save()
+        self.assertIsNot(self.s._heap_schedule, self.s.schedule)
+
     def test_should_sync(self):
         self.assertTrue(self.s.should_sync())
         self.s._last_sync = time()
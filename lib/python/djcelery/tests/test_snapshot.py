@@ -177,3 +177,57 @@ class test_Camera(unittest.TestCase):
         self.assertEqual(t2.worker.hostname, ws[1])
 
         cam.on_shutter(state)
+
+    def test_handle_tasks(self):
+        worker = Worker(hostname="fuzzie")
+        worker.on_online(timestamp=time())
+        tasks = [create_task(worker) for i in xrange(5)]
+        for task in tasks:
+            task.on_received(timestamp=time(), args="(2, 2)")
+        self.assertEqual(self.cam.handle_tasks(
+                            [(task.uuid, task) for task in tasks]), 5)
+        for task in tasks:
+            mt = models.TaskState.objects.get(task_id=task.uuid)
+            self.assertEqual(mt.state, "RECEIVED")
+            self.assertEqual(mt.name, task.name)
+            self.assertEqual(mt.worker.hostname, "fuzzie")
+
+        # unchanged tasks are not written again.
+        self.assertEqual(self.cam.handle_tasks(
+                            [(task.uuid, task) for task in tasks]), 0)
+
+        for task in tasks[:3]:
+            task.on_succeeded(timestamp=time(), result=42)
+        self.assertEqual(self.cam.handle_tasks(
+                            [(task.uuid, task) for task in tasks]), 3)
+        for task in tasks:
+            mt = models.TaskState.objects.get(task_id=task.uuid)
+            self.assertEqual(mt.state, task.state)
+            self.assertEqual(mt.args, "(2, 2)")
+
+    def test_handle_tasks_merge(self):
+        worker = Worker(hostname="fuzzie")
+        task = create_task(worker, args="(1, )")
+        task.on_started(timestamp=time())
+        self.cam.handle_tasks([(task.uuid, task)])
+        self.assertEqual(models.TaskState.objects.get(
+                            task_id=task.uuid).state, "STARTED")
+
+        # late event doesn't overwrite the fields sent with task-received,
+        # as update_task does.
+        late = create_task(worker, uuid=task.uuid, name=task.name,
+                           args="(2, )")
+        late.on_received(timestamp=time())
+        self.assertEqual(self.cam.handle_tasks([(late.uuid, late)]), 1)
+        mt = models.TaskState.objects.get(task_id=task.uuid)
+        self.assertEqual(mt.args, "(1, )")
+        self.assertEqual(mt.state, self.cam.update_task(
+            late.state, task_id=task.uuid,
+            defaults=self.cam.task_defaults(late)).state)
+
+    def test_handle_tasks_without_name(self):
+        task = create_task(Worker(hostname=None), name=None)
+        task.on_revoked(timestamp=time())
+        self.assertEqual(self.cam.handle_tasks([(task.uuid, task)]), 0)
+        self.assertFalse(models.TaskState.objects.filter(
+                            task_id=task.uuid).count())
@@ -10,6 +10,7 @@
 """
 import os
 import sys
+from time import time
 from jinja2 import nodes
 from jinja2.defaults import *
 from jinja2.lexer import get_lexer, TokenStream
@@ -186,6 +187,11 @@ class Environment(object):
             will reload the template.  For higher performance it's possible to
             disable that.
 
+        `auto_reload_interval`
+            If set to a number of seconds, a cached template is checked for
+            changes at most once in that interval instead of every time it is
+            requested.  Defaults to ``0`` which checks on every request.
+
         `bytecode_cache`
             If set to a bytecode cache object, this object will provide a
             cache for the internal Jinja bytecode so that templates don't
@@ -232,7 +238,8 @@ class Environment(object):
                  loader=None,
                  cache_size=50,
                  auto_reload=True,
-                 bytecode_cache=None):
+                 bytecode_cache=None,
+                 auto_reload_interval=0):
         # !!Important notice!!
         #   The constructor accepts quite a few arguments that should be
         #   passed by keyword rather than position.  However it's important to
@@ -273,6 +280,7 @@ class Environment(object):
         self.cache = create_cache(cache_size)
         self.bytecode_cache = bytecode_cache
         self.auto_reload = auto_reload
+        self.auto_reload_interval = auto_reload_interval
 
         # load extensions
         self.extensions = load_extensions(self, extensions)
@@ -302,7 +310,7 @@ class Environment(object):
                 trim_blocks=missing, extensions=missing, optimized=missing,
                 undefined=missing, finalize=missing, autoescape=missing,
                 loader=missing, cache_size=missing, auto_reload=missing,
-                bytecode_cache=missing):
+                bytecode_cache=missing, auto_reload_interval=missing):
         """Create a new overlay environment that shares all the data with the
         current environment except of cache and the overridden attributes.
         Extensions cannot be removed for an overlayed environment.  An overlayed
@@ -685,13 +693,28 @@ class Environment(object):
         if self.cache is not None:
             template = self.cache.get(name)
             if template is not None and (not self.auto_reload or \
-                                         template.is_up_to_date):
+                                         self._is_up_to_date(template)):
                 return template
         template = self.loader.load(self, name, globals)
         if self.cache is not None:
+            template._last_checked = time()
             self.cache[name] = template
         return template
 
+    def _is_up_to_date(self, template):
+        """Checks if a cached template is up to date, but only once every
+        :attr:`auto_reload_interval` seconds if set.
+        """
+        if not self.auto_reload_interval:
+            return template.is_up_to_date
+        now = time()
+        if now - template._last_checked < self.auto_reload_interval:
+            return True
+        if template.is_up_to_date:
+            template._last_checked = now
+            return True
+        return False
+
     @internalcode
     def get_template(self, name, parent=None, globals=None):
         """Load a template from the loader.  If a loader is configured this
@@ -866,6 +889,7 @@ class Template(object):
         # debug and loader helpers
         t._debug_info = namespace['debug_info']
         t._uptodate = None
+        t._last_checked = 0
 
         # store the reference
         namespace['environment'] = environment
@@ -94,6 +94,19 @@ class LoaderTestCase(JinjaTestCase):
         assert 'two' not in env.cache
         assert 'three' in env.cache
 
+    def test_auto_reload_interval(self):
+        checks = []
+        class TestLoader(loaders.BaseLoader):
+            def get_source(self, environment, template):
+                return u'foo', None, lambda: checks.append(1) or False
+        env = Environment(loader=TestLoader(), auto_reload_interval=60)
+        tmpl = env.get_template('template')
+        assert tmpl is env.get_template('template')
+        assert not checks
+        tmpl._last_checked -= 60
+        assert tmpl is not env.get_template('template')
+        assert len(checks) == 1
+
     def test_split_template_path(self):
         assert split_template_path('foo/bar') == ['foo', 'bar']
         assert split_template_path('./foo/bar') == ['foo', 'bar']
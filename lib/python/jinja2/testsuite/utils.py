@@ -43,7 +43,30 @@ class LRUCacheTestCase(JinjaTestCase):
             copy = pickle.loads(pickle.dumps(cache, protocol))
             assert copy.capacity == cache.capacity
             assert copy._mapping == cache._mapping
-            assert copy._queue == cache._queue
+            assert copy._keys() == cache._keys()
+
+    def test_order(self):
+        d = LRUCache(3)
+        d["a"] = 1
+        d["b"] = 2
+        d["c"] = 3
+        d["a"]
+        assert d.keys() == ['a', 'c', 'b']
+        assert list(reversed(d)) == ['b', 'c', 'a']
+        assert d.items() == [('a', 1), ('c', 3), ('b', 2)]
+        d["c"] = 4
+        assert d.keys() == ['c', 'a', 'b']
+        del d["a"]
+        assert d.keys() == ['c', 'b']
+        d["d"] = 5
+        d["e"] = 6
+        assert d.keys() == ['e', 'd', 'c']
+        copy = d.copy()
+        assert copy.items() == d.items()
+        d.clear()
+        assert len(d) == 0 and d.keys() == []
+        d["f"] = 7
+        assert d.keys() == ['f']
 
 
 class HelpersTestCase(JinjaTestCase):
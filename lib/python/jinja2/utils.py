@@ -15,7 +15,6 @@ try:
     from thread import allocate_lock
 except ImportError:
     from dummy_thread import allocate_lock
-from collections import deque
 from itertools import imap
 
 
@@ -352,42 +351,79 @@ def generate_lorem_ipsum(n=5, html=True, min=20, max=100):
 class LRUCache(object):
     """A simple LRU Cache implementation."""
 
-    # this is fast for small capacities (something below 1000) but doesn't
-    # scale.  But as long as it's only used as storage for templates this
-    # won't do any harm.
+    # the keys are kept in a circular doubly linked list around `_root`,
+    # ordered from the least to the most recently used key.  Every link is
+    # a ``[prev, next, key]`` list, and `_links` maps the keys to their
+    # links so that all operations are O(1).
 
     def __init__(self, capacity):
         self.capacity = capacity
         self._mapping = {}
-        self._queue = deque()
         self._postinit()
 
     def _postinit(self):
-        # alias all queue methods for faster lookup
-        self._popleft = self._queue.popleft
-        self._pop = self._queue.pop
-        if hasattr(self._queue, 'remove'):
-            self._remove = self._queue.remove
+        self._links = {}
+        root = self._root = []
+        root[:] = [root, root, None]
         self._wlock = allocate_lock()
-        self._append = self._queue.append
 
-    def _remove(self, obj):
-        """Python 2.4 compatibility."""
-        for idx, item in enumerate(self._queue):
-            if item == obj:
-                del self._queue[idx]
-                break
+    def _append(self, key):
+        """Link `key` as the most recently used key.  The write lock must
+        be held.
+        """
+        root = self._root
+        last = root[0]
+        link = [last, root, key]
+        last[1] = root[0] = self._links[key] = link
+
+    def _move_to_end(self, link):
+        """Move `link` to the most recently used position.  The write lock
+        must be held.
+        """
+        root = self._root
+        prev, next = link[0], link[1]
+        prev[1] = next
+        next[0] = prev
+        last = root[0]
+        link[0] = last
+        link[1] = root
+        last[1] = root[0] = link
+
+    def _unlink(self, key):
+        """Remove `key` from the linked list.  The write lock must be held."""
+        link = self._links.pop(key, None)
+        if link is not None:
+            prev, next = link[0], link[1]
+            prev[1] = next
+            next[0] = prev
+
+    def _keys(self):
+        """Return a list of the keys, least recently used first."""
+        self._wlock.acquire()
+        try:
+            root = self._root
+            result = []
+            link = root[1]
+            while link is not root:
+                result.append(link[2])
+                link = link[1]
+            return result
+        finally:
+            self._wlock.release()
 
     def __getstate__(self):
         return {
             'capacity':     self.capacity,
             '_mapping':     self._mapping,
-            '_queue':       self._queue
+            '_queue':       self._keys()
         }
 
     def __setstate__(self, d):
-        self.__dict__.update(d)
+        self.capacity = d['capacity']
+        self._mapping = d['_mapping']
         self._postinit()
+        for key in d['_queue']:
+            self._append(key)
 
     def __getnewargs__(self):
         return (self.capacity,)
@@ -396,7 +432,8 @@ class LRUCache(object):
         """Return an shallow copy of the instance."""
         rv = self.__class__(self.capacity)
         rv._mapping.update(self._mapping)
-        rv._queue = deque(self._queue)
+        for key in self._keys():
+            rv._append(key)
         return rv
 
     def get(self, key, default=None):
@@ -421,7 +458,9 @@ class LRUCache(object):
         self._wlock.acquire()
         try:
             self._mapping.clear()
-            self._queue.clear()
+            self._links.clear()
+            root = self._root
+            root[:] = [root, root, None]
         finally:
             self._wlock.release()
 
@@ -446,15 +485,15 @@ class LRUCache(object):
         Raise an `KeyError` if it does not exist.
         """
         rv = self._mapping[key]
-        if self._queue[-1] != key:
+        if self._root[0][2] != key:
+            self._wlock.acquire()
             try:
-                self._remove(key)
-            except ValueError:
-                # if something removed the key from the container
-                # when we read, ignore the ValueError that we would
-                # get otherwise.
-                pass
-            self._append(key)
+                link = self._links.get(key)
+                # something may have removed the key since we read it.
+                if link is not None:
+                    self._move_to_end(link)
+            finally:
+                self._wlock.release()
         return rv
 
     def __setitem__(self, key, value):
@@ -463,15 +502,15 @@ class LRUCache(object):
         """
         self._wlock.acquire()
         try:
-            if key in self._mapping:
-                try:
-                    self._remove(key)
-                except ValueError:
-                    # __getitem__ is not locked, it might happen
-                    pass
-            elif len(self._mapping) == self.capacity:
-                del self._mapping[self._popleft()]
-            self._append(key)
+            link = self._links.get(key)
+            if link is not None:
+                self._move_to_end(link)
+            else:
+                if len(self._mapping) == self.capacity:
+                    oldest = self._root[1][2]
+                    self._unlink(oldest)
+                    del self._mapping[oldest]
+                self._append(key)
             self._mapping[key] = value
         finally:
             self._wlock.release()
@@ -483,17 +522,13 @@ class LRUCache(object):
         self._wlock.acquire()
         try:
             del self._mapping[key]
-            try:
-                self._remove(key)
-            except ValueError:
-                # __getitem__ is not locked, it might happen
-                pass
+            self._unlink(key)
         finally:
             self._wlock.release()
 
     def items(self):
         """Return a list of items."""
-        result = [(key, self._mapping[key]) for key in list(self._queue)]
+        result = [(key, self._mapping[key]) for key in self._keys()]
         result.reverse()
         return result
 
@@ -517,7 +552,7 @@ class LRUCache(object):
         """Iterate over all keys in the cache dict, ordered by
         the most recent usage.
         """
-        return reversed(tuple(self._queue))
+        return reversed(self._keys())
 
     __iter__ = iterkeys
 
@@ -525,7 +560,7 @@ class LRUCache(object):
         """Iterate over the values in the cache dict, oldest items
         coming first.
         """
-        return iter(tuple(self._queue))
+        return iter(self._keys())
 
     __copy__ = copy
 
@@ -6,7 +6,9 @@ Sending and receiving messages.
 
 """
 from __future__ import absolute_import
+from __future__ import with_statement
 
+from contextlib import contextmanager
 from itertools import count
 
 from .connection import maybe_channel, is_connection
@@ -163,6 +165,28 @@ class Producer(object):
                        content_encoding, headers, properties,
                        routing_key, mandatory, immediate, exchange, declare)
 
+    @contextmanager
+    def publish_batch(self):
+        """Context where messages published may be buffered by the channel
+        and sent to the broker together, when the context exits at the
+        latest.
+
+        Only has an effect if the transport supports it (e.g. Redis, py-amqp),
+        and note that connection errors may then be raised at exit
+        instead of by :meth:`publish`::
+
+            with producer.publish_batch():
+                for body in bodies:
+                    producer.publish(body)
+
+        """
+        publish_batch = getattr(self.channel, 'publish_batch', None)
+        if publish_batch is None:
+            yield self
+        else:
+            with publish_batch():
+                yield self
+
     def _publish(self, body, priority, content_type, content_encoding,
                  headers, properties, routing_key, mandatory,
                  immediate, exchange, declare):
@@ -133,3 +133,18 @@ class test_MemoryTransport(TestCase):
         x = chan._queue_for('foo')
         self.assertTrue(x)
         self.assertIs(chan._queue_for('foo'), x)
+
+    def test_topic_bindings_changed_by_other_channel(self):
+        c1, c2 = self.c.channel(), self.c.channel()
+        c1.exchange_declare('test_memory_topic', type='topic')
+        c1.queue_declare('test_memory_topic_a')
+        c1.queue_bind('test_memory_topic_a', 'test_memory_topic', 'a.#')
+        self.assertListEqual(c2._lookup('test_memory_topic', 'a.x'),
+                             ['test_memory_topic_a'])
+
+        # replace the binding, keeping the same number of bindings.
+        c1.queue_delete('test_memory_topic_a')
+        c1.queue_declare('test_memory_topic_b')
+        c1.queue_bind('test_memory_topic_b', 'test_memory_topic', 'b.#')
+        self.assertListEqual(c2._lookup('test_memory_topic', 'b.x'),
+                             ['test_memory_topic_b'])
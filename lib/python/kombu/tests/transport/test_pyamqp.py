@@ -61,6 +61,13 @@ class test_Channel(TestCase):
         message.properties = {}
         self.assertTrue(self.channel.message_to_python(message))
 
+    def test_publish_batch(self):
+        writer = self.conn.method_writer
+        with self.channel.publish_batch():
+            writer.begin_batch.assert_called_with()
+            self.assertFalse(writer.end_batch.called)
+        writer.end_batch.assert_called_with()
+
     def test_close_resolves_connection_cycle(self):
         self.assertIsNotNone(self.channel.connection)
         self.channel.close()
@@ -4,7 +4,7 @@ from __future__ import with_statement
 import socket
 import types
 
-from anyjson import dumps
+from anyjson import dumps, loads
 from collections import defaultdict
 from itertools import count
 from Queue import Empty, Queue as _Queue
@@ -84,8 +84,9 @@ class Client(object):
         except KeyError:
             return 0
 
-    def lpush(self, key, value):
-        self.queues[key].put_nowait(value)
+    def lpush(self, key, *values):
+        for value in values:
+            self.queues[key].put_nowait(value)
 
     def parse_response(self, connection, type, **options):
         cmd, queues = self.connection._sock.data.pop()
@@ -112,10 +113,37 @@ class Client(object):
         except KeyError:
             pass
 
+    def rpush(self, key, value):
+        # no way to push to the head of a Queue, so rebuild it.
+        q = self.queues[key]
+        items = [value]
+        while not q.empty():
+            items.append(q.get_nowait())
+        for item in items:
+            q.put_nowait(item)
+
+    def eval(self, script, numkeys, *args):
+        assert script == redis.PREFETCH_SCRIPT
+        (key, unacked, unacked_index), (n, now) = args[:3], args[3:]
+        items = []
+        for i in range(n):
+            try:
+                items.append(self.rpop(key))
+            except Empty:
+                break
+        for item in items:
+            message = loads(item)
+            info = message['properties']['delivery_info']
+            tag = message['properties']['delivery_tag']
+            self.zadd(unacked_index, tag, now)
+            self.hset(unacked, tag,
+                      dumps([message, info['exchange'], info['routing_key']]))
+        return items
+
     def __contains__(self, k):
         return k in self._called
 
-    def pipeline(self):
+    def pipeline(self, transaction=True):
         return Pipeline(self)
 
     def encode(self, value):
@@ -527,6 +555,115 @@ class test_Redis(TestCase):
         finally:
             channel.close()
 
+    def test_publish_batch(self):
+        channel = self.connection.channel()
+        producer = Producer(channel, self.exchange, routing_key='test_Redis')
+        self.queue(channel).declare()
+
+        with producer.publish_batch():
+            for i in range(10):
+                producer.publish({'hello': 'world-%s' % (i, )})
+            self.assertEqual(channel._size('test_Redis'), 0)
+            self.assertEqual(len(channel._publish_buffer), 10)
+        self.assertIsNone(channel._publish_buffer)
+        self.assertEqual(channel._size('test_Redis'), 10)
+        for i in range(10):
+            self.assertDictEqual(self.queue(channel).get().payload,
+                                 {'hello': 'world-%s' % (i, )})
+        channel.close()
+
+    def test_publish_batch_flushes_when_full(self):
+        channel = self.connection.channel()
+        channel.publish_batch_size = 3
+        producer = Producer(channel, self.exchange, routing_key='test_Redis')
+        self.queue(channel).declare()
+
+        with producer.publish_batch():
+            for i in range(4):
+                producer.publish({'hello': 'world-%s' % (i, )})
+            self.assertEqual(channel._size('test_Redis'), 3)
+            self.assertEqual(len(channel._publish_buffer), 1)
+        self.assertEqual(channel._size('test_Redis'), 4)
+        channel.close()
+
+    def test_publish_batch_nested(self):
+        channel = self.connection.channel()
+        producer = Producer(channel, self.exchange, routing_key='test_Redis')
+        self.queue(channel).declare()
+
+        with producer.publish_batch():
+            with producer.publish_batch():
+                producer.publish({'hello': 'world'})
+            self.assertEqual(channel._size('test_Redis'), 0)
+        self.assertEqual(channel._size('test_Redis'), 1)
+        channel.close()
+
+    def _prefetch_setup(self, n=10, bulk_prefetch_count=5, prefetch_count=0):
+        connection = Connection(transport=Transport)
+        channel = connection.channel()
+        channel.bulk_prefetch_count = bulk_prefetch_count
+        channel.basic_qos(prefetch_count=prefetch_count)
+        producer = Producer(channel, self.exchange, routing_key='test_Redis')
+        consumer = Consumer(channel, self.queue)
+        for i in range(n):
+            producer.publish({'hello': i})
+        received = []
+        consumer.register_callback(lambda body, message: received.append(
+            (body, message)))
+        consumer.consume()
+        return connection, channel, received
+
+    def test_bulk_prefetch(self):
+        connection, channel, received = self._prefetch_setup()
+        try:
+            connection.drain_events(timeout=1)
+            self.assertEqual(len(received), 1)
+            self.assertEqual(len(channel._prefetched), 4)
+            self.assertEqual(channel._size('test_Redis'), 5)
+            tags = set(p['properties']['delivery_tag']
+                       for p, _, _ in channel._prefetched)
+            self.assertSetEqual(channel.qos._prefetched, tags)
+            for tag in tags:
+                self.assertIn(tag, Client.hashes[channel.unacked_key])
+
+            for i in range(4):
+                connection.drain_events(timeout=1)
+            self.assertEqual([body for body, _ in received], [
+                {'hello': i} for i in range(5)])
+            self.assertFalse(channel._prefetched)
+            self.assertFalse(channel.qos._prefetched)
+            for _, message in received:
+                message.ack()
+        finally:
+            channel.close()
+
+    def test_bulk_prefetch_respects_prefetch_count(self):
+        connection, channel, received = self._prefetch_setup(
+            prefetch_count=3)
+        try:
+            connection.drain_events(timeout=1)
+            self.assertEqual(len(channel._prefetched), 2)
+            connection.drain_events(timeout=1)
+            connection.drain_events(timeout=1)
+            self.assertFalse(channel.qos.can_consume())
+            self.assertEqual(channel.qos.can_prefetch(), 0)
+            received[0][1].ack()
+            self.assertEqual(channel.qos.can_prefetch(), 1)
+        finally:
+            channel.close()
+
+    def test_bulk_prefetch_restored_at_close(self):
+        connection, channel, received = self._prefetch_setup()
+        connection.drain_events(timeout=1)
+        self.assertEqual(channel._size('test_Redis'), 5)
+        received[0][1].ack()
+        channel.close()
+        self.assertEqual(channel._size('test_Redis'), 9)
+        self.assertFalse(channel._prefetched)
+        self.assertDictEqual(
+            self.queue(self.connection.channel()).get().payload,
+            {'hello': 1})
+
     def test_purge(self):
         channel = self.connection.channel()
         producer = Producer(channel, self.exchange, routing_key='test_Redis')
@@ -747,6 +884,7 @@ class test_MultiChannelPoller(TestCase):
         p._register_LISTEN = Mock()
 
         channel = Mock()
+        channel._next_prefetched.return_value = None
         p._channels = [channel]
         channel.active_queues = _aq
         channel.active_fanout_queues = _af
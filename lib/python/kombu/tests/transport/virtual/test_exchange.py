@@ -88,7 +88,7 @@ class test_Topic(ExchangeCase):
             self.e.lookup(self.table, 'eFoo', 'stock.us.nasdaq', None),
             ['rFoo', 'rBar'],
         )
-        self.assertTrue(self.e._compiled)
+        self.assertIn('stock.us.nasdaq', self.e.routing_table('eFoo')._cache)
         self.assertListEqual(
             self.e.lookup(self.table, 'eFoo', 'stock.europe.OSE', None),
             ['rFoo'],
@@ -103,6 +103,68 @@ class test_Topic(ExchangeCase):
             [],
         )
 
+    def test_lookup_wildcards(self):
+        table = [(rkey, self.e.key_to_pattern(rkey), queue)
+                 for rkey, queue in [('#', 'qAll'),
+                                     ('*', 'qOne'),
+                                     ('a.#.z', 'qAZ'),
+                                     ('a.*.z', 'qA1Z'),
+                                     ('*.b.#', 'qB')]]
+        lookup = lambda rkey: self.e.lookup(table, 'eFoo', rkey, None)
+        self.assertListEqual(lookup('x'), ['qAll', 'qOne'])
+        self.assertListEqual(lookup('a.z'), ['qAll', 'qAZ'])
+        self.assertListEqual(lookup('a.b.z'), ['qAll', 'qAZ', 'qA1Z', 'qB'])
+        self.assertListEqual(lookup('a.b.c.z'), ['qAll', 'qAZ', 'qB'])
+        self.assertListEqual(lookup('x.b'), ['qAll', 'qB'])
+        self.assertListEqual(lookup('x.y'), ['qAll'])
+
+    def test_lookup_table_changed(self):
+        self.assertListEqual(
+            self.e.lookup(self.table, 'eFoo', 'stock.us.nasdaq', None),
+            ['rFoo', 'rBar'],
+        )
+        table = self.table[1:]
+        self.assertListEqual(
+            self.e.lookup(table, 'eFoo', 'stock.us.nasdaq', None),
+            ['rBar'],
+        )
+        table.append(('stock.us.nasdaq', None, 'rBaz'))
+        self.assertListEqual(
+            self.e.lookup(table, 'eFoo', 'stock.us.nasdaq', None),
+            ['rBar', 'rBaz'],
+        )
+
+    def test_prepare_bind_unbind(self):
+        meta = self.e.prepare_bind('qFoo', 'eFoo', 'stock.#', {})
+        trie = self.e.routing_table('eFoo')
+        self.assertListEqual(trie.match('stock.us'), ['qFoo'])
+        self.e.unbind('eFoo', *meta)
+        self.assertListEqual(trie.match('stock.us'), [])
+        self.assertFalse(trie.root.children)
+
+    def test_in_sync(self):
+        trie = exchange.TopicTrie()
+        trie.rebuild(self.table, 1)
+        bindings, trie.bindings = trie.bindings, None
+        # same version: the bindings are not compared.
+        self.assertTrue(trie.in_sync(self.table, 1))
+        # no version, but the same table as last time.
+        self.assertTrue(trie.in_sync(list(self.table)))
+        trie.bindings = bindings
+
+        trie.rebuild(self.table, 1)
+        table = list(self.table)
+        table[0] = ('stock.#', None, 'rBaz')
+        self.assertFalse(trie.in_sync(table, 1 + 1))
+
+    def test_lookup_cache_size(self):
+        self.e.lookup_cache_size = 2
+        self.e._tries.clear()
+        for rkey in ('stock.a', 'stock.b', 'stock.c'):
+            self.e.lookup(self.table, 'eFoo', rkey, None)
+        self.assertListEqual(list(self.e.routing_table('eFoo')._cache),
+                             ['stock.b', 'stock.c'])
+
     def test_deliver(self):
         self.e.channel = Mock()
         self.e.channel._lookup.return_value = ('a', 'b')
@@ -6,9 +6,12 @@ pure python amqp transport.
 
 """
 from __future__ import absolute_import
+from __future__ import with_statement
 
 import amqp
 
+from contextlib import contextmanager
+
 from kombu.exceptions import (
     StdConnectionError,
     StdChannelError,
@@ -57,6 +60,20 @@ class Channel(amqp.Channel, base.StdChannel):
         """Convert encoded message body back to a Python value."""
         return self.Message(self, raw_message)
 
+    @contextmanager
+    def publish_batch(self):
+        """Context where published messages are written to the socket
+        together, if supported by the installed amqp library."""
+        writer = self.connection.method_writer
+        if not hasattr(writer, 'begin_batch'):  # pragma: no cover
+            yield
+            return
+        writer.begin_batch()
+        try:
+            yield
+        finally:
+            writer.end_batch()
+
 
 class Connection(amqp.Connection):
     Channel = Channel
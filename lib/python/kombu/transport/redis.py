@@ -9,6 +9,7 @@ from __future__ import absolute_import
 from __future__ import with_statement
 
 from bisect import bisect
+from collections import deque
 from contextlib import contextmanager
 from time import time
 from Queue import Empty
@@ -49,6 +50,31 @@ DEFAULT_DB = 0
 
 PRIORITY_STEPS = [0, 3, 6, 9]
 
+# Moves up to ARGV[1] messages from the tail of the list KEYS[1] into
+# the unacked hash KEYS[2] and index KEYS[3] (with score ARGV[2]),
+# storing them like QoS.append does, and returns them in the order
+# they would have been popped.  Requires Redis 2.6.
+PREFETCH_SCRIPT = """
+local items = redis.call('LRANGE', KEYS[1], -tonumber(ARGV[1]), -1)
+if #items == 0 then
+    return items
+end
+redis.call('LTRIM', KEYS[1], 0, -#items - 1)
+local popped = {}
+for i = #items, 1, -1 do
+    local item = items[i]
+    local properties = cjson.decode(item)['properties']
+    local tag = properties['delivery_tag']
+    local info = properties['delivery_info']
+    redis.call('ZADD', KEYS[3], ARGV[2], tag)
+    redis.call('HSET', KEYS[2], tag, '[' .. item .. ', ' ..
+        cjson.encode(info['exchange']) .. ', ' ..
+        cjson.encode(info['routing_key']) .. ']')
+    popped[#popped + 1] = item
+end
+return popped
+"""
+
 # This implementation may seem overly complex, but I assure you there is
 # a good reason for doing it this way.
 #
@@ -100,8 +126,22 @@ class QoS(virtual.QoS):
     def __init__(self, *args, **kwargs):
         super(QoS, self).__init__(*args, **kwargs)
         self._vrestore_count = 0
+        # tags of prefetched messages already stored as unacked.
+        self._prefetched = set()
+
+    def can_prefetch(self):
+        """Returns the number of messages that can be prefetched
+        without exceeding the prefetch limit (or :const:`None`
+        if there is no limit)."""
+        pcount = self.prefetch_count
+        if pcount:
+            return max(pcount - (len(self._delivered) - len(self._dirty)) -
+                       len(self._prefetched), 0)
 
     def append(self, message, delivery_tag):
+        if delivery_tag in self._prefetched:
+            self._prefetched.discard(delivery_tag)
+            return super(QoS, self).append(message, delivery_tag)
         delivery = message.delivery_info
         EX, RK = delivery['exchange'], delivery['routing_key']
         with self.pipe_or_acquire() as pipe:
@@ -276,7 +316,17 @@ class MultiChannelPoller(object):
             chan, type = self._fd_to_chan[fileno]
             chan._poll_error(type)
 
+    def get_prefetched(self):
+        for channel in self._channels:
+            item = channel._next_prefetched()
+            if item:
+                return item
+
     def get(self, timeout=None):
+        item = self.get_prefetched()
+        if item:
+            return item, self
+
         for channel in self._channels:
             if channel.active_queues:           # BRPOP mode?
                 if channel.qos.can_consume():
@@ -320,6 +370,16 @@ class Channel(virtual.Channel):
     visibility_timeout = 3600   # 1 hour
     priority_steps = PRIORITY_STEPS
     max_connections = 10
+    #: Max number of messages fetched for every ``BRPOP``, the extra
+    #: messages are moved to the unacked hash atomically and delivered
+    #: locally (requires Redis 2.6).  Never exceeds the prefetch limit.
+    bulk_prefetch_count = 1
+    #: Max number of messages buffered by :meth:`publish_batch`
+    #: before they are written to Redis.
+    publish_batch_size = 1000
+    #: Max number of seconds a message is buffered by :meth:`publish_batch`
+    #: (checked when the next message is published).
+    publish_batch_interval = 1.0
     _pool = None
 
     from_transport_options = (
@@ -331,7 +391,10 @@ class Channel(virtual.Channel):
          'visibility_timeout',
          'unacked_restore_limit',
          'max_connections',
-         'priority_steps'),
+         'priority_steps',
+         'publish_batch_size',
+         'publish_batch_interval',
+         'bulk_prefetch_count'),
     )
 
     def __init__(self, *args, **kwargs):
@@ -344,6 +407,11 @@ class Channel(virtual.Channel):
         self.active_fanout_queues = set()
         self.auto_delete_queues = set()
         self._fanout_to_queue = {}
+        self._publish_buffer = None
+        self._publish_buffer_since = None
+        # messages moved to the unacked hash, but not yet delivered,
+        # as ``(payload, queue, key)`` tuples.
+        self._prefetched = deque()
         self.handlers = {'BRPOP': self._brpop_read, 'LISTEN': self._receive}
 
         # Evaluate connection.
@@ -411,6 +479,7 @@ class Channel(virtual.Channel):
             self._fanout_to_queue.pop(self._fanout_queues[queue])
         except KeyError:
             pass
+        self._restore_prefetched(queue)
         ret = super(Channel, self).basic_cancel(consumer_tag)
         self._update_cycle()
         return ret
@@ -471,15 +540,60 @@ class Channel(virtual.Channel):
                 self.client.connection.disconnect()
                 raise Empty()
             if dest__item:
-                dest, item = dest__item
-                dest = dest.rsplit(self.sep, 1)[0]
+                key, item = dest__item
+                dest = key.rsplit(self.sep, 1)[0]
                 self._rotate_cycle(dest)
+                if self.bulk_prefetch_count > 1:
+                    self._prefetch(key, dest)
                 return loads(item), dest
             else:
                 raise Empty()
         finally:
             self._in_poll = False
 
+    def _prefetch(self, key, queue):
+        """Move more messages from the list `key` we just got a message
+        from into the unacked hash, to be delivered locally."""
+        limit = self.qos.can_prefetch()
+        n = self.bulk_prefetch_count - 1 - len(self._prefetched)
+        if limit is not None:
+            # one slot is taken by the message returned by BRPOP.
+            n = min(n, limit - 1)
+        if n < 1:
+            return
+        with self.conn_or_acquire() as client:
+            items = client.eval(PREFETCH_SCRIPT, 3, key,
+                                self.unacked_key, self.unacked_index_key,
+                                n, time())
+        for item in items or ():
+            payload = loads(item)
+            self.qos._prefetched.add(payload['properties']['delivery_tag'])
+            self._prefetched.append((payload, queue, key))
+
+    def _next_prefetched(self):
+        """Get the next prefetched message, if allowed by QoS."""
+        if self._prefetched and self.qos.can_consume():
+            payload, queue, _ = self._prefetched.popleft()
+            return payload, queue
+
+    def _restore_prefetched(self, queue=None):
+        """Put messages prefetched (from `queue`), but not delivered
+        back at the head of their queues."""
+        restore = [item for item in self._prefetched
+                   if queue is None or item[1] == queue]
+        if not restore:
+            return
+        with self.conn_or_acquire() as client:
+            pipe = client.pipeline()
+            for item in reversed(restore):
+                payload, _, key = item
+                self._prefetched.remove(item)
+                tag = payload['properties']['delivery_tag']
+                self.qos._prefetched.discard(tag)
+                pipe.rpush(key, dumps(payload))
+                self.qos._remove_from_indices(tag, pipe)
+            pipe.execute()
+
     def _poll_error(self, type, **options):
         try:
             self.client.parse_response(type)
@@ -517,9 +631,65 @@ class Channel(virtual.Channel):
                 message['properties']['delivery_info']['priority']), 9), 0)
         except (TypeError, ValueError, KeyError):
             pri = 0
+        if self._publish_buffer is not None:
+            return self._buffer_put(self._q_for_pri(queue, pri), message)
         with self.conn_or_acquire() as client:
             client.lpush(self._q_for_pri(queue, pri), dumps(message))
 
+    def _buffer_put(self, key, message):
+        buffer = self._publish_buffer
+        if not buffer:
+            self._publish_buffer_since = time()
+        buffer.append((key, dumps(message)))
+        if len(buffer) >= self.publish_batch_size or \
+                time() - self._publish_buffer_since >= \
+                self.publish_batch_interval:
+            self.flush_publish_buffer()
+
+    @contextmanager
+    def publish_batch(self):
+        """Context where published messages are buffered, and
+        written to Redis using one pipeline when the context exits,
+        or when the buffer exceeds :attr:`publish_batch_size` messages
+        or :attr:`publish_batch_interval` seconds.
+
+        Messages for the same queue and priority are sent using
+        a single multi-value ``LPUSH`` (requires Redis 2.4).
+
+        """
+        if self._publish_buffer is not None:  # nested
+            yield
+            return
+        self._publish_buffer = []
+        try:
+            yield
+        finally:
+            try:
+                self.flush_publish_buffer()
+            finally:
+                self._publish_buffer = None
+
+    def flush_publish_buffer(self):
+        """Write messages buffered by :meth:`publish_batch` to Redis."""
+        buffer = self._publish_buffer
+        if not buffer:
+            return
+        self._publish_buffer = []
+        keys, values = [], {}
+        for key, payload in buffer:
+            try:
+                values[key].append(payload)
+            except KeyError:
+                keys.append(key)
+                values[key] = [payload]
+        with self.conn_or_acquire() as client:
+            pipe = client.pipeline(transaction=False)
+            for key in keys:
+                # LPUSH pushes values from left to right, so the first
+                # message published is still the first message consumed.
+                pipe.lpush(key, *values[key])
+            pipe.execute()
+
     def _put_fanout(self, exchange, message, **kwargs):
         """Deliver fanout message."""
         with self.conn_or_acquire() as client:
@@ -578,6 +748,12 @@ class Channel(virtual.Channel):
             return sum(sizes[::2])
 
     def close(self):
+        if not self.closed:
+            try:
+                self._restore_prefetched()
+            except Exception:
+                logger.critical('Could not restore prefetched messages',
+                                exc_info=True)
         if self._pool:
             self._pool.disconnect()
         if not self.closed:
@@ -749,6 +925,7 @@ class Transport(virtual.Transport):
     def on_poll_start(self):
         """Called by hub before each ``poll()``"""
         cycle = self.cycle
+        self._deliver_prefetched()
         cycle.on_poll_start()
         return dict((fd, self.handle_event) for fd in cycle.fds)
 
@@ -766,6 +943,23 @@ class Transport(virtual.Transport):
                     "Received message for queue '%s' without consumers: %s" % (
                         queue, message))
             self._callbacks[queue](message)
+            self._deliver_prefetched()
+
+    def _deliver_prefetched(self):
+        get_prefetched = self.cycle.get_prefetched
+        while 1:
+            item = get_prefetched()
+            if not item:
+                break
+            message, queue = item
+            try:
+                callback = self._callbacks[queue]
+            except KeyError:
+                logger.error(
+                    "Received message for queue '%s' without consumers: %s",
+                    queue, message)
+            else:
+                callback(message)
 
     def _get_errors(self):
         """Utility to import redis-py's exceptions at runtime."""
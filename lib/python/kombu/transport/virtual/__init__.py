@@ -319,6 +319,9 @@ class Channel(AbstractChannel, base.StdChannel):
     #: counter used to generate delivery tags for this channel.
     _next_delivery_tag = count(1).next
 
+    #: counter used to version the binding tables in the broker state.
+    _next_table_version = count(1).next
+
     #: Optional queue where messages with no route is delivered.
     #: Set by ``transport_options['deadletter_queue']``.
     deadletter_queue = None
@@ -408,10 +411,17 @@ class Channel(AbstractChannel, base.StdChannel):
             exchange, routing_key, arguments = self.state.bindings[queue]
         except KeyError:
             return
-        meta = self.typeof(exchange).prepare_bind(queue, exchange,
-                                                  routing_key, arguments)
+        type = self.typeof(exchange)
+        meta = type.prepare_bind(queue, exchange, routing_key, arguments)
         self._delete(queue, exchange, *meta)
         self.state.bindings.pop(queue, None)
+        try:
+            self.state.exchanges[exchange]['table'].remove(meta)
+        except (KeyError, ValueError):
+            pass
+        else:
+            self._table_changed(exchange)
+        type.unbind(exchange, *meta)
 
     def after_reply_message_received(self, queue):
         self.queue_delete(queue)
@@ -437,6 +447,7 @@ class Channel(AbstractChannel, base.StdChannel):
                                                   routing_key,
                                                   arguments)
         table.append(meta)
+        self._table_changed(exchange)
         if self.supports_fanout:
             self._queue_bind(exchange, *meta)
 
@@ -533,6 +544,22 @@ class Channel(AbstractChannel, base.StdChannel):
         """Get table of bindings for `exchange`."""
         return self.state.exchanges[exchange]['table']
 
+    def get_table_version(self, exchange):
+        """Get the version of the table of bindings for `exchange`,
+        which changes every time a binding is added or removed.
+
+        Returns :const:`None` if the version is not known, e.g. when the
+        table is stored by the broker (:attr:`supports_fanout`), where
+        other clients can change it.
+
+        """
+        if not self.supports_fanout:
+            return self.state.exchanges[exchange].get('table_version')
+
+    def _table_changed(self, exchange):
+        self.state.exchanges[exchange]['table_version'] = \
+            self._next_table_version()
+
     def typeof(self, exchange, default='direct'):
         """Get the exchange type instance for `exchange`."""
         try:
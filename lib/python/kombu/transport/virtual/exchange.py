@@ -8,7 +8,10 @@ by the AMQ protocol  (excluding the `headers` exchange).
 """
 from __future__ import absolute_import
 
+from itertools import count
+
 from kombu.utils import escape_regex
+from kombu.utils.compat import OrderedDict
 
 import re
 
@@ -37,6 +40,11 @@ class ExchangeType(object):
         for bindings to this exchange."""
         return routing_key, None, queue
 
+    def unbind(self, exchange, routing_key, pattern, queue):
+        """Called when a binding (as returned by :meth:`prepare_bind`)
+        is removed from `exchange`."""
+        pass
+
     def equivalent(self, prev, exchange, type,
                    durable, auto_delete, arguments):
         """Returns true if `prev` and `exchange` is equivalent."""
@@ -61,10 +69,136 @@ class DirectExchange(ExchangeType):
             _put(queue, message, **kwargs)
 
 
+class _TrieNode(object):
+    __slots__ = ('children', 'queues')
+
+    def __init__(self):
+        # word -> _TrieNode
+        self.children = {}
+        # queue -> binding index (used to keep the order of the table).
+        self.queues = {}
+
+
+class TopicTrie(object):
+    """Routing table for topic bindings.
+
+    Binding keys are stored in a trie of their words, so that matching
+    a routing key only visits the nodes for its words and the wildcards
+    ``*`` (exactly one word) and ``#`` (zero or more words), instead of
+    trying every binding.  The results for the most recently used
+    routing keys are cached.
+
+    :keyword cache_size: Max number of routing keys to cache results for.
+
+    """
+    #: the table (and its version) the trie was last found
+    #: to be in sync with.
+    _table = None
+    _version = None
+
+    def __init__(self, cache_size=1000):
+        self.cache_size = cache_size
+        self.root = _TrieNode()
+        self.bindings = set()
+        self._cache = OrderedDict()
+        self._next_index = count().next
+
+    def add(self, routing_key, pattern, queue):
+        binding = (routing_key, pattern, queue)
+        if binding in self.bindings:
+            return
+        self.bindings.add(binding)
+        node = self.root
+        for word in (routing_key or '').split('.'):
+            try:
+                node = node.children[word]
+            except KeyError:
+                child = node.children[word] = _TrieNode()
+                node = child
+        node.queues.setdefault(queue, self._next_index())
+        self._cache.clear()
+        self._table = self._version = None
+
+    def remove(self, routing_key, pattern, queue):
+        binding = (routing_key, pattern, queue)
+        if binding not in self.bindings:
+            return
+        self.bindings.discard(binding)
+        path = [self.root]
+        words = (routing_key or '').split('.')
+        for word in words:
+            path.append(path[-1].children[word])
+        path[-1].queues.pop(queue, None)
+        # prune nodes that no longer lead to any queues.
+        for i in xrange(len(words), 0, -1):
+            node = path[i]
+            if node.queues or node.children:
+                break
+            del path[i - 1].children[words[i - 1]]
+        self._cache.clear()
+        self._table = self._version = None
+
+    def rebuild(self, table, version=None):
+        self.root = _TrieNode()
+        self.bindings = set()
+        self._cache.clear()
+        for routing_key, pattern, queue in table:
+            self.add(routing_key, pattern, queue)
+        self._table, self._version = list(table), version
+
+    def in_sync(self, table, version=None):
+        """Returns true if the trie contains exactly the bindings in `table`.
+
+        If the `version` of the table is known, the bindings are only
+        compared when it changes.  Otherwise the table is first compared
+        with the table last found to be in sync, which is cheaper than
+        comparing the bindings when the table is fetched from the broker
+        for every lookup.
+
+        """
+        if version is not None and version == self._version:
+            return True
+        if table != self._table:
+            if self.bindings != set(table):
+                return False
+            self._table = list(table)
+        self._version = version
+        return True
+
+    def match(self, routing_key):
+        """Returns the list of queues bound with a binding key
+        matching `routing_key`."""
+        cache = self._cache
+        try:
+            queues = cache.pop(routing_key)
+        except KeyError:
+            found = {}
+            self._collect(self.root, routing_key.split('.'), 0, found)
+            queues = sorted(found, key=found.__getitem__)
+            if cache and len(cache) >= self.cache_size:
+                cache.popitem(last=False)
+        if self.cache_size:
+            cache[routing_key] = queues
+        return list(queues)
+
+    def _collect(self, node, words, i, found):
+        hash_node = node.children.get('#')
+        if hash_node is not None:
+            for j in xrange(i, len(words) + 1):
+                self._collect(hash_node, words, j, found)
+        if i == len(words):
+            found.update(node.queues)
+            return
+        for word in (words[i], '*'):
+            child = node.children.get(word)
+            if child is not None:
+                self._collect(child, words, i + 1, found)
+
+
 class TopicExchange(ExchangeType):
     """The `topic` exchange routes messages based on words separated by
     dots, using wildcard characters ``*`` (any single word), and ``#``
-    (one or more words)."""
+    (zero or more words)."""
     type = 'topic'
 
     #: map of wildcard to regex conversions
@@ -74,9 +208,38 @@ class TopicExchange(ExchangeType):
     #: compiled regex cache
     _compiled = {}
 
+    #: Max number of routing keys to cache lookup results for,
+    #: for every exchange.
+    lookup_cache_size = 1000
+
+    def __init__(self, channel):
+        super(TopicExchange, self).__init__(channel)
+        # exchange -> TopicTrie
+        self._tries = {}
+
     def lookup(self, table, exchange, routing_key, default):
-        return [queue for rkey, pattern, queue in table
-                if self._match(pattern, routing_key)]
+        return self.routing_table(exchange, table).match(routing_key)
+
+    def routing_table(self, exchange, table=None):
+        """Get the :class:`TopicTrie` for `exchange`, rebuilding it
+        if `table` contains different bindings."""
+        try:
+            trie = self._tries[exchange]
+        except KeyError:
+            trie = self._tries[exchange] = TopicTrie(self.lookup_cache_size)
+        if table is not None:
+            version = self.table_version(exchange)
+            if not trie.in_sync(table, version):
+                trie.rebuild(table, version)
+        return trie
+
+    def table_version(self, exchange):
+        get_table_version = getattr(self.channel, 'get_table_version', None)
+        if get_table_version is not None:
+            try:
+                return get_table_version(exchange)
+            except KeyError:
+                pass
 
     def deliver(self, message, exchange, routing_key, **kwargs):
         _lookup = self.channel._lookup
@@ -87,7 +250,12 @@ class TopicExchange(ExchangeType):
             _put(queue, message, **kwargs)
 
     def prepare_bind(self, queue, exchange, routing_key, arguments):
-        return routing_key, self.key_to_pattern(routing_key), queue
+        meta = routing_key, self.key_to_pattern(routing_key), queue
+        self.routing_table(exchange).add(*meta)
+        return meta
+
+    def unbind(self, exchange, routing_key, pattern, queue):
+        self.routing_table(exchange).remove(routing_key, pattern, queue)
 
     def key_to_pattern(self, rkey):
         """Get the corresponding regex for any routing key."""
@@ -47,6 +47,18 @@ initializes a shared database -- then set ``_multiprocess_shared_ = True`` in
 the context. These fixtures will then execute in the primary nose process, and
 tests in those contexts will be individually dispatched to run in parallel.
 
+Scheduling by duration
+======================
+
+By default, tests are dispatched in the order they were collected, so a slow
+module collected last can keep one worker busy long after the others have
+finished. If you pass ``--process-timing-file=FILE``, the time each dispatched
+test or suite took is recorded in FILE at the end of the run. On the next run,
+the tests and suites are queued longest first; those without a recorded time
+are estimated to take the average time. Idle workers always take the next
+queued test, so the longest ones start early and the short ones fill the gaps.
+The time each worker spent running tests is reported at the end of the run.
+
 How results are collected and reported
 ======================================
 
@@ -164,6 +176,13 @@ class MultiProcess(Plugin):
                           metavar="SECONDS",
                           help="Set timeout for return of results from each "
                           "test runner process. [NOSE_PROCESS_TIMEOUT]")
+        parser.add_option("--process-timing-file", action="store",
+                          default=env.get('NOSE_PROCESS_TIMING_FILE'),
+                          dest="multiprocess_timing_file",
+                          metavar="FILE",
+                          help="Record how long each test or suite takes to "
+                          "run in this file, and dispatch the slowest ones "
+                          "first in the next run. [NOSE_PROCESS_TIMING_FILE]")
 
     def configure(self, options, config):
         """
@@ -192,6 +211,12 @@ class MultiProcess(Plugin):
             self.enabled = True
             self.config.multiprocess_workers = workers
             self.config.multiprocess_timeout = int(options.multiprocess_timeout)
+            timing_file = getattr(options, 'multiprocess_timing_file', None)
+            if timing_file:
+                timing_file = os.path.expanduser(timing_file)
+                if not os.path.isabs(timing_file):
+                    timing_file = os.path.join(config.workingDir, timing_file)
+            self.config.multiprocess_timing_file = timing_file
             self.status['active'] = True
 
     def prepareTestLoader(self, loader):
@@ -242,6 +267,9 @@ class MultiProcessTestRunner(TextTestRunner):
         to_teardown = []
         shouldStop = Event()
 
+        queued = []
+        timing_file = getattr(self.config, 'multiprocess_timing_file', None)
+
         result = self._makeResult()
         start = time.time()
 
@@ -268,18 +296,24 @@ class MultiProcessTestRunner(TextTestRunner):
                     to_teardown.append(case)
                     for _t in case:
                         test_addr = self.address(_t)
-                        testQueue.put(test_addr, block=False)
+                        queued.append(test_addr)
                         tasks[test_addr] = None
                         log.debug("Queued shared-fixture test %s (%s) to %s",
                                   len(tasks), test_addr, testQueue)
 
             else:
                 test_addr = self.address(case)
-                testQueue.put(test_addr, block=False)
+                queued.append(test_addr)
                 tasks[test_addr] = None
                 log.debug("Queued test %s (%s) to %s",
                           len(tasks), test_addr, testQueue)
 
+        if timing_file:
+            timings = self.loadTimings(timing_file)
+            queued = self.schedule(queued, timings)
+        for test_addr in queued:
+            testQueue.put(test_addr, block=False)
+
         log.debug("Starting %s workers", self.config.multiprocess_workers)
         for i in range(self.config.multiprocess_workers):
             p = Process(target=runner, args=(i,
@@ -294,14 +328,21 @@ class MultiProcessTestRunner(TextTestRunner):
             workers.append(p)
             log.debug("Started worker process %s", i+1)
 
+        workers_start = time.time()
+        durations = {}
+        busy = [0.0] * len(workers)
+        ran = [0] * len(workers)
         num_tasks = len(tasks)
         while tasks:
             log.debug("Waiting for results (%s/%s tasks)",
                       len(completed), num_tasks)
             try:
-                addr, batch_result = resultQueue.get(
+                addr, batch_result, ix, duration = resultQueue.get(
                     timeout=self.config.multiprocess_timeout)
                 log.debug('Results received for %s', addr)
+                durations[addr] = duration
+                busy[ix] += duration
+                ran[ix] += 1
                 try:
                     tasks.pop(addr)
                 except KeyError:
@@ -338,6 +379,12 @@ class MultiProcessTestRunner(TextTestRunner):
 
         stop = time.time()
 
+        if timing_file:
+            timings.update(durations)
+            self.saveTimings(timing_file, timings)
+        if timing_file or self.config.verbosity > 1:
+            self.printUtilization(busy, ran, stop - workers_start)
+
         result.printErrors()
         result.printSummary(start, stop)
         self.config.plugins.finalize(result)
@@ -349,6 +396,56 @@ class MultiProcessTestRunner(TextTestRunner):
 
         return result
 
+    def loadTimings(self, timing_file):
+        """Load the durations recorded by previous runs, by test address.
+        """
+        try:
+            fh = open(timing_file, 'rb')
+            try:
+                return pickle.load(fh)
+            finally:
+                fh.close()
+        except (IOError, EOFError, ValueError, pickle.UnpicklingError):
+            log.debug('Unable to load timings from %s', timing_file)
+            return {}
+
+    def saveTimings(self, timing_file, timings):
+        try:
+            fh = open(timing_file, 'wb')
+            try:
+                pickle.dump(timings, fh)
+            finally:
+                fh.close()
+        except IOError:
+            log.debug('Unable to save timings to %s', timing_file)
+
+    def schedule(self, addrs, timings):
+        """Order test addresses longest first, by the durations recorded in
+        timings. Addresses without a recorded duration are estimated to take
+        the average of the others; ties keep the collection order.
+        """
+        known = [timings[addr] for addr in addrs if addr in timings]
+        if not known:
+            return addrs
+        default = sum(known) / len(known)
+        decorated = [(-timings.get(addr, default), i, addr)
+                     for i, addr in enumerate(addrs)]
+        decorated.sort()
+        return [addr for _, _, addr in decorated]
+
+    def printUtilization(self, busy, ran, elapsed):
+        if self.config.verbosity == 1:
+            # end the line of dots
+            self.stream.writeln()
+        self.stream.writeln("Worker utilization over %.3fs:" % elapsed)
+        for ix in range(len(busy)):
+            if elapsed:
+                percent = 100.0 * busy[ix] / elapsed
+            else:
+                percent = 0.0
+            self.stream.writeln("  worker %s: %.3fs busy (%.1f%%), %s tasks"
+                                % (ix, busy[ix], percent, ran[ix]))
+
     def address(self, case):
         if hasattr(case, 'address'):
             file, mod, call = case.address()
@@ -489,19 +586,22 @@ def runner(ix, testQueue, resultQueue, shouldStop,
             for test_addr in iter(get, 'STOP'):
                 if shouldStop.is_set():
                     break
+                start = time.time()
                 result = makeResult()
                 test = loader.loadTestsFromNames([test_addr])
                 log.debug("Worker %s Test is %s (%s)", ix, test_addr, test)
 
                 try:
                     test(result)
-                    resultQueue.put((test_addr, batch(result)))
+                    resultQueue.put((test_addr, batch(result), ix,
+                                     time.time() - start))
                 except KeyboardInterrupt, SystemExit:
                     raise
                 except:
                     log.exception("Error running test or returning results")
                     failure.Failure(*sys.exc_info())(result)
-                    resultQueue.put((test_addr, batch(result)))
+                    resultQueue.put((test_addr, batch(result), ix,
+                                     time.time() - start))
         except Empty:
             log.debug("Worker %s timed out waiting for tasks", ix)
     finally:
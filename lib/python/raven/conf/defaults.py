@@ -65,3 +65,17 @@ PROCESSORS = (
 
 # Default Project ID
 PROJECT = 1
+
+# Maximum number of events waiting to be sent by the asynchronous clients
+ASYNC_QUEUE_SIZE = 1000
+
+# Maximum number of queued events sent each time the background thread wakes up
+ASYNC_BATCH_SIZE = 100
+
+# Identical events (same checksum) seen again within this many seconds are
+# not sent by the asynchronous clients. Set to 0 to send every event.
+DEDUPE_WINDOW = 10
+
+# File to write events to when the asynchronous client's queue is full; they
+# are sent once the queue has room again. If not set, the events are dropped.
+SPILL_PATH = None
@@ -6,20 +6,36 @@ raven.contrib.async
 :license: BSD, see LICENSE for more details.
 """
 
-from Queue import Queue
+from Queue import Queue, Empty, Full
+from StringIO import StringIO
 from raven.base import Client
+from raven.conf import defaults
 from threading import Thread, Lock
+from urlparse import urlparse
 import atexit
+import httplib
+import logging
 import os
+import socket
+import time
+import urllib2
 
 SENTRY_WAIT_SECONDS = 10
 
 
 class AsyncWorker(object):
+    """
+    Runs callbacks in a background thread.
+
+    ``maxsize`` bounds the queue (:meth:`queue` returns ``False`` when it
+    is full), and up to ``batch_size`` callbacks are taken off the queue
+    each time the thread wakes up.
+    """
     _terminator = object()
 
-    def __init__(self):
-        self._queue = Queue(-1)
+    def __init__(self, maxsize=-1, batch_size=1):
+        self._queue = Queue(maxsize)
+        self.batch_size = batch_size
         self._lock = Lock()
         self._thread = None
         self.start()
@@ -56,37 +72,211 @@ class AsyncWorker(object):
         self._lock.acquire()
         try:
             if self._thread:
-                self._queue.put_nowait(self._terminator)
-                self._thread.join(timeout=timeout)
+                if timeout is not None:
+                    deadline = time.time() + timeout
+                try:
+                    # the queue may be full, so wait for room.
+                    self._queue.put(self._terminator, timeout=timeout)
+                except Full:
+                    pass
+                else:
+                    if timeout is not None:
+                        timeout = max(deadline - time.time(), 0)
+                    self._thread.join(timeout=timeout)
                 self._thread = None
         finally:
             self._lock.release()
 
     def queue(self, callback, kwargs):
-        self._queue.put_nowait((callback, kwargs))
+        try:
+            self._queue.put_nowait((callback, kwargs))
+        except Full:
+            return False
+        return True
+
+    def qsize(self):
+        return self._queue.qsize()
 
     def _target(self):
         while 1:
-            record = self._queue.get()
-            if record is self._terminator:
-                break
-            callback, kwargs = record
-            callback(**kwargs)
+            records = [self._queue.get()]
+            try:
+                while len(records) < self.batch_size:
+                    records.append(self._queue.get_nowait())
+            except Empty:
+                pass
+            for record in records:
+                if record is self._terminator:
+                    return
+                callback, kwargs = record
+                try:
+                    callback(**kwargs)
+                except Exception, e:
+                    logging.getLogger('sentry.errors').error(
+                        'Unable to process queued event: %s', e, exc_info=True)
 
 
-class AsyncClient(Client):
+class AsyncMixin(object):
     """
-    This client uses a single background thread to dispatch errors.
+    Sends events from a single background thread, so that capturing an
+    event does not wait for the Sentry server (or for encoding the event).
+
+    - The queue is bounded by ``queue_size``. When it is full, events are
+      written to ``spill_path`` if set (and sent later), otherwise dropped.
+    - Events with the same checksum as an event sent less than
+      ``dedupe_window`` seconds ago are dropped.
+    - HTTP connections to the servers are kept open between events.
+    - The ``ClientState`` backoff applies as for the blocking client.
     """
-    def __init__(self, worker=None, *args, **kwargs):
-        self.worker = worker or AsyncWorker()
-        super(AsyncClient, self).__init__(*args, **kwargs)
+    def __init__(self, *args, **kwargs):
+        worker = kwargs.pop('worker', None)
+        queue_size = kwargs.pop('queue_size', None) or defaults.ASYNC_QUEUE_SIZE
+        batch_size = kwargs.pop('batch_size', None) or defaults.ASYNC_BATCH_SIZE
+        dedupe_window = kwargs.pop('dedupe_window', None)
+        if dedupe_window is None:
+            dedupe_window = defaults.DEDUPE_WINDOW
+        self.dedupe_window = dedupe_window
+        self.spill_path = kwargs.pop('spill_path', None) or defaults.SPILL_PATH
+        super(AsyncMixin, self).__init__(*args, **kwargs)
+        self.worker = worker or AsyncWorker(queue_size, batch_size)
+        self._recent = {}
+        self._connections = {}
+        self._spill_lock = Lock()
 
     def send_sync(self, **kwargs):
-        super(AsyncClient, self).send(**kwargs)
+        super(AsyncMixin, self).send(**kwargs)
+        if self.spill_path and not self.worker.qsize():
+            self.send_spilled()
 
     def send(self, **kwargs):
-        self.worker.queue(self.send_sync, kwargs)
+        if self.is_duplicate(kwargs):
+            return
+        if not self.worker.queue(self.send_sync, kwargs):
+            self.spill(kwargs)
+
+    def is_duplicate(self, data):
+        checksum = data.get('checksum')
+        if not (self.dedupe_window and checksum):
+            return False
+        now = time.time()
+        recent = self._recent
+        key = (data.get('project'), checksum)
+        last_seen = recent.get(key)
+        if last_seen is not None and now - last_seen < self.dedupe_window:
+            return True
+        if len(recent) > 1000:
+            for k, seen in recent.items():
+                if now - seen >= self.dedupe_window:
+                    recent.pop(k, None)
+        recent[key] = now
+        return False
+
+    def spill(self, data):
+        if not self.spill_path:
+            self.error_logger.error('Sentry queue is full, dropping event: %r',
+                data.get('message'))
+            return
+        self.spill_encoded([self.encode(data)])
+
+    def spill_encoded(self, messages):
+        self._spill_lock.acquire()
+        try:
+            fh = open(self.spill_path, 'a')
+            try:
+                for message in messages:
+                    fh.write(message + '\n')
+            finally:
+                fh.close()
+        finally:
+            self._spill_lock.release()
+
+    def send_spilled(self):
+        """
+        Sends the events written to ``spill_path``, if the server is
+        currently reachable.
+
+        The spilled events are moved to ``<spill_path>.sending`` while they
+        are sent, and the ones that could not be sent are written to
+        ``spill_path`` again before that file is removed.  Events left in
+        it by a process that died while sending are sent the next time.
+        """
+        if self.state.status != self.state.ONLINE:
+            return
+        sending_path = self.spill_path + '.sending'
+        self._spill_lock.acquire()
+        try:
+            if not os.path.exists(sending_path):
+                try:
+                    os.rename(self.spill_path, sending_path)
+                except OSError:
+                    return
+        finally:
+            self._spill_lock.release()
+        fh = open(sending_path)
+        try:
+            messages = [m for m in fh.read().splitlines() if m]
+        finally:
+            fh.close()
+        unsent = []
+        for i, message in enumerate(messages):
+            self.send_encoded(message)
+            if self.state.status != self.state.ONLINE:
+                # the server is unreachable again, keep the rest for later.
+                unsent = messages[i:]
+                break
+        if unsent:
+            self.spill_encoded(unsent)
+        os.unlink(sending_path)
+
+    def send_http(self, url, data, headers={}):
+        """
+        Sends a request to a remote webserver using HTTP POST, over a
+        connection kept open for the next request.
+        """
+        parsed = urlparse(url)
+        key = (parsed.scheme, parsed.netloc)
+        path = parsed.path or '/'
+        if parsed.query:
+            path += '?' + parsed.query
+        while 1:
+            conn = self._connections.get(key)
+            reused = conn is not None
+            if not reused:
+                conn = self._connections[key] = self._get_connection(
+                    parsed.scheme, parsed.netloc)
+            try:
+                conn.request('POST', path, data, headers)
+                response = conn.getresponse()
+                body = response.read()
+            except (httplib.HTTPException, socket.error):
+                conn.close()
+                del self._connections[key]
+                if reused:
+                    # the server may have closed the idle connection.
+                    continue
+                raise
+            if response.status >= 300:
+                raise urllib2.HTTPError(url, response.status, response.reason,
+                    response.msg, StringIO(body))
+            return body
+
+    def _get_connection(self, scheme, netloc):
+        if scheme == 'https':
+            cls = httplib.HTTPSConnection
+        else:
+            cls = httplib.HTTPConnection
+        try:
+            return cls(netloc, timeout=self.timeout)
+        except TypeError:
+            return cls(netloc)
+
+
+class AsyncClient(AsyncMixin, Client):
+    """
+    This client uses a single background thread to dispatch errors.
+    """
+    def __init__(self, worker=None, *args, **kwargs):
+        super(AsyncClient, self).__init__(worker=worker, *args, **kwargs)
 
 
 class SentryWorker(object):
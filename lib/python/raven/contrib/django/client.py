@@ -16,10 +16,11 @@ from django.template import TemplateSyntaxError
 from django.template.loader import LoaderOrigin
 
 from raven.base import Client
+from raven.contrib.async import AsyncMixin
 from raven.contrib.django.utils import get_data_from_template
 from raven.utils.wsgi import get_headers, get_environ
 
-__all__ = ('DjangoClient',)
+__all__ = ('DjangoClient', 'AsyncDjangoClient')
 
 
 class DjangoClient(Client):
@@ -124,3 +125,10 @@ class DjangoClient(Client):
     def send_integrated(self, kwargs):
         from sentry.models import Group
         return Group.objects.from_kwargs(**kwargs)
+
+
+class AsyncDjangoClient(AsyncMixin, DjangoClient):
+    """
+    Sends events from a background thread, see
+    :class:`raven.contrib.async.AsyncMixin`.
+    """
@@ -30,4 +30,8 @@ def patch_for_test_db_setup():
         # tests should always be up to date with the most recent model structure
         management._commands['syncdb'] = 'django.core'
     else:
-        management._commands['syncdb'] = MigrateAndSyncCommand()
\ No newline at end of file
+        management._commands['syncdb'] = MigrateAndSyncCommand()
+    if getattr(settings, "SOUTH_TESTS_SNAPSHOT", False):
+        # Restore the test databases from snapshots instead, when possible
+        from south.snapshot import patch_for_test_db_snapshots
+        patch_for_test_db_snapshots()
\ No newline at end of file
@@ -0,0 +1,199 @@
+"""
+Snapshots of the test database, so tests don't have to run every migration.
+
+Enabled by setting SOUTH_TESTS_SNAPSHOT to True. The first time a test
+database is created, it is synced and migrated as usual, and a dump of it
+(schema and data, including initial_data fixtures) is saved in
+SOUTH_TESTS_SNAPSHOT_DIR (a directory of the user in the temporary directory
+by default). The name of the dump contains a hash of the installed apps,
+their models, migrations and fixtures and SOUTH_TESTS_MIGRATE, so later test
+runs restore the dump instead, until one of those changes.
+
+Only SQLite databases can be snapshotted; other databases are created as
+usual. If SOUTH_TESTS_SNAPSHOT_CLONE is True, a file-based test database is
+restored to a file of its own in each process (the process id is appended
+to its name), so test processes can run in parallel.
+"""
+
+import getpass
+import os
+import tempfile
+
+try:
+    from hashlib import sha1
+except ImportError:
+    from sha import new as sha1
+
+from django.conf import settings
+from django.db import models
+
+import south
+from south import exceptions
+from south.migration import Migrations
+from south.migration.utils import get_app_label
+
+
+def get_snapshot_dir():
+    "Returns the directory the snapshots are stored in."
+    return getattr(settings, "SOUTH_TESTS_SNAPSHOT_DIR", None) or \
+        os.path.join(tempfile.gettempdir(), "south-snapshots-%s" % getpass.getuser())
+
+
+def can_snapshot(connection):
+    "Returns if the test database of the connection can be snapshotted."
+    return getattr(connection, "vendor", None) == "sqlite"
+
+
+def _source_files(filename):
+    "Returns the source files of the module loaded from filename."
+    if filename.endswith((".pyc", ".pyo")):
+        filename = filename[:-1]
+    if os.path.basename(filename) == "__init__.py":
+        return _files_in(os.path.dirname(filename), ".py")
+    return [filename]
+
+
+def _files_in(directory, extension=""):
+    "Returns the files under directory ending with extension, in a stable order."
+    found = []
+    for dirpath, dirnames, filenames in os.walk(directory):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if filename.endswith(extension):
+                found.append(os.path.join(dirpath, filename))
+    return found
+
+
+def snapshot_key(connection):
+    """
+    Returns a hash of everything the test database is built from: the
+    database engine, whether it is migrated or synced, the installed apps
+    and the source of their models and migrations, and their fixtures.
+    """
+    key = sha1()
+    key.update(south.__version__)
+    key.update(connection.settings_dict["ENGINE"])
+    key.update(str(bool(getattr(settings, "SOUTH_TESTS_MIGRATE", True))))
+    filenames = []
+    for app in models.get_apps():
+        key.update(app.__name__)
+        filenames.extend(_source_files(app.__file__))
+        app_dir = os.path.dirname(app.__file__)
+        if os.path.basename(app.__file__).startswith("__init__."):
+            app_dir = os.path.dirname(app_dir)
+        filenames.extend(_files_in(os.path.join(app_dir, "fixtures")))
+        try:
+            migrations = Migrations(get_app_label(app))
+        except exceptions.NoMigrations:
+            pass
+        else:
+            filenames.extend(_files_in(migrations.migrations_dir(), ".py"))
+    for fixture_dir in getattr(settings, "FIXTURE_DIRS", ()):
+        filenames.extend(_files_in(fixture_dir))
+    for filename in filenames:
+        key.update(os.path.basename(filename))
+        f = open(filename, "rb")
+        try:
+            key.update(f.read())
+        finally:
+            f.close()
+    return key.hexdigest()
+
+
+def snapshot_path(connection):
+    "Returns the file the snapshot of the connection's test database is in."
+    return os.path.join(get_snapshot_dir(), "%s-%s.sql" % (
+        connection.alias, snapshot_key(connection),
+    ))
+
+
+def save_snapshot(connection, path):
+    "Dumps the database of the connection to path."
+    directory = os.path.dirname(path)
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    connection.cursor()
+    # Write to a temporary file first, so that other processes never read
+    # a partial dump.
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    f = os.fdopen(fd, "w")
+    try:
+        for line in connection.connection.iterdump():
+            f.write(line.encode("utf-8"))
+            f.write("\n")
+    finally:
+        f.close()
+    # mkstemp creates the file readable by its owner only.
+    os.chmod(tmp_path, 0644)
+    os.rename(tmp_path, path)
+
+
+def restore_snapshot(connection, path):
+    "Loads the dump in path into the (empty) database of the connection."
+    f = open(path)
+    try:
+        dump = f.read().decode("utf-8")
+    finally:
+        f.close()
+    connection.cursor()
+    connection.connection.executescript(dump)
+
+
+def create_test_db(creation, create_test_db, verbosity=1, autoclobber=False):
+    """
+    Creates the test database of creation.connection, restoring it from its
+    snapshot if there is one. Otherwise, creates it with create_test_db (the
+    original method) and saves its snapshot.
+    """
+    connection = creation.connection
+    if not can_snapshot(connection):
+        return create_test_db(verbosity, autoclobber)
+
+    test_database_name = creation._get_test_db_name()
+    if test_database_name != ":memory:" and \
+            getattr(settings, "SOUTH_TESTS_SNAPSHOT_CLONE", False):
+        test_database_name = "%s.%s" % (test_database_name, os.getpid())
+        connection.settings_dict["TEST_NAME"] = test_database_name
+
+    path = snapshot_path(connection)
+    if not os.path.exists(path):
+        test_database_name = create_test_db(verbosity, autoclobber)
+        if verbosity >= 1:
+            print "Saving snapshot of test database for alias '%s'..." % connection.alias
+        save_snapshot(connection, path)
+        return test_database_name
+
+    if verbosity >= 1:
+        test_db_repr = ""
+        if verbosity >= 2:
+            test_db_repr = " ('%s')" % path
+        print "Restoring test database for alias '%s' from snapshot%s..." % (
+            connection.alias, test_db_repr)
+    creation._create_test_db(verbosity, autoclobber)
+    connection.close()
+    connection.settings_dict["NAME"] = test_database_name
+    if hasattr(connection.features, "confirm"):
+        connection.features.confirm()
+    restore_snapshot(connection, path)
+    return test_database_name
+
+
+def patch_for_test_db_snapshots():
+    "Makes the test databases of all connections be created from snapshots."
+    try:
+        from django.db import connections
+    except ImportError:
+        # Django 1.0/1.1
+        from django.db import connection
+        all_connections = [connection]
+    else:
+        all_connections = [connections[alias] for alias in connections]
+    for connection in all_connections:
+        creation = connection.creation
+        if getattr(creation.create_test_db, "south_snapshot", False):
+            continue
+        def snapshot_create_test_db(verbosity=1, autoclobber=False,
+                creation=creation, original=creation.create_test_db):
+            return create_test_db(creation, original, verbosity, autoclobber)
+        snapshot_create_test_db.south_snapshot = True
+        creation.create_test_db = snapshot_create_test_db
@@ -59,3 +59,4 @@ if not skiptest:
     from south.tests.autodetection import *
     from south.tests.logger import *
     from south.tests.inspector import *
+    from south.tests.snapshot import *
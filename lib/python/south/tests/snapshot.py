@@ -0,0 +1,64 @@
+import os
+import shutil
+import unittest
+import tempfile
+
+from django.conf import settings
+from django.db import connection
+
+from south import snapshot
+
+class TestSnapshot(unittest.TestCase):
+
+    """
+    Tests the test database snapshots.
+    """
+
+    def setUp(self):
+        self.fixture_dir = tempfile.mkdtemp()
+        self.old_fixture_dirs = getattr(settings, "FIXTURE_DIRS", ())
+        settings.FIXTURE_DIRS = (self.fixture_dir,)
+
+    def tearDown(self):
+        settings.FIXTURE_DIRS = self.old_fixture_dirs
+        shutil.rmtree(self.fixture_dir)
+
+    def test_key_changes_with_fixtures(self):
+        "Does the snapshot key change when a fixture changes?"
+        key = snapshot.snapshot_key(connection)
+        self.assertEqual(key, snapshot.snapshot_key(connection))
+        fh = open(os.path.join(self.fixture_dir, "initial_data.json"), "w")
+        fh.write("[]")
+        fh.close()
+        self.assertNotEqual(key, snapshot.snapshot_key(connection))
+
+    def test_key_changes_with_migrate_setting(self):
+        "Does the snapshot key change when SOUTH_TESTS_MIGRATE changes?"
+        old_migrate = getattr(settings, "SOUTH_TESTS_MIGRATE", True)
+        try:
+            settings.SOUTH_TESTS_MIGRATE = True
+            key = snapshot.snapshot_key(connection)
+            settings.SOUTH_TESTS_MIGRATE = False
+            self.assertNotEqual(key, snapshot.snapshot_key(connection))
+        finally:
+            settings.SOUTH_TESTS_MIGRATE = old_migrate
+
+    def test_save_and_restore(self):
+        "Is a saved snapshot restored into an empty database?"
+        if not snapshot.can_snapshot(connection):
+            return
+        cursor = connection.cursor()
+        cursor.execute("CREATE TABLE south_snapshot_test (name varchar(10))")
+        cursor.execute("INSERT INTO south_snapshot_test VALUES (%s)", [u"\xe9t\xe9"])
+        path = os.path.join(self.fixture_dir, "snapshot.sql")
+        snapshot.save_snapshot(connection, path)
+        # Readable by the other users sharing the snapshot directory.
+        self.assertEqual(os.stat(path).st_mode & 0777, 0644)
+        cursor.execute("DROP TABLE south_snapshot_test")
+        empty = connection.creation.connection.__class__(
+            dict(connection.settings_dict, NAME=":memory:"), "snapshot")
+        snapshot.restore_snapshot(empty, path)
+        cursor = empty.cursor()
+        cursor.execute("SELECT name FROM south_snapshot_test")
+        self.assertEqual(cursor.fetchall(), [(u"\xe9t\xe9",)])
+        empty.close()